@@ -0,0 +1,31 @@
+# benchmarks/bench_collision.py
+from benchmarks.harness import benchmark
+from benchmarks.fixtures import CELL, make_mine, make_player
+
+@benchmark("collision.move", number=5000, params={"mine": [10, 40, 120]})
+def move_through_mine(rng, mine):
+    """Player walking back and forth along a corridor cut through a mine x mine block field."""
+    corridor = mine // 2
+    grid = make_mine(rng, mine, mine, corridor_row=corridor)
+    player = make_player(res=(mine * CELL, mine * CELL))
+    player.position = (0, corridor * CELL)
+    state = {"dx": 4.0}
+
+    def step():
+        x = player.position[0]
+        player.move(state["dx"], 0, grid)
+        if player.position[0] == x:      # hit the wall: turn around
+            state["dx"] = -state["dx"]
+    return step
+
+@benchmark("collision.blocked", number=5000, params={"mine": [10, 40, 120]})
+def move_into_blocks(rng, mine):
+    """Every move is rejected by a collision (the worst case for the candidate scan)."""
+    corridor = mine // 2
+    grid = make_mine(rng, mine, mine, corridor_row=corridor)
+    player = make_player(res=(mine * CELL, mine * CELL))
+    player.position = (CELL * (mine // 2), corridor * CELL)
+
+    def step():
+        player.move(0, 10, grid)
+    return step
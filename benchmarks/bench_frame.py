@@ -0,0 +1,51 @@
+# benchmarks/bench_frame.py
+"""Whole-frame costs: one simulation tick and one rendered frame of the C mine."""
+from benchmarks.harness import benchmark, init_display
+from headless import HeadlessGame
+from ui.shop import ShopUI
+from ui.chat import ChatUI
+from ui.notifications import NotificationManager
+
+@benchmark("frame.simulate", number=3000)
+def simulate_tick(rng):
+    """HeadlessGame.tick in the mine: walking plus a click every 6th tick."""
+    game = HeadlessGame()
+    game.tick(commands=["/scene c_mine"])
+    keys = ["d"]
+    state = {"t": 0}
+
+    def step():
+        t = state["t"]
+        state["t"] += 1
+        if t % 30 == 0:
+            keys[:] = rng.sample(["w", "a", "s", "d"], rng.randint(0, 2))
+        clicks = [(rng.randrange(0, 1300), rng.randrange(0, 700))] if t % 6 == 0 else ()
+        game.tick(keys, clicks)
+    return step
+
+@benchmark("frame.render", number=500, params={"ui": [False, True]})
+def render_frame(rng, ui):
+    """Mirror of main.render for the mine scene; ui=True adds open chat, bubbles and the shop dialog."""
+    screen = init_display()
+    game = HeadlessGame()
+    game.tick(commands=["/scene c_mine"])
+    player = game.player
+    notifier = NotificationManager(anchor="top-center")
+    chat = ChatUI(10, 400, 400, 290)
+    shop_ui = ShopUI()
+    if ui:
+        for i in range(200):
+            chat.add_message("Player", f"message {i} " * rng.randint(1, 6))
+        chat.open_chat()
+        for i in range(4):
+            notifier.push(f"Notification {i}", duration=3600)
+        shop_ui.open(next(iter(game.shop_manager.shops.values())))
+
+    def step():
+        screen.fill((75, 75, 75))
+        screen.fill((255, 0, 0), (*map(int, player.position), 50, 50))
+        game.scene_mgr.current.draw(screen, player)
+        notifier.draw(screen)
+        shop_ui.draw(screen)
+        chat.draw(screen)
+    return step
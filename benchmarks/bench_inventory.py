@@ -0,0 +1,57 @@
+# benchmarks/bench_inventory.py
+from benchmarks.harness import benchmark
+from classes.items.item import Item
+from classes.items.materials import Materials
+from classes.player.inventory import PlayerInventory
+
+def _materials():
+    return sorted(Materials, key=lambda m: m.id)
+
+@benchmark("inventory.add_remove", number=20000, params={"slots": [36, 1000], "kinds": [2, 7]})
+def add_remove(rng, slots, kinds):
+    """Random single-stack adds and removes on an inventory kept about half full."""
+    mats = _materials()[:kinds]
+    inv = PlayerInventory(slots, 64)
+    for _ in range(slots * 16):
+        inv.add_item(Item(rng.choice(mats), rng.randint(1, 64)))
+    ops = [(rng.random() < 0.5, rng.choice(mats), rng.randint(1, 64)) for _ in range(4096)]
+    state = {"i": 0}
+
+    def step():
+        add, mat, qty = ops[state["i"] & 4095]
+        state["i"] += 1
+        if add:
+            inv.add_item(Item(mat, qty))
+        else:
+            inv.remove_item(Item(mat, qty))
+    return step
+
+@benchmark("inventory.has_item", number=50000, params={"slots": [36, 1000]})
+def has_item(rng, slots):
+    mats = _materials()
+    inv = PlayerInventory(slots, 64)
+    for _ in range(slots):
+        inv.add_item(Item(rng.choice(mats), rng.randint(1, 64)))
+    probes = [Item(rng.choice(mats), rng.randint(1, 500)) for _ in range(1024)]
+    state = {"i": 0}
+
+    def step():
+        inv.has_item(probes[state["i"] & 1023])
+        state["i"] += 1
+    return step
+
+@benchmark("inventory.apply", number=5000, params={"slots": [36, 1000]})
+def apply_basket(rng, slots):
+    """Five-line mixed basket (the shop/mining transaction), applied and then reverted."""
+    mats = _materials()
+    inv = PlayerInventory(slots, 64)
+    for _ in range(slots // 2):
+        inv.add_item(Item(rng.choice(mats), 64))
+    basket = [(rng.choice(mats), rng.choice([-1, 1]) * rng.randint(1, 32)) for _ in range(5)]
+    undo = [(mat, -delta) for mat, delta in basket]
+
+    def step():
+        ok, _ = inv.apply(basket)
+        if ok:
+            inv.apply(undo)
+    return step
@@ -0,0 +1,45 @@
+# benchmarks/bench_mining.py
+from benchmarks.harness import benchmark
+from benchmarks.fixtures import CELL, NullNotifier, load_config, make_mine, make_player, random_block
+from systems.mining import MiningSystem
+
+class _Scene:
+    def __init__(self, cubes):
+        self.cubes = cubes
+
+class _SceneManager:
+    """Just what MiningSystem needs from SceneManager."""
+    def __init__(self, cubes):
+        self.current = _Scene(cubes)
+
+    def cubes(self):
+        return self.current.cubes
+
+@benchmark("mining.try_mine_now", number=2000, params={"mine": [20, 60]})
+def mine_blocks(rng, mine):
+    """Mine every block of a mine x mine field in random order, standing next to each one."""
+    config = load_config()
+    grid = make_mine(rng, mine, mine)
+    targets = [(b.rect.x, b.rect.y) for b in grid]
+    rng.shuffle(targets)
+    scene_mgr = _SceneManager(grid)
+    player = make_player(res=(mine * CELL, mine * CELL), config=config)
+    clock = {"ms": 0}
+    mining = MiningSystem(config, NullNotifier(), time_source=lambda: clock["ms"])
+    cooldown = config.mines.click_cooldown_ms
+    state = {"i": 0}
+
+    def step():
+        i = state["i"]
+        if i == len(targets):                      # field exhausted: refill
+            for x, y in targets:
+                grid.append(random_block(rng, x, y))
+            state["i"] = i = 0
+        if not player.inventory.free_slots():
+            player.inventory.clear()
+        x, y = targets[i]
+        player.position = (x, y)
+        clock["ms"] += cooldown
+        mining.mine_at(player, scene_mgr, (x + 1, y + 1))
+        state["i"] = i + 1
+    return step
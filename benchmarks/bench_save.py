@@ -0,0 +1,42 @@
+# benchmarks/bench_save.py
+from benchmarks.harness import benchmark
+from benchmarks.fixtures import make_player
+from classes.items.item import Item
+from classes.items.materials import Materials
+from classes.player.inventory import PlayerInventory
+from systems.save import ProfileSnapshot, encode, decode
+
+def _player(rng, slots):
+    player = make_player()
+    player.inventory = PlayerInventory(slots, 64)
+    for _ in range(slots):
+        player.inventory.add_item(Item(rng.choice(Materials), rng.randint(1, 64)))
+    player.money = rng.randint(0, 10 ** 9)
+    return player
+
+@benchmark("save.capture", number=20000, params={"slots": [36, 1000], "changed": [False, True]})
+def capture(rng, slots, changed):
+    """Main-thread cost of an autosave; changed=True edits the inventory before every capture."""
+    player = _player(rng, slots)
+    mat = rng.choice(Materials)
+    state = {"snap": ProfileSnapshot.capture(player), "add": True}
+
+    def step():
+        if changed:
+            if state["add"]:
+                player.inventory.add_item(Item(mat, 1))
+            else:
+                player.inventory.remove_item(Item(mat, 1))
+            state["add"] = not state["add"]
+        state["snap"] = ProfileSnapshot.capture(player, state["snap"])
+    return step
+
+@benchmark("save.encode", number=2000, params={"slots": [36, 1000]})
+def encode_profile(rng, slots):
+    snap = ProfileSnapshot.capture(_player(rng, slots))
+    return lambda: encode(snap)
+
+@benchmark("save.decode", number=2000, params={"slots": [36, 1000]})
+def decode_profile(rng, slots):
+    data = encode(ProfileSnapshot.capture(_player(rng, slots)))
+    return lambda: decode(data)
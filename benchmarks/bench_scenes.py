@@ -0,0 +1,49 @@
+# benchmarks/bench_scenes.py
+from benchmarks.harness import benchmark, init_display
+from benchmarks.fixtures import make_player, make_shop_manager
+from rooms.scene_manager import SceneManager
+from classes.items.materials import STONE, RAW_IRON, RAW_GOLD, RAW_DIAMOND
+from systems.mine_generator import MineParams, generate_grid
+
+class _ShopUIStub:
+    visible = False
+    def open(self, shop): pass
+    def close(self): pass
+
+SCENES = ["hub", "furnace_room", "c_hub", "c_mine", "c_shop", "b_mine"]
+
+@benchmark("scene.load", number=20, params={"scene": SCENES})
+def scene_load(rng, scene):
+    mgr = SceneManager(make_shop_manager(), _ShopUIStub())
+    target = mgr.get(scene)
+    return target.load
+
+@benchmark("scene.draw", number=500, params={"scene": ["c_hub", "c_mine"], "mining": [False, True]})
+def scene_draw(rng, scene, mining):
+    """Steady-state scene draw; with mining=True one block disappears per frame (dirty repaint)."""
+    screen = init_display()
+    mgr = SceneManager(make_shop_manager(), _ShopUIStub())
+    target = mgr.get(scene)
+    player = make_player(screen.get_size())
+    blocks = [b for b in target.cubes if not b.item.metadata.get("indestructable")]
+    rng.shuffle(blocks)
+    target.draw(screen, player)
+    state = {"i": 0}
+
+    def step():
+        if mining and blocks:
+            b = blocks[state["i"] % len(blocks)]
+            state["i"] += 1
+            if b in target.cubes:
+                target.cubes.remove(b)
+            else:
+                target.cubes.append(b)
+        target.draw(screen, player)
+    return step
+
+@benchmark("mine.generate", number=50, params={"size": [20, 200]})
+def mine_generate(rng, size):
+    """Ore grid generation alone (no disk cache), size x size cells."""
+    params = MineParams(size, size, ((STONE, 10), (RAW_IRON, 0.5), (RAW_GOLD, 0.2), (RAW_DIAMOND, 0.1)))
+    seeds = iter(range(10**9))
+    return lambda: generate_grid(next(seeds), params)
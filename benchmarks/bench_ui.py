@@ -0,0 +1,107 @@
+# benchmarks/bench_ui.py
+"""Per-frame draw cost of the overlay UIs, each onto a full-size frame."""
+from benchmarks.harness import benchmark, init_display
+from benchmarks.fixtures import make_shop_manager
+from ui.shop import ShopUI
+from ui.chat import ChatUI
+from ui.notifications import NotificationManager
+from ui.debug import DebugOverlay
+from ui.fonts import get_font
+from systems.profiler import Profiler
+
+WORDS = "pick stone iron gold diamond mine shop sell rank up hello gg anyone trade lag".split()
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+@benchmark("ui.shop.draw", number=2000, params={"scroll": [False, True]})
+def shop_draw(rng, scroll):
+    """Open shop dialog; with scroll=True the wheel moves every frame, forcing a re-render."""
+    screen = init_display()
+    shop = next(iter(make_shop_manager().shops.values()))
+    ui = ShopUI()
+    ui.open(shop)
+    state = {"dir": 1}
+
+    def step():
+        if scroll:
+            before = ui.scroll_offset
+            ui.handle_scroll(state["dir"])
+            if ui.scroll_offset == before:
+                state["dir"] = -state["dir"]
+                ui.handle_scroll(state["dir"])
+        ui.draw(screen)
+    return step
+
+@benchmark("ui.chat.draw", number=2000, params={"history": [50, 2000], "incoming": [False, True]})
+def chat_draw(rng, history, incoming):
+    """Open chat with `history` messages; with incoming=True a new message arrives every frame."""
+    screen = init_display()
+    chat = ChatUI(10, 400, 400, 290, max_messages=2000)
+    for i in range(history):
+        chat.add_message(f"Player{rng.randint(1, 50)}", _sentence(rng, rng.randint(2, 30)))
+    chat.open_chat()
+    lines = [_sentence(rng, rng.randint(2, 30)) for _ in range(256)]
+    state = {"i": 0}
+
+    def step():
+        if incoming:
+            chat.add_message("Player", lines[state["i"] & 255])
+            state["i"] += 1
+        chat.draw(screen)
+    return step
+
+@benchmark("ui.notifications.draw", number=2000, params={"live": [1, 8]})
+def notifications_draw(rng, live):
+    """`live` distinct bubbles on screen (fading is driven by pygame ticks)."""
+    screen = init_display()
+    notifier = NotificationManager(anchor="top-center")
+    for i in range(live):
+        notifier.push(f"{_sentence(rng, 6)} #{i}", level=rng.choice(["info", "success", "warning", "error"]), duration=3600)
+
+    def step():
+        notifier.draw(screen)
+    return step
+
+@benchmark("ui.notifications.push", number=2000)
+def notifications_push(rng):
+    """Mining spam: repeated identical pushes coalesce into one bubble."""
+    init_display()
+    notifier = NotificationManager(anchor="top-center")
+
+    def step():
+        notifier.push("Picked up Stone x1", "success")
+    return step
+
+@benchmark("ui.debug.draw", number=2000, params={"profiler": [False, True]})
+def debug_draw(rng, profiler):
+    """F3 overlay with main.py's providers (values change every call) and optionally the profiler."""
+    screen = init_display()
+    prof = Profiler() if profiler else None
+    clock = {"ms": 0, "frame": 0}
+    debug = DebugOverlay(font=get_font(None, 18), profiler=prof, time_source=lambda: clock["ms"])
+    debug.add_static("PrisonXD v0.2")
+    ranks = ["C", "B", "A", "Elitas", "Laisvas"]
+    providers = [
+        (lambda: {"FPS": f"{60 + rng.random():.1f}", "Frame": f"{rng.randint(5, 9)} ms"}, 250),
+        (lambda: {"Player": f"({clock['frame'] % 1300}, 335)"}, 100),
+        (lambda: {"Scene": "c_mines", "Blocks": 500 - clock["frame"] % 50}, 250),
+        (lambda: {"Mouse": f"({clock['frame'] % 26 * 50}, 300)"}, 100),
+        (lambda: {"Rank": "C ($0)"}, 500),
+        (lambda: {"Ranks": " > ".join(ranks)}, 5000),
+    ]
+    for fn, interval in providers:
+        debug.add_provider(fn, interval_ms=interval)
+    debug.toggle()
+
+    def step():
+        clock["frame"] += 1
+        clock["ms"] += 16
+        if prof is not None:
+            prof.begin_frame()
+            with prof.section("scene"):
+                pass
+        debug.draw(screen)
+        if prof is not None:
+            prof.end_frame()
+    return step
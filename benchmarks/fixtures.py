@@ -0,0 +1,38 @@
+# benchmarks/fixtures.py
+"""Shared, seeded game state for the benchmarks."""
+import random
+
+from classes.items.item import Item
+from classes.items.materials import STONE, RAW_IRON, RAW_GOLD, RAW_DIAMOND
+from mine import Block, BlockGrid
+from systems.config import Config, config_store
+from tests.fixtures import make_player, make_shop_manager  # noqa: F401  (shared with the tests)
+
+CELL = 50
+ORES = [STONE, RAW_IRON, RAW_GOLD, RAW_DIAMOND]
+ORE_WEIGHTS = [10, 0.5, 0.2, 0.1]   # same odds as the C mine
+
+def load_config() -> Config:
+    return config_store.current
+
+def random_block(rng: random.Random, x: int, y: int) -> Block:
+    mat = rng.choices(ORES, weights=ORE_WEIGHTS, k=1)[0]
+    return Block(x, y, CELL, CELL, Item(mat, 1))
+
+def make_mine(rng: random.Random, cols: int, rows: int, corridor_row: int = None) -> BlockGrid:
+    """cols x rows solid mine of random ores; corridor_row (if given) is left empty."""
+    grid = BlockGrid(CELL)
+    for cy in range(rows):
+        if cy == corridor_row:
+            continue
+        for cx in range(cols):
+            grid.append(random_block(rng, cx * CELL, cy * CELL))
+    return grid
+
+class NullNotifier:
+    """Notifier/chat sink so UI cost doesn't leak into logic benchmarks."""
+    def push(self, text, level="info", duration=None):
+        pass
+
+    def add_message(self, username, message, color=(255, 255, 255)):
+        pass
@@ -0,0 +1,131 @@
+# benchmarks/harness.py
+"""
+Tiny benchmark harness: a registry, a timer and JSON output.
+
+A benchmark is a setup function registered with @benchmark. It receives a seeded
+random.Random (the global `random` is seeded too, since mines roll ores with it) plus its
+params, builds whatever state it needs and returns a zero-argument callable. Only that
+callable is timed: `number` calls per round, `repeat` rounds, reported per call.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import gc
+import itertools
+import platform
+import random
+import statistics
+import subprocess
+import time
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+SCREEN_SIZE = (1300, 700)
+
+class Benchmark:
+    def __init__(self, name: str, setup: Callable, params: Dict, number: int, repeat: int):
+        self.name = name
+        self.setup = setup
+        self.params = params
+        self.number = number
+        self.repeat = repeat
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+def benchmark(name: str, *, number: int = 1000, repeat: int = 5, params: Optional[Dict[str, list]] = None):
+    """
+    Register a setup function. With params={"mine": [10, 40]} one benchmark is registered
+    per combination, named e.g. "collision.move[mine=10]".
+    """
+    def decorator(setup):
+        grid = params or {}
+        keys = list(grid)
+        for values in itertools.product(*(grid[k] for k in keys)):
+            combo = dict(zip(keys, values))
+            suffix = ",".join(f"{k}={v}" for k, v in combo.items())
+            full = f"{name}[{suffix}]" if suffix else name
+            BENCHMARKS[full] = Benchmark(full, setup, combo, number, repeat)
+        return setup
+    return decorator
+
+def init_display() -> pygame.Surface:
+    """UI code converts surfaces, so give it a (dummy) display to convert against."""
+    pygame.init()
+    screen = pygame.display.get_surface()
+    if screen is None:
+        screen = pygame.display.set_mode(SCREEN_SIZE)
+    return screen
+
+def run_benchmark(bench: Benchmark, seed: int, number: int = None, repeat: int = None) -> dict:
+    number = number or bench.number
+    repeat = repeat or bench.repeat
+    per_call = []
+    for round_ in range(repeat):
+        random.seed(seed)
+        step = bench.setup(random.Random(seed), **bench.params)
+
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            for _ in range(number):
+                step()
+            elapsed = time.perf_counter() - started
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        per_call.append(elapsed / number * 1e6)
+
+    median = statistics.median(per_call)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "params": bench.params,
+        "us_per_call": {
+            "min": round(min(per_call), 3),
+            "median": round(median, 3),
+            "mean": round(statistics.fmean(per_call), 3),
+            "stdev": round(statistics.stdev(per_call), 3) if len(per_call) > 1 else 0.0,
+        },
+        "calls_per_s": round(1e6 / median, 1) if median else None,
+    }
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def metadata(seed: int) -> dict:
+    return {
+        "seed": seed,
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+def select(patterns: List[str]) -> List[Benchmark]:
+    """Benchmarks whose name contains any of the patterns (all when empty)."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    return [b for name, b in BENCHMARKS.items() if any(p in name for p in patterns)]
+
+def compare(old: dict, new: dict, threshold: float) -> List[tuple]:
+    """Rows of (name, old_median, new_median, change) and whether change exceeds threshold (a fraction)."""
+    rows = []
+    for name, result in new["results"].items():
+        before = old.get("results", {}).get(name)
+        if not before:
+            continue
+        a = before["us_per_call"]["median"]
+        b = result["us_per_call"]["median"]
+        change = (b - a) / a if a else 0.0
+        rows.append((name, a, b, change, change > threshold))
+    return rows
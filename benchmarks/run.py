@@ -0,0 +1,69 @@
+# benchmarks/run.py
+"""
+Run the benchmark suite and write JSON results.
+
+    python -m benchmarks.run                          # everything, results to stdout
+    python -m benchmarks.run -o before.json
+    python -m benchmarks.run collision ui.chat -o after.json --compare before.json
+    python -m benchmarks.run --list
+
+Run from the repository root (scenes and the player read config.ini from there).
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import harness
+# importing a module registers its benchmarks
+from benchmarks import bench_collision, bench_mining, bench_inventory, bench_ui, bench_scenes, bench_frame, bench_save  # noqa: F401
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PrisonXD benchmarks")
+    parser.add_argument("filter", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("-o", "--output", help="write JSON results here (default: stdout)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--number", type=int, help="override calls per round")
+    parser.add_argument("--repeat", type=int, help="override rounds per benchmark")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent (default 10)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    selected = harness.select(args.filter)
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+    if not selected:
+        print("No benchmarks match.", file=sys.stderr)
+        return 2
+
+    results = {}
+    for bench in selected:
+        print(f"{bench.name} ...", end=" ", file=sys.stderr, flush=True)
+        results[bench.name] = harness.run_benchmark(bench, args.seed, args.number, args.repeat)
+        print(f"{results[bench.name]['us_per_call']['median']:.2f} us", file=sys.stderr)
+
+    report = {"meta": harness.metadata(args.seed), "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = harness.compare(baseline, report, args.threshold / 100.0)
+        regressed = False
+        print(f"\n{'benchmark':<48} {'before us':>10} {'after us':>10} {'change':>8}", file=sys.stderr)
+        for name, before, after, change, flagged in rows:
+            regressed |= flagged
+            mark = "  REGRESSION" if flagged else ""
+            print(f"{name:<48} {before:>10.2f} {after:>10.2f} {change:>+8.1%}{mark}", file=sys.stderr)
+        return 1 if regressed else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Any
-from configparser import ConfigParser
+from systems.config import Config
 
 from classes.player.main import Player
 from classes.shop import ShopManager
@@ -19,7 +19,7 @@ class CommandContext:
     chat: ChatUI
     shop_ui: ShopUI = None
     shop_mgr: ShopManager = None
-    config: ConfigParser = None
+    config: Config = None
 
 class CommandRegistry:
     def __init__(self):
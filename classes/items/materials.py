@@ -24,7 +24,33 @@ Materials: list = [
     GRASS,
     STONE,
     WOOD,
+    RAW_IRON,
+    RAW_GOLD,
+    RAW_DIAMOND,
     IRON,
     GOLD,
-    DIAMOND
-]
\ No newline at end of file
+    DIAMOND,
+    BEDROCK,
+]
+
+# Case-insensitive O(1) lookup over Materials, by id and by display name
+_by_id: dict = {}
+_by_name: dict = {}
+
+def register_material(material: Material):
+    if material not in Materials:
+        Materials.append(material)
+    _by_id[material.id.lower()] = material
+    _by_name[material.name.lower()] = material
+
+def get_material(material_id: str):
+    """Material with this id (any case), or None."""
+    return _by_id.get(material_id.lower())
+
+def find_material(key: str):
+    """Material matching an id or a display name (any case), or None."""
+    key = key.lower()
+    return _by_id.get(key) or _by_name.get(key)
+
+for _mat in Materials:
+    register_material(_mat)
\ No newline at end of file
@@ -1,11 +1,13 @@
+import heapq
+
 from classes.items.item import Item
-from configparser import ConfigParser
 
 class PlayerSlot():
     def __init__(self, index: int, slot_size: int = 64):
         self.index = index
         self.item: Item = None
         self.slot_size = slot_size
+        self.version = 0  # bumped on every change so UIs can redraw just this slot
 
     def is_empty(self):
         return self.item is None
@@ -16,6 +18,7 @@ class PlayerSlot():
         return False
     
     def add_item(self, item: Item):
+        self.version += 1
         if self.is_empty():
             # Make sure we don't exceed slot size
             if item.quantity > self.slot_size:
@@ -38,6 +41,7 @@ class PlayerSlot():
     
     def remove_item(self, item: Item):
         if self.item and self.item.material.id == item.material.id:
+            self.version += 1
             if self.item.quantity >= item.quantity:
                 self.item.quantity -= item.quantity
                 if self.item.quantity == 0:
@@ -50,58 +54,269 @@ class PlayerSlot():
                 return False, item
         return False, item
     
+    def clear(self):
+        if self.item is not None:
+            self.item = None
+            self.version += 1
+
+    def set_contents(self, material, quantity: int):
+        """Overwrite the slot with `quantity` of `material` (0 empties it)."""
+        if quantity <= 0:
+            self.clear()
+            return
+        if self.item is not None and self.item.material.id == material.id:
+            self.item.quantity = quantity
+        else:
+            self.item = Item(material, quantity, {})
+        self.version += 1
+
     def get_item(self):
         return self.item if self.item else None
 
 class PlayerInventory:
+    """
+    Slot-based inventory with per-material indexes kept in sync on every slot mutation:
+      _totals[id]  -> total quantity held
+      _holding[id] -> slot indexes holding that material
+      _room[id]    -> subset of _holding that still has room to stack
+      _free        -> min-heap of empty slot indexes (lazily pruned; each index at most
+                      once, tracked by _queued, so it never outgrows the slot count)
+    so has_item/count are O(1) and add/remove only touch slots of that material.
+    All slot changes must go through these methods to keep the indexes valid.
+    """
     def __init__(self, slot_count: int = 10, slot_size: int = 64):
         self.slots = [PlayerSlot(i, slot_size) for i in range(slot_count)]
+        self.version = 0  # bumped whenever any slot changes (see PlayerSlot.version)
+        self._totals: dict[str, int] = {}
+        self._holding: dict[str, set[int]] = {}
+        self._room: dict[str, set[int]] = {}
+        self._free: list[int] = list(range(slot_count))  # already a valid heap
+        self._queued: set[int] = set(self._free)
+
+    # ---- index maintenance ----
+
+    def _snapshot(self, slot: PlayerSlot):
+        return (slot.item.material.id, slot.item.quantity) if slot.item else (None, 0)
+
+    def _sync(self, slot: PlayerSlot, before):
+        """Update the indexes for one slot given its (material_id, quantity) before a mutation."""
+        old_id, old_qty = before
+        new_id, new_qty = self._snapshot(slot)
+        idx = slot.index
+
+        if old_id is not None:
+            self._totals[old_id] -= old_qty
+            if old_id != new_id:
+                self._holding[old_id].discard(idx)
+                self._room[old_id].discard(idx)
+                if not self._totals[old_id]:
+                    del self._totals[old_id], self._holding[old_id], self._room[old_id]
+
+        if new_id is None:
+            if old_id is not None and idx not in self._queued:
+                heapq.heappush(self._free, idx)
+                self._queued.add(idx)
+        else:
+            self._totals[new_id] = self._totals.get(new_id, 0) + new_qty
+            self._holding.setdefault(new_id, set()).add(idx)
+            room = self._room.setdefault(new_id, set())
+            if slot.is_full():
+                room.discard(idx)
+            else:
+                room.add(idx)
+        self.version += 1
+
+    def _pop_free(self):
+        """Lowest empty slot, or None."""
+        while self._free:
+            idx = heapq.heappop(self._free)
+            self._queued.discard(idx)
+            if self.slots[idx].is_empty():
+                return self.slots[idx]
+        return None
+
+    # ---- queries ----
+
+    def count(self, material_id: str) -> int:
+        return self._totals.get(material_id, 0)
+
+    def free_slots(self) -> int:
+        return sum(1 for i in self._free if self.slots[i].is_empty())
+
+    # ---- mutations ----
 
     def add_item(self, item: Item):
-        for slot in self.slots:
-            if slot.is_empty() or (slot.item.material.id == item.material.id and not slot.is_full()):
-                success, remaining_item = slot.add_item(item)
-                if success:
-                    return True, item
-                else:
-                    item = remaining_item
-        return False, item
+        """Top up existing stacks of the material first, then fill empty slots (lowest index first)."""
+        mid = item.material.id
+        for idx in sorted(self._room.get(mid, ())):
+            slot = self.slots[idx]
+            before = self._snapshot(slot)
+            success, item = slot.add_item(item)
+            self._sync(slot, before)
+            if success:
+                return True, item
+
+        while True:
+            slot = self._pop_free()
+            if slot is None:
+                return False, item
+            before = self._snapshot(slot)
+            success, item = slot.add_item(item)
+            self._sync(slot, before)
+            if success:
+                return True, item
         
     def add_items(self, items: list[Item]):
-        added_items = []
-        for item in items:
-            success, added_item = self.add_item(item)
-            if success:
-                added_items.append(added_item)
-        return added_items
+        """Add all items or none of them; returns the items added."""
+        ok, _ = self.apply([(item.material, item.quantity) for item in items])
+        return list(items) if ok else []
+
+    def apply(self, changes):
+        """
+        Atomically apply [(material, delta), ...] (delta > 0 adds, < 0 removes).
+        Plans every slot change first; if anything is missing or doesn't fit, nothing is
+        touched. Returns (ok, reason).
+        """
+        # net change per material
+        net: dict[str, list] = {}
+        for material, delta in changes:
+            entry = net.setdefault(material.id, [material, 0])
+            entry[1] += delta
+
+        planned: dict[int, tuple] = {}   # slot index -> (material, new quantity)
+
+        def planned_qty(idx):
+            if idx in planned:
+                return planned[idx][1]
+            slot = self.slots[idx]
+            return slot.item.quantity if slot.item else 0
+
+        # removals, lowest slot first (same order as remove_item)
+        for mid, (material, delta) in net.items():
+            if delta >= 0:
+                continue
+            need = -delta
+            if self._totals.get(mid, 0) < need:
+                return False, f"Not enough {material.name}"
+            for idx in sorted(self._holding.get(mid, ())):
+                take = min(need, planned_qty(idx))
+                planned[idx] = (material, planned_qty(idx) - take)
+                need -= take
+                if not need:
+                    break
+
+        # additions: top up stacks of the material, then empty slots (lowest index first)
+        free = sorted(
+            {i for i in self._free if self.slots[i].is_empty()} |
+            {i for i, (_, q) in planned.items() if q == 0}
+        )
+        free_pos = 0
+        for mid, (material, delta) in net.items():
+            if delta <= 0:
+                continue
+            need = delta
+            for idx in sorted(self._holding.get(mid, ())):
+                qty = planned_qty(idx)
+                if qty == 0:
+                    continue   # emptied by a removal above, handed out via `free`
+                put = min(need, self.slots[idx].slot_size - qty)
+                if put > 0:
+                    planned[idx] = (material, qty + put)
+                    need -= put
+                if not need:
+                    break
+            while need and free_pos < len(free):
+                idx = free[free_pos]
+                free_pos += 1
+                put = min(need, self.slots[idx].slot_size)
+                planned[idx] = (material, put)
+                need -= put
+            if need:
+                return False, "Inventory full"
+
+        # commit
+        for idx, (material, qty) in planned.items():
+            slot = self.slots[idx]
+            before = self._snapshot(slot)
+            slot.set_contents(material, qty)
+            self._sync(slot, before)
+        return True, "OK"
 
     def remove_item(self, item: Item):
-        for slot in self.slots:
-            if not slot.is_empty() and slot.item.material.id == item.material.id:
-                success, remaining_item = slot.remove_item(item)
-                if success:
-                    return True, item
-                else:
-                    item = remaining_item
+        """Remove item.quantity of the material; nothing is removed if there isn't enough."""
+        mid = item.material.id
+        if self._totals.get(mid, 0) < item.quantity:
+            return False, item
+        for idx in sorted(self._holding.get(mid, ())):
+            slot = self.slots[idx]
+            before = self._snapshot(slot)
+            success, item = slot.remove_item(item)
+            self._sync(slot, before)
+            if success:
+                return True, item
         return False, item
 
+    def remove_all(self, material_ids=None):
+        """
+        Empty every slot holding one of material_ids (or every slot when None), touching
+        only those slots. Returns {material_id: (material, quantity_removed)}.
+        """
+        if material_ids is None:
+            indexes = [i for i, slot in enumerate(self.slots) if not slot.is_empty()]
+        else:
+            indexes = sorted(i for mid in material_ids for i in self._holding.get(mid, ()))
+
+        removed = {}
+        for idx in indexes:
+            slot = self.slots[idx]
+            mat = slot.item.material
+            _, qty = removed.get(mat.id, (mat, 0))
+            removed[mat.id] = (mat, qty + slot.item.quantity)
+            before = self._snapshot(slot)
+            slot.clear()
+            self._sync(slot, before)
+        return removed
+
     def has_item(self, item: Item):
-        total_quantity = 0
-        for slot in self.slots:
-            if not slot.is_empty() and slot.item.material.id == item.material.id:
-                total_quantity += slot.item.quantity
-                if total_quantity >= item.quantity:
-                    return True
-        return False
+        return self._totals.get(item.material.id, 0) >= item.quantity
     
     def clear(self):
         items_cleared = []
         for slot in self.slots:
             if not slot.is_empty():
                 items_cleared.append(slot.item)
-            slot.item = None
+            slot.clear()
+        self._totals.clear()
+        self._holding.clear()
+        self._room.clear()
+        self._free = list(range(len(self.slots)))
+        self._queued = set(self._free)
+        self.version += 1
         return items_cleared
 
+    def restore(self, contents):
+        """
+        Replace everything with [(slot_index, material, quantity), ...] (a loaded save).
+        Entries whose slot is out of range or taken are added like a pickup; returns what
+        didn't fit.
+        """
+        self.clear()
+        overflow = []
+        for idx, material, qty in contents:
+            if 0 <= idx < len(self.slots) and self.slots[idx].is_empty() and qty <= self.slots[idx].slot_size:
+                slot = self.slots[idx]
+                before = self._snapshot(slot)
+                slot.set_contents(material, qty)
+                self._sync(slot, before)
+            else:
+                overflow.append(Item(material, qty, {}))
+        leftover = []
+        for item in overflow:
+            ok, rest = self.add_item(item)
+            if not ok:
+                leftover.append(rest)
+        return leftover
+
     def get_item(self, slot_index:int):
         return self.slots[slot_index].item
     
@@ -2,29 +2,30 @@ from classes.player.inventory import PlayerInventory
 from classes.player.stats import Stats
 from classes.player.ranks import RankManager, Rank
 from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_DOWN, K_a, K_d, K_w, K_s
-from configparser import ConfigParser
+from systems.config import Config, Settings
+from ui.fonts import get_font, render_text
 
 import math
 
 class Player:
-    def __init__(self, res, config: ConfigParser, settings: ConfigParser, rank_manager: RankManager):
+    def __init__(self, res, config: Config, settings: Settings, rank_manager: RankManager):
 
         self.rank_manager = rank_manager
-        self.rank: Rank = rank_manager.get(config.get('game.player', 'default_rank', fallback="c"))
+        self.rank: Rank = rank_manager.get(config.player.default_rank)
 
-        self.config = config
-        self.settings = settings
-
-        self.walk_speed = config.getint('game.player', 'walk_speed', fallback=1) * 250
-
-        self.slots = config.getint('game.player.inventory', 'slot_columns', fallback=9) * config.getint('game.player.inventory', 'slot_rows', fallback=4)
-        self.inventory = PlayerInventory(self.slots, config.getint('game.player.inventory', 'slot_size', fallback=64))
+        # the inventory's shape is fixed at construction; apply_config() leaves it alone
+        self.inventory_shape = (config.inventory.slot_rows, config.inventory.slot_columns)
+        self.slots = config.inventory.slot_columns * config.inventory.slot_rows
+        self.inventory = PlayerInventory(self.slots, config.inventory.slot_size)
+        self.apply_config(config, settings)
 
         self.position = (100, 100)
+        self.prev_position = self.position   # position at the start of the current sim tick
         self.res = res
 
         self.inventory_open = False
         self._inventory_surface = None
+        self._tooltip_cache = {}
 
         self.money = 0
         self.gems = 0
@@ -32,6 +33,12 @@ class Player:
         self.stats = Stats()
 
 
+    def apply_config(self, config: Config, settings: Settings = None):
+        """Take a (reloaded) config snapshot: walk speed; the inventory keeps its size."""
+        self.config = config
+        self.settings = settings if settings is not None else config.settings
+        self.walk_speed = config.player.walk_speed * 250
+
     def moveHandler(self, keys, dt, obstacles=None):
         vx = float((keys[K_d] or keys[K_RIGHT]) - (keys[K_a] or keys[K_LEFT]))
         vy = float((keys[K_s] or keys[K_DOWN]) - (keys[K_w] or keys[K_UP]))
@@ -50,7 +57,9 @@ class Player:
         # Check collision with obstacles
         if obstacles:
             player_rect = (new_position[0], new_position[1], 50, 50)  # Assuming player is 50x50
-            for obstacle in obstacles:
+            # BlockGrid only hands back blocks in the cells the rect covers
+            candidates = obstacles.query(player_rect) if hasattr(obstacles, "query") else obstacles
+            for obstacle in candidates:
                 if self.check_collision(player_rect, obstacle):
                     return  # Don't move if collision detected
         
@@ -66,6 +75,14 @@ class Player:
         if self.position[1] > self.res[1] - 50:
             self.position = (self.position[0], self.res[1] - 50)
     
+    def render_position(self, alpha: float):
+        """Position interpolated between the last two sim ticks; teleports snap instead of sliding."""
+        x0, y0 = self.prev_position
+        x1, y1 = self.position
+        if abs(x1 - x0) > 100 or abs(y1 - y0) > 100:
+            return self.position
+        return (x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)
+
     def check_collision(self, rect1, obstacle):
         # rect format: (x, y, width, height)
         x1, y1, w1, h1 = rect1
@@ -80,25 +97,28 @@ class Player:
         else:
             self._inventory_surface = None
 
+    # --- inventory panel layout (px) ---
+    INV_SLOT = 56               # slot outer size
+    INV_GAP = 6                 # gap between slots
+    INV_PAD = 12                # padding inside container
+    INV_LABEL_H = 28
+    INV_BG = (35,35,35,235)
+
     def _build_inventory_surface(self):
         import pygame
-        # --- layout constants ---
-        ROWS, COLS = self.config.getint('game.player.inventory', 'slot_rows', fallback=4), self.config.getint('game.player.inventory', 'slot_columns', fallback=9)
-        SLOT = 56                 # slot outer size (px)
-        GAP  = 6                  # gap between slots
-        PAD  = 12                 # padding inside container
-        LABEL_H = 28
+        ROWS, COLS = self.inventory_shape
+        SLOT, GAP, PAD, LABEL_H = self.INV_SLOT, self.INV_GAP, self.INV_PAD, self.INV_LABEL_H
 
         w = PAD*2 + COLS*SLOT + (COLS-1)*GAP
         h = PAD*3 + LABEL_H + ROWS*SLOT + (ROWS-1)*GAP
 
         surf = pygame.Surface((w, h), pygame.SRCALPHA)
         # panel background
-        pygame.draw.rect(surf, (35,35,35,235), surf.get_rect(), border_radius=12)
+        pygame.draw.rect(surf, self.INV_BG, surf.get_rect(), border_radius=12)
 
         # title
-        font = pygame.font.Font(None, 28)
-        title = font.render("Inventory", True, (255,255,255))
+        font = get_font(None, 28)
+        title = render_text(font, "Inventory", (255,255,255))
         surf.blit(title, (PAD, PAD))
 
         # grid origin
@@ -106,48 +126,87 @@ class Player:
         grid_y = PAD*2 + LABEL_H
 
         # slot rects (ui-local) cached for hover
-        self._inv_slot_rects = []   # list of pygame.Rect
-        self._inv_slot_items = []   # parallel list of items (or None)
+        self._inv_slot_rects = []     # list of pygame.Rect
+        self._inv_slot_items = []     # parallel list of items (or None)
+        self._inv_slot_versions = []  # PlayerSlot.version each slot was drawn at
 
-        # draw slots
         for r in range(ROWS):
             for c in range(COLS):
-                idx = r*COLS + c
                 x = grid_x + c*(SLOT+GAP)
                 y = grid_y + r*(SLOT+GAP)
-                rect = pygame.Rect(x, y, SLOT, SLOT)
-
-                # slot background
-                pygame.draw.rect(surf, (50,50,50), rect, border_radius=8)
-                pygame.draw.rect(surf, (20,20,20), rect, width=2, border_radius=8)
+                self._inv_slot_rects.append(pygame.Rect(x, y, SLOT, SLOT))
+                self._inv_slot_items.append(None)
+                self._inv_slot_versions.append(None)
 
-                item = self.inventory.slots[idx].get_item()
-                self._inv_slot_rects.append(rect)
-                self._inv_slot_items.append(item)
+        # draw slots
+        for idx in range(len(self._inv_slot_rects)):
+            self._draw_inventory_slot(surf, idx)
+        self._inv_version = self.inventory.version
 
-                if item:
-                    # inner block rect
-                    inner = rect.inflate(-14, -14)
-                    # color from material
-                    color = getattr(item.material, "color", (200,200,200))
-                    pygame.draw.rect(surf, color, inner, border_radius=6)
-                    pygame.draw.rect(surf, (0,0,0), inner, width=2, border_radius=6)
+        return surf
 
-                    # quantity (bottom-right)
-                    q_font = pygame.font.Font(None, 24)
-                    qty_s = q_font.render(str(item.quantity), True, (255,255,255))
-                    surf.blit(qty_s, (rect.right - qty_s.get_width() - 6, rect.bottom - qty_s.get_height() - 4))
+    def _draw_inventory_slot(self, surf, idx):
+        import pygame
+        rect = self._inv_slot_rects[idx]
+        slot = self.inventory.slots[idx]
+
+        # wipe back to the panel background (slot corners are rounded)
+        surf.fill(self.INV_BG, rect)
+
+        # slot background
+        pygame.draw.rect(surf, (50,50,50), rect, border_radius=8)
+        pygame.draw.rect(surf, (20,20,20), rect, width=2, border_radius=8)
+
+        item = slot.get_item()
+        self._inv_slot_items[idx] = item
+        self._inv_slot_versions[idx] = slot.version
+
+        if item:
+            # inner block rect
+            inner = rect.inflate(-14, -14)
+            # color from material
+            color = getattr(item.material, "color", (200,200,200))
+            pygame.draw.rect(surf, color, inner, border_radius=6)
+            pygame.draw.rect(surf, (0,0,0), inner, width=2, border_radius=6)
+
+            # quantity (bottom-right)
+            qty_s = render_text(get_font(None, 24), str(item.quantity), (255,255,255))
+            surf.blit(qty_s, (rect.right - qty_s.get_width() - 6, rect.bottom - qty_s.get_height() - 4))
+
+    def _refresh_inventory_surface(self):
+        """Redraw only the slots whose PlayerSlot.version moved since they were drawn."""
+        if self._inventory_surface is None:
+            self._inventory_surface = self._build_inventory_surface()
+            return
+        if self._inv_version == self.inventory.version:
+            return
+        for idx, slot in enumerate(self.inventory.slots[:len(self._inv_slot_rects)]):
+            if slot.version != self._inv_slot_versions[idx]:
+                self._draw_inventory_slot(self._inventory_surface, idx)
+        self._inv_version = self.inventory.version
+
+    def _inventory_tooltip(self, name):
+        import pygame
+        tip = self._tooltip_cache.get(name)
+        if tip is None:
+            tip_font = get_font(None, 24)
+            text = render_text(tip_font, name, (255,255,255))
+            pad = 6
+            tip = pygame.Surface((text.get_width() + pad*2, text.get_height() + pad*2), pygame.SRCALPHA)
+            pygame.draw.rect(tip, (0,0,0,200), tip.get_rect(), border_radius=6)
+            tip.blit(text, (pad, pad))
+            self._tooltip_cache[name] = tip
+        return tip
 
-        return surf
-    
     def draw_inventory(self, screen, topleft=(440, 210)):
         """
         Call this each frame when inventory is open.
         Renders the grid and shows a tooltip with item name on hover.
+        The panel is cached; only slots that changed since the last frame are redrawn.
         """
         import pygame
-        # (Re)build the inventory surface & slot rects
-        inv_surface = self._build_inventory_surface()
+        self._refresh_inventory_surface()
+        inv_surface = self._inventory_surface
         inv_rect = inv_surface.get_rect(topleft=topleft)
 
         # draw the container
@@ -170,16 +229,9 @@ class Player:
                 break
 
         if hovered_item:
-            # build tooltip with item name
-            name = getattr(hovered_item.material, "name", "Unknown")
-            tip_font = pygame.font.Font(None, 24)
-            text = tip_font.render(name, True, (255,255,255))
-            pad = 6
-            tip_w = text.get_width() + pad*2
-            tip_h = text.get_height() + pad*2
-            tip = pygame.Surface((tip_w, tip_h), pygame.SRCALPHA)
-            pygame.draw.rect(tip, (0,0,0,200), tip.get_rect(), border_radius=6)
-            tip.blit(text, (pad, pad))
+            # tooltip with item name (cached per name)
+            tip = self._inventory_tooltip(getattr(hovered_item.material, "name", "Unknown"))
+            tip_w, tip_h = tip.get_size()
 
             # place tooltip above the hovered slot (clamp to screen)
             # slot rect in screen coords:
@@ -195,7 +247,7 @@ class Player:
             screen.blit(tip, (tx, ty))
 
     def rankup(self):
-        next_rank = self.rank_manager.next(self.rank.id)
+        next_rank = self.rank_manager.next_after(self.rank.id)
         if next_rank and self.money >= next_rank.price:
             self.money -= next_rank.price
             self.rank = next_rank
@@ -62,7 +62,7 @@ class RankManager:
         if getattr(player, "gems", 0) < nxt.req_gems:
             return False, f"Need {nxt.req_gems} gems to rank up.", nxt
         # blocks mined
-        blocks = player.stats.get("blocks_mined", 0) if hasattr(player, "stats") else 0
+        blocks = getattr(getattr(player, "stats", None), "blocks_mined", 0)
         if blocks < nxt.req_blocks:
             return False, f"Mine {nxt.req_blocks} blocks to rank up (you have {blocks}).", nxt
 
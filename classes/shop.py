@@ -1,6 +1,6 @@
 # shop.py
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from classes.items.materials import Material
 
@@ -17,6 +17,35 @@ class Shop:
         self.display_name = display_name
         self.items = items
         self.stock = {it.material.id: it.max_stock for it in items if it.max_stock >= 0}
+        self._by_material: Dict[str, ShopItem] = {it.material.id: it for it in items}
+        self.version = 0  # bumped on every change to items/prices/stock; UIs redraw when it moves
+
+    def touch(self):
+        """Mark the shop as changed (call after editing items or prices in place)."""
+        self.version += 1
+
+    def get_item(self, material_id: str) -> Optional[ShopItem]:
+        return self._by_material.get(material_id)
+
+    def add_item(self, item: ShopItem):
+        self.items.append(item)
+        self._by_material[item.material.id] = item
+        if item.max_stock >= 0:
+            self.stock[item.material.id] = item.max_stock
+        self.touch()
+
+    def remove_item(self, material_id: str):
+        self.items = [it for it in self.items if it.material.id != material_id]
+        self._by_material.pop(material_id, None)
+        self.stock.pop(material_id, None)
+        self.touch()
+
+    def adjust_stock(self, material_id: str, delta: int):
+        """Change tracked stock by delta (never below 0); untracked (unlimited) items are ignored."""
+        if material_id not in self.stock:
+            return
+        self.stock[material_id] = max(0, self.stock[material_id] + delta)
+        self.touch()
 
 class ShopManager:
     def __init__(self):
@@ -8,10 +8,12 @@ def cmd_help(ctx: CommandContext, args: List[str]):
         "/help",
         "/say <text>",
         "/money                - show balance",
+        "/rankup               - rank up if you can afford it",
         "/give <item_id> <n>   - add items",
         "/tp <x> <y>           - teleport player",
         "/scene <name>         - switch scene (hub|mine|shop)",
         "/shop                 - open shop (if in Shop scene)",
+        "/sellall [item_id]    - sell everything (or one item) to this shop",
         "/inv                  - toggle inventory",
         "/debug                - toggle F3 overlay",
     ]
@@ -30,18 +32,13 @@ def cmd_give(ctx: CommandContext, args: List[str]):
         raise ValueError("Usage: /give <item_id> <qty>")
     item_id = args[0]
     qty = int(args[1])
-    # Your factory:
-    from classes.items.item import Item
-    from classes.items.materials import Materials
-    mat = None
-    for material in Materials:
-        if material.name.upper() == item_id.upper() or material.id.upper() == item_id.upper():
-            mat = material
-            break
+    if qty <= 0:
+        raise ValueError("Quantity must be positive")
+    from classes.items.materials import find_material
+    mat = find_material(item_id)
     if not mat:
         raise ValueError(f"Unknown item '{item_id}'")
-    item = Item(mat, qty)
-    ok, _ = ctx.player.inventory.add_item(item)
+    ok, _ = ctx.player.inventory.apply([(mat, qty)])
     if ok:
         ctx.notifier.push(f"Gave {mat.name} x{qty}", level="success")
     else:
@@ -65,11 +62,31 @@ def cmd_scene(ctx: CommandContext, args: List[str]):
         ctx.notifier.push(str(e), level="error")
 
 def cmd_scenes(ctx: CommandContext, args: List[str]):
-    lines = [f"Available scenes: {', '.join(ctx.scene_mgr.scenes.keys())}"
+    lines = [f"Available scenes: {', '.join(ctx.scene_mgr.names())}"
     ]
     for ln in lines:
         ctx.chat.add_message("System", ln)
 
+def cmd_sellall(ctx: CommandContext, args: List[str]):
+    shop = getattr(ctx.scene_mgr.current, "shop", None) if ctx.scene_mgr.current else None
+    if not shop:
+        ctx.notifier.push("No shop here.", level="warning")
+        return
+    from helper import sell_all
+    from classes.items.materials import find_material
+    item_id = None
+    if args:
+        mat = find_material(" ".join(args))
+        if not mat:
+            raise ValueError(f"Unknown item '{' '.join(args)}'")
+        item_id = mat.id
+    sell_all(ctx.player, shop, ctx.notifier, item_id)
+
+def cmd_rankup(ctx: CommandContext, args: List[str]):
+    ok, msg = ctx.player.rank_manager.do_rank_up(ctx.player, ctx.notifier)
+    if not ok:
+        ctx.notifier.push(msg, level="warning")
+
 def cmd_shop(ctx: CommandContext, args: List[str]):
     if ctx.shop_ui and ctx.scene_mgr.current and getattr(ctx.scene_mgr.current, "shop", None):
         ctx.shop_ui.open(ctx.scene_mgr.current.shop, ctx.player)
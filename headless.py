@@ -0,0 +1,234 @@
+# headless.py
+"""
+Run the game logic without a window: movement, portals, mining, shop, ranks and commands
+are driven by injected input instead of pygame events, and nothing is drawn.
+
+    python headless.py --sessions 1000 --ticks 3600 --seed 1
+    python headless.py --script inputs.jsonl
+
+A script is JSON lines, one per tick: {"keys": ["d"], "clicks": [[300, 200]], "commands": ["/sellall"]}
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import random
+import time
+from collections import deque
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import pygame
+
+from classes.player.main import Player
+from classes.shop import ShopManager
+from classes.player.ranks import RankManager
+from classes.chat.commands.command_handler import CommandRegistry, CommandContext
+from rooms.scene_manager import SceneManager
+from systems.mining import MiningSystem
+from systems.mine_reset import MineResetScheduler
+from systems.config import config_store
+from init import GameInit
+
+KEY_NAMES = {
+    "w": pygame.K_w, "a": pygame.K_a, "s": pygame.K_s, "d": pygame.K_d,
+    "up": pygame.K_UP, "left": pygame.K_LEFT, "down": pygame.K_DOWN, "right": pygame.K_RIGHT,
+}
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed(): indexable by key code."""
+    def __init__(self, held: Iterable = ()):
+        self.held = {KEY_NAMES[k] if isinstance(k, str) else k for k in held}
+
+    def __getitem__(self, key):
+        return key in self.held
+
+class EventLog:
+    """Notifier + chat sink: keeps the last messages instead of rendering them."""
+    def __init__(self, maxlen: int = 200):
+        self.messages = deque(maxlen=maxlen)
+        self.count = 0
+        self.errors: List[str] = []   # error notifications and failed commands
+
+    def push(self, text: str, level: str = "info", duration: float = None):
+        self.messages.append((level, text))
+        self.count += 1
+        if level == "error":
+            self.errors.append(text)
+
+    def add_message(self, username, message, color=(255, 255, 255)):
+        self.messages.append((username, message))
+        self.count += 1
+        if message.startswith("Command error:"):
+            self.errors.append(message)
+
+class HeadlessShopUI:
+    """The parts of ShopUI that scenes touch, without any rendering."""
+    def __init__(self):
+        self.visible = False
+        self.shop = None
+
+    def open(self, shop, *args):
+        self.shop = shop
+        self.visible = True
+
+    def close(self):
+        self.visible = False
+        self.shop = None
+
+class HeadlessGame:
+    """One simulated session. Time advances only through tick()."""
+    def __init__(self, tick_rate: int = 60, config_path: str = "config.ini"):
+        # scenes read the shared store, so point it at the same file
+        self.config = config_store.load(config_path)
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.ticks = 0
+        self.rankups = 0
+        self.rankup_failures = 0      # affordable /rankup that left the rank unchanged
+
+        self.log = EventLog()
+        self.shop_ui = HeadlessShopUI()
+        self.shop_manager = ShopManager()
+        self.rank_manager = RankManager()
+        self.cmds = CommandRegistry()
+        GameInit(self.shop_manager, self.rank_manager, self.cmds)
+        # no background prefetch: scene builds stay on the tick thread so runs are reproducible
+        self.scene_mgr = SceneManager.from_config(self.shop_manager, self.shop_ui, self.config, prefetch=False)
+
+        self.player = Player(self.config.display.size, self.config, self.config.settings, self.rank_manager)
+        self.player.position = self.scene_mgr.current.spawn
+        self.mining = MiningSystem(self.config, self.log, time_source=self.now_ms)
+        self.mine_resets = MineResetScheduler(self.config, self.log, time_source=self.now_ms)
+        self.mine_resets.register_all(self.scene_mgr)
+
+    def now_ms(self) -> int:
+        return self.ticks * 1000 // self.tick_rate
+
+    def ctx(self) -> CommandContext:
+        return CommandContext(
+            player=self.player,
+            scene_mgr=self.scene_mgr,
+            notifier=self.log,
+            chat=self.log,
+            shop_ui=self.shop_ui,
+            shop_mgr=self.shop_manager,
+            config=self.config,
+        )
+
+    def tick(self, keys: Iterable = (), clicks: Sequence[Tuple[int, int]] = (), commands: Sequence[str] = ()):
+        """Advance one simulation step with the given input."""
+        self.player.prev_position = self.player.position
+        for raw in commands:
+            self.run_command(raw)
+        for pos in clicks:
+            self.mining.mine_at(self.player, self.scene_mgr, tuple(pos))
+
+        self.mine_resets.update(self.scene_mgr, self.player)
+
+        next_scene, next_spawn = self.scene_mgr.current.update(self.player)
+        if next_scene:
+            try:
+                self.scene_mgr.switch(next_scene, self.player, next_spawn)
+            except ValueError as e:
+                self.log.push(str(e), level="error")
+
+        self.player.moveHandler(KeyState(keys), self.dt, self.scene_mgr.cubes())
+        self.ticks += 1
+
+    def run_command(self, raw: str):
+        """
+        Run a chat command. A /rankup the player could afford that leaves the rank unchanged
+        is counted in rankup_failures and logged as an error; the session keeps going.
+        """
+        line = raw[1:] if raw.startswith("/") else raw
+        if line.split()[:1] != ["rankup"]:
+            self.cmds.run(self.ctx(), line)
+            return
+        p = self.player
+        nxt = self.rank_manager.next_after(p.rank.id) if p.rank else None
+        affordable = (nxt is not None and p.money >= nxt.price and p.gems >= nxt.req_gems
+                      and p.stats.blocks_mined >= nxt.req_blocks)
+        self.cmds.run(self.ctx(), line)
+        if not affordable:
+            return
+        if p.rank is nxt:
+            self.rankups += 1
+        else:
+            self.rankup_failures += 1
+            self.log.push(f"/rankup to {nxt.id} with ${p.money} left the rank at {p.rank.id}", level="error")
+
+    def run_script(self, frames: Iterable[dict]):
+        for frame in frames:
+            self.tick(frame.get("keys", ()), frame.get("clicks", ()), frame.get("commands", ()))
+
+    def summary(self) -> dict:
+        p = self.player
+        return {
+            "ticks": self.ticks,
+            "scene": self.scene_mgr.current.name,
+            "money": p.money,
+            "rank": p.rank.id if p.rank else None,
+            "rankups": self.rankups,
+            "rankup_failures": self.rankup_failures,
+            "blocks_mined": p.stats.blocks_mined,
+            "mine_resets": sum(m.resets for m in self.mine_resets.mines.values()),
+            "items": sum(item.quantity for item in p.inventory.get_items()),
+            "events": self.log.count,
+            "errors": len(self.log.errors),
+        }
+
+def bot_frames(rng: random.Random, ticks: int, tick_rate: int = 60):
+    """Random-walk miner: wanders, clicks around itself, cashes out and ranks up every 10s."""
+    keys: List[str] = []
+    for t in range(ticks):
+        if t % 30 == 0:
+            keys = rng.sample(["w", "a", "s", "d"], rng.randint(0, 2))
+        frame = {"keys": keys, "clicks": [], "commands": []}
+        if t % 6 == 0:
+            frame["clicks"].append((rng.randrange(0, 1300), rng.randrange(0, 700)))
+        if t == 0:
+            frame["commands"].append("/scene c_mine")
+        if t and t % (10 * tick_rate) == 0:
+            frame["commands"] += ["/scene c_shop", "/sellall", "/rankup", "/scene c_mine"]
+        yield frame
+
+def bot_session(seed: int, ticks: int, tick_rate: int = 60) -> dict:
+    """One full session driven by bot_frames. Same seed -> same result."""
+    # mines roll their ores with the global `random`; pin it before the scenes load
+    random.seed(seed)
+    game = HeadlessGame(tick_rate)
+    game.run_script(bot_frames(random.Random(seed), ticks, tick_rate))
+    return game.summary()
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run PrisonXD game logic without a display.")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=3600, help="ticks per session")
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", help="JSON-lines input file for a single session")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.script:
+        game = HeadlessGame(args.tick_rate)
+        with open(args.script, encoding="utf-8") as f:
+            game.run_script(json.loads(line) for line in f if line.strip())
+        results = [game.summary()]
+    else:
+        results = []
+        for i in range(args.sessions):
+            results.append(bot_session(args.seed + i, args.ticks, args.tick_rate))
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        "sessions": len(results),
+        "elapsed_s": round(elapsed, 3),
+        "sessions_per_min": round(len(results) / elapsed * 60, 1) if elapsed else None,
+        "results": results,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,14 @@ from classes.shop import *
 from classes.player.main import Player
 from classes.items.item import Item
 import classes.items.materials as materials_module
+from ui.fonts import get_font, render_text
 
 import pygame
+from functools import lru_cache
 
 # try to create an Item from an item_id (string like "dirt" or "DIRT" or "stone")
 def generate_item_from_id(item_id: str, qty: int = 1):
-    material = None
-    for mat in materials_module.Materials:
-        if mat.id.lower() == item_id.lower():
-            material = mat
-            break
+    material = materials_module.get_material(item_id)
     if not material:
         raise ValueError(f"Unknown material ID '{item_id}'")
     return Item(material, qty)
@@ -19,101 +17,208 @@ def generate_item_from_id(item_id: str, qty: int = 1):
 def process_shop_action(player: Player, shop: Shop, action_tuple, notifier):
     """
     action_tuple = (action, item_id, qty)
-    action in ("buy","sell")
+    action in ("buy","sell","sell_all")
+    "sell_all" ignores qty; item_id=None sells everything the shop buys.
     notifier: your NotificationManager instance to push messages
     """
     if not action_tuple:
         return
     act, item_id, qty = action_tuple
-    qty = max(1, int(qty))
 
-    shop_item = next((i for i in shop.items if i.material.id == item_id), None)
-    if not shop_item:
-        notifier.push("Shop item not found", level="error")
+    if act == "sell_all":
+        sell_all(player, shop, notifier, item_id)
         return
 
-    # BUY
-    if act == "buy":
-        total_price = shop_item.buy_price * qty
-        if not player.deduct_money(total_price):
-            notifier.push("Not enough money!", level="warning")
-            return
-
-        # create Item instance(s)
-        try:
-            to_add = generate_item_from_id(item_id, qty)
-        except ValueError:
-            player.add_money(total_price)  # refund
-            notifier.push("Item not recognized, purchase cancelled.", level="error")
-            return
-
-        # Try to add to inventory; adapt to either add_item signature:
-        try:
-            success, returned = player.inventory.add_item(to_add)
-        except TypeError:
-            # maybe inventory expects a list of Item or different shape; try list
-            try:
-                success, returned = player.inventory.add_item([to_add])
-            except Exception as e:
-                # give back money and notify
-                player.add_money(total_price)
-                notifier.push("Failed to add item to inventory.", level="error")
-                return
-
-        if not success:
-            # `returned` may be leftover item(s) — try to compute refund
-            # best-effort: if returned has .quantity attribute
-            refund_qty = 0
-            if hasattr(returned, "quantity"):
-                refund_qty = returned.quantity
-            elif isinstance(returned, list) and returned and hasattr(returned[0], "quantity"):
-                refund_qty = returned[0].quantity
-            refund_amount = refund_qty * shop_item.buy_price
-            if refund_amount:
-                player.add_money(refund_amount)
-                notifier.push(f"Inventory full — refunded {refund_qty} item(s).", level="warning")
-            else:
-                notifier.push("Inventory full — purchase failed.", level="warning")
-            return
-
-        # success
-        # optionally decrement shop stock if present
-        if hasattr(shop, "stock") and item_id in getattr(shop, "stock", {}):
-            if shop.stock[item_id] > 0:
-                shop.stock[item_id] = max(0, shop.stock[item_id] - qty)
-
-        notifier.push(f"Bought {shop_item.name} x{qty} - {total_price}$", level="success")
-
-    # SELL
-    elif act == "sell":
-        try:
-            to_sell = generate_item_from_id(item_id, qty)
-        except ValueError:
-            notifier.push("Unknown item to sell.", level="error")
-            return
-
-        # Try to remove from inventory. We expect remove_item to accept an Item or similar
-        try:
-            success, remaining = player.inventory.remove_item(to_sell)
-        except TypeError:
-            try:
-                success, remaining = player.inventory.remove_item([to_sell])
-            except Exception:
-                notifier.push("Could not remove item from inventory.", level="error")
-                return
-
-        if not success:
-            notifier.push("You don't have that item to sell.", level="warning")
-            return
+    process_shop_basket(player, shop, [(act, item_id, qty)], notifier)
 
-        earned = shop_item.sell_price * qty
-        player.add_money(earned)
+def process_shop_basket(player: Player, shop: Shop, basket, notifier) -> bool:
+    """
+    Settle a whole basket [(action, item_id, qty), ...] with action "buy"/"sell" in one
+    all-or-nothing inventory transaction and a single notification. Returns True on success.
+    """
+    changes = []
+    cost = 0            # money the player pays (negative when selling)
+    stock_delta = {}
+    lines = []
+    for act, item_id, qty in basket:
+        qty = max(1, int(qty))
+        shop_item = shop.get_item(item_id)
+        if not shop_item:
+            notifier.push("Shop item not found", level="error")
+            return False
+
+        if act == "buy":
+            if shop_item.buy_price <= 0:
+                # same rule as ShopUI, which shows no Buy button for these
+                notifier.push(f"{shop_item.material.name} can't be bought here.", level="warning")
+                return False
+            if item_id in shop.stock and shop.stock[item_id] < qty:
+                notifier.push(f"{shop_item.material.name} is out of stock.", level="warning")
+                return False
+            price = shop_item.buy_price * qty
+            changes.append((shop_item.material, qty))
+            cost += price
+            stock_delta[item_id] = stock_delta.get(item_id, 0) - qty
+            lines.append(f"Bought {shop_item.material.name} x{qty} - {price}$")
+        elif act == "sell":
+            if shop_item.sell_price <= 0:
+                notifier.push(f"{shop_item.material.name} can't be sold here.", level="warning")
+                return False
+            price = shop_item.sell_price * qty
+            changes.append((shop_item.material, -qty))
+            cost -= price
+            stock_delta[item_id] = stock_delta.get(item_id, 0) + qty
+            lines.append(f"Sold {shop_item.material.name} x{qty} +{price}$")
+        else:
+            notifier.push(f"Unknown shop action '{act}'", level="error")
+            return False
+
+    if not changes:
+        return False
+    if cost > player.money:
+        notifier.push("Not enough money!", level="warning")
+        return False
+
+    ok, reason = player.inventory.apply(changes)
+    if not ok:
+        if reason == "Inventory full":
+            notifier.push("Inventory full — purchase failed.", level="warning")
+        elif len(changes) == 1:
+            notifier.push("You don't have that item to sell.", level="warning")
+        else:
+            notifier.push(f"{reason}.", level="warning")
+        return False
+
+    if cost >= 0:
+        player.take_money(cost)
+    else:
+        player.add_money(-cost)
+    for item_id, delta in stock_delta.items():
+        shop.adjust_stock(item_id, delta)
+
+    if len(lines) == 1:
+        notifier.push(lines[0], level="success")
+    else:
+        notifier.push(f"Basket settled ({len(lines)} items) {'-' if cost > 0 else '+'}{abs(cost)}$", level="success")
+    return True
+
+def sell_all(player: Player, shop: Shop, notifier, item_id: str = None):
+    """
+    Sell every stack the shop buys (or only item_id) in one pass over the inventory,
+    paying out once and pushing a single notification. Returns the money earned.
+    """
+    if item_id is not None:
+        shop_item = shop.get_item(item_id)
+        sellable = {item_id} if shop_item and shop_item.sell_price > 0 else set()
+    else:
+        sellable = {it.material.id for it in shop.items if it.sell_price > 0}
+
+    removed = player.inventory.remove_all(sellable) if sellable else {}
+    if not removed:
+        notifier.push("You don't have anything to sell.", level="warning")
+        return 0
+
+    earned = 0
+    total_qty = 0
+    for material_id, (material, qty) in removed.items():
+        earned += shop.get_item(material_id).sell_price * qty
+        total_qty += qty
+        shop.adjust_stock(material_id, qty)
+    player.add_money(earned)
+
+    if len(removed) == 1:
+        material, qty = next(iter(removed.values()))
+        notifier.push(f"Sold {material.name} x{qty} +{earned}$", level="success")
+    else:
+        notifier.push(f"Sold {total_qty} items ({len(removed)} kinds) +{earned}$", level="success")
+    return earned
+
+def _wrap_lines(font: pygame.font.Font, txt: str, inner_w: int) -> list[str]:
+    # Wrap by measuring candidate lines (word-based)
+    words = txt.split()
+    if not words:
+        return []
+    lines, cur = [], words[0]
+    for w in words[1:]:
+        test = cur + " " + w
+        if font.size(test)[0] <= inner_w:
+            cur = test
+        else:
+            lines.append(cur)
+            cur = w
+    lines.append(cur)
+    return lines
+
+@lru_cache(maxsize=512)
+def _fit_text(text: str, inner_w: int, inner_h: int, font_name, max_font_size: int,
+              min_font_size: int, ellipsis: bool, line_spacing: float) -> tuple[int, tuple[str, ...]]:
+    """Pick the largest font size whose wrapped text fits, returns (font_size, lines). Memoized."""
+    def fits(fs):
+        f = get_font(font_name, fs)
+        lines = _wrap_lines(f, text, inner_w)
+        return int(f.get_linesize() * line_spacing * len(lines)) <= inner_h, lines
+
+    # Binary search for the largest size that fits (taller fonts never need fewer lines)
+    lo, hi = min_font_size, max_font_size
+    best = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        ok, lines = fits(mid)
+        if ok:
+            best = (mid, lines)
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    if best:
+        return best[0], tuple(best[1])
 
-        # increase shop stock if present
-        if hasattr(shop, "stock") and item_id in getattr(shop, "stock", {}):
-            shop.stock[item_id] += qty
+    # If still too tall, we’ll truncate with ellipsis using the min size
+    chosen_font = get_font(font_name, min_font_size)
+    lines = _wrap_lines(chosen_font, text, inner_w)
+
+    # Remove lines until it fits
+    line_h = chosen_font.get_linesize()
+    while lines and int(line_h * line_spacing * len(lines)) > inner_h:
+        lines.pop()
+
+    if lines and ellipsis:
+        # Try to add ellipsis to the last line without exceeding width
+        last = lines[-1]
+        while last and chosen_font.size(last + "…")[0] > inner_w:
+            last = last[:-1]
+        lines[-1] = (last + "…") if last else "…"
+
+    return min_font_size, tuple(lines)
+
+@lru_cache(maxsize=256)
+def _render_text_block(text: str, size: tuple[int, int], font_name, max_font_size: int, min_font_size: int,
+                       color: tuple, padding: int, ellipsis: bool, line_spacing: float, center: bool):
+    """Render the fitted text into a transparent rect-sized surface. Returns (surface, font) or (None, None)."""
+    width, height = size
+    inner_w = max(0, width - 2*padding)
+    inner_h = max(0, height - 2*padding)
+    fs, lines = _fit_text(text, inner_w, inner_h, font_name, max_font_size, min_font_size, ellipsis, line_spacing)
+    if not lines:
+        return None, None
+    font = get_font(font_name, fs)
+
+    # Transparent pixels carry the text color so antialiased edges don't blend towards black
+    block = pygame.Surface(size, pygame.SRCALPHA)
+    block.fill((*color[:3], 0))
+
+    line_h = font.get_linesize()
+    y = padding
+    # Vertical centering
+    if center:
+        block_h = int(line_h * line_spacing * len(lines))
+        y = (height - block_h) // 2
 
-        notifier.push(f"Sold {shop_item.material.name} x{qty} +{earned}$", level="success")
+    for line in lines:
+        img = render_text(font, line, color)
+        x = (width - img.get_width()) // 2 if center else padding
+        block.blit(img, (x, y))
+        y += int(line_h * line_spacing)
+    return block, font
 
 def draw_text_in_rect(
     surface: pygame.Surface,
@@ -129,89 +234,21 @@ def draw_text_in_rect(
     line_spacing=1.1,
     center=True
 ):
-    """Draw text inside rect, wrapping and shrinking to fit. Returns final font size used."""
-    inner_w = max(0, rect.width - 2*padding)
-    inner_h = max(0, rect.height - 2*padding)
-
-    if inner_w <= 0 or inner_h <= 0:
+    """
+    Draw text inside rect, wrapping and shrinking to fit. Returns final font size used.
+    Layout and the rendered block are memoized per (text, rect size, font params), so
+    static labels (portal names) cost a single blit after the first frame.
+    """
+    if rect.width - 2*padding <= 0 or rect.height - 2*padding <= 0:
         return None
 
-    def wrap_lines(font: pygame.font.Font, txt: str) -> list[str]:
-        # Wrap by measuring candidate lines (word-based)
-        words = txt.split()
-        if not words:
-            return []
-        lines, cur = [], words[0]
-        for w in words[1:]:
-            test = cur + " " + w
-            if font.size(test)[0] <= inner_w:
-                cur = test
-            else:
-                lines.append(cur)
-                cur = w
-        lines.append(cur)
-        return lines
-
-    fs = max_font_size
-    chosen_lines = []
-    chosen_font = None
-
-    while fs >= min_font_size:
-        f = pygame.font.SysFont(font_name, fs)
-        lines = wrap_lines(f, text)
-
-        # Measure total height
-        line_h = f.get_linesize()
-        total_h = int(line_h * line_spacing * len(lines))
-
-        if total_h <= inner_h:
-            chosen_lines = lines
-            chosen_font = f
-            break
-        fs -= 1
-
-    # If still too tall, we’ll truncate with ellipsis using the min size
-    if chosen_font is None:
-        chosen_font = pygame.font.SysFont(font_name, min_font_size)
-        lines = wrap_lines(chosen_font, text)
-
-        # Remove lines until it fits
-        line_h = chosen_font.get_linesize()
-        while lines and int(line_h * line_spacing * len(lines)) > inner_h:
-            lines.pop()
-
-        if lines and ellipsis:
-            # Try to add ellipsis to the last line without exceeding width
-            last = lines[-1]
-            while last and chosen_font.size(last + "…")[0] > inner_w:
-                last = last[:-1]
-            lines[-1] = (last + "…") if last else "…"
-
-        chosen_lines = lines
-
-    # Render
-    # Optional: draw a subtle background so text is readable
-    # pygame.draw.rect(surface, (0, 0, 0, 80), rect)  # if using per-surface alpha
-
-    # Clip to ensure no overflow ever shows
-    prev_clip = surface.get_clip()
-    surface.set_clip(rect)
-
-    y = rect.y + padding
-    # Vertical centering
-    if center and chosen_lines:
-        line_h = chosen_font.get_linesize()
-        block_h = int(line_h * line_spacing * len(chosen_lines))
-        y = rect.y + (rect.height - block_h) // 2
-
-    for line in chosen_lines:
-        img = chosen_font.render(line, True, color)
-        if center:
-            x = rect.x + (rect.width - img.get_width()) // 2
-        else:
-            x = rect.x + padding
-        surface.blit(img, (x, y))
-        y += int(chosen_font.get_linesize() * line_spacing)
+    block, font = _render_text_block(
+        text, (rect.width, rect.height), font_name, max_font_size, min_font_size,
+        tuple(color), padding, ellipsis, line_spacing, center
+    )
+    if block is None:
+        return None
 
-    surface.set_clip(prev_clip)
-    return chosen_font.get_height() if chosen_lines else None
\ No newline at end of file
+    # The block is exactly rect-sized, so nothing can overflow the rect
+    surface.blit(block, rect.topleft)
+    return font.get_height()
@@ -19,11 +19,11 @@ def GameInit(shop_manager: ShopManager, rank_manager: RankManager, reg: CommandR
     ]
 
     Ranks = [
-        Rank("c", "C", 0, (150, 150, 150)),
-        Rank("b", "B", 100, (100, 100, 255)),
-        Rank("a", "A", 500, (255, 100, 100)),
-        Rank("elitas", "Elitas", 2000, (255, 255, 100)),
-        Rank("laisvas", "Laisvas", 5000, (100, 255, 100)),
+        Rank("c", "C", 0, (150, 150, 150), order=0),
+        Rank("b", "B", 100, (100, 100, 255), order=1),
+        Rank("a", "A", 500, (255, 100, 100), order=2),
+        Rank("elitas", "Elitas", 2000, (255, 255, 100), order=3),
+        Rank("laisvas", "Laisvas", 5000, (100, 255, 100), order=4),
     ]
 
     for rank in Ranks:
@@ -39,4 +39,6 @@ def GameInit(shop_manager: ShopManager, rank_manager: RankManager, reg: CommandR
     reg.register("tp",    cmd_tp,   aliases=["teleport"])
     reg.register("scene", cmd_scene)
     reg.register("scenes", cmd_scenes)
-    reg.register("shop",  cmd_shop)
\ No newline at end of file
+    reg.register("shop",  cmd_shop)
+    reg.register("sellall", cmd_sellall)
+    reg.register("rankup", cmd_rankup)
\ No newline at end of file
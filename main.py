@@ -1,7 +1,7 @@
 import pygame
 import math
+import time
 import random
-import configparser
 
 from mine import Block
 from classes.player.main import Player
@@ -18,8 +18,15 @@ from ui.notifications import NotificationManager
 from ui.debug import DebugOverlay
 from ui.shop import ShopUI
 from ui.chat import ChatUI
+from ui.fonts import get_font
 
 from systems.mining import MiningSystem
+from systems.mine_reset import MineResetScheduler
+from systems.assets import AssetManager
+from systems.game_loop import GameLoop
+from systems.profiler import profiler
+from systems.config import config_store
+from systems.save import AutoSaver
 
 from init import GameInit
 
@@ -27,35 +34,45 @@ from helper import *
 
 pygame.init()
 
-screen = pygame.display.set_mode((1300, 700))
+config = config_store.current
+
+screen = pygame.display.set_mode(config.display.size)
 clock = pygame.time.Clock()
+loop = GameLoop.from_settings(clock, config.settings)
+
+PLAYER_IMAGE = "assets/images/player.png"
+
+assets = AssetManager()
+try:
+    assets.preload(PLAYER_IMAGE, (50, 50))
+except FileNotFoundError:
+    pass
 
 notifier = NotificationManager(anchor="top-center")  # or "bottom-left"
-debug = DebugOverlay(anchor="top-left", font=pygame.font.Font(None, 18))
-chat = ChatUI(10, 400, 400, 290)
+debug = DebugOverlay(anchor="top-left", font=get_font(None, 18), profiler=profiler,
+                     frame_budget_ms=loop.frame_budget_ms)
+chat = ChatUI(10, 400, 400, 290, max_messages=config.chat.history_size)
 cmds = CommandRegistry()
 shop_manager = ShopManager()
 shop_ui = ShopUI()
 rank_manager = RankManager()
 GameInit(shop_manager, rank_manager, cmds)
-scene_mgr = SceneManager(shop_manager, shop_ui)
-
-config = configparser.ConfigParser()
-settings = configparser.ConfigParser()
-
-config.read('config.ini')
-settings.read('settings.ini')
+scene_mgr = SceneManager.from_config(shop_manager, shop_ui, config)
 
-player = Player(screen.get_size(), config, settings, rank_manager)
+player = Player(screen.get_size(), config, config.settings, rank_manager)
 player.position = scene_mgr.current.spawn
 
 mining_system = MiningSystem(config, notifier)
+mine_resets = MineResetScheduler(config, notifier)
+mine_resets.register_all(scene_mgr)
+
+autosave = AutoSaver(config, player, notifier)
+if autosave.load():
+    notifier.push("Progress loaded", level="success")
 
 debug.add_static("PrisonXD v0.2")
-running = True
-is_mouse_down = False
 
-# Providers (each called every frame)
+# Providers (each re-run on its own interval, see add_provider below)
 def perf_provider():
     return {
         "FPS": f"{clock.get_fps():.1f}",
@@ -71,10 +88,14 @@ def player_provider():
 def scene_provider():
     try:
         cubes_count = len(scene_mgr.cubes())
-        return {
+        info = {
             "Scene": scene_mgr.current.name,
             "Blocks": cubes_count,
         }
+        fill = mine_resets.fill(scene_mgr.current.name)
+        if fill is not None:
+            info["Mine fill"] = f"{fill:.0%}"
+        return info
     except NameError:
         return {}
     
@@ -107,12 +128,13 @@ def ranks_provider():
             "Ranks": "None"
         }
 
-debug.add_provider(perf_provider)
-debug.add_provider(player_provider)
-debug.add_provider(scene_provider)
-debug.add_provider(mouse_hover_provider)
-debug.add_provider(rank_provider)
-debug.add_provider(ranks_provider)
+# refresh intervals in ms: fast-changing values a few times a second, the rest rarely
+debug.add_provider(perf_provider, interval_ms=250)
+debug.add_provider(player_provider, interval_ms=100)
+debug.add_provider(scene_provider, interval_ms=250)
+debug.add_provider(mouse_hover_provider, interval_ms=100)
+debug.add_provider(rank_provider, interval_ms=500)
+debug.add_provider(ranks_provider, interval_ms=5000)
 
 # -- HELPER FUNCTIONS --
 
@@ -124,16 +146,40 @@ def make_ctx():
         chat=chat,
         shop_ui=shop_ui,
         shop_mgr=shop_manager,
-        config=config,
+        config=config_store.current,
     )
 
-while running:
-    dt = clock.tick(0) / 1000.0 
-    dt = min(dt, 0.05)
-
+def on_config_reload(new, old):
+    # snapshot-only values (see ConfigStore) stay as they are
+    mining_system.apply_config(new)
+    mine_resets.apply_config(new)
+    autosave.apply_config(new)
+    scene_mgr.apply_config(new)
+    loop.apply_settings(new.settings)
+    debug.set_frame_budget(loop.frame_budget_ms)
+    player.apply_config(new)
+    chat.set_max_messages(new.chat.history_size)
+    notifier.push("Config reloaded", level="info")
+
+config_store.subscribe(on_config_reload)
+
+def poll_config():
+    error = config_store.last_error
+    config_store.poll_changes()
+    if config_store.last_error and config_store.last_error != error:
+        notifier.push(f"Config not reloaded: {config_store.last_error}", level="warning")
+
+def process_input():
+    profiler.begin_frame()
+    poll_config()
+    with profiler.section("events"):
+        handle_events()
+
+def handle_events():
     for event in pygame.event.get():
+        loop.handle_event(event)
         if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and not chat.is_chat_open):
-            running = False
+            loop.stop()
         if chat.is_chat_open:
             chat_message = chat.handle_event(event)
             if chat_message:
@@ -146,6 +192,9 @@ while running:
             continue
         elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
             debug.toggle()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and profiler.enabled:
+            path = profiler.dump(f"profiles/frame_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            notifier.push(f"Profile saved to {path}", level="info")
         elif event.type == pygame.KEYDOWN and event.key == pygame.K_e:
             player.toggle_inventory()
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -167,38 +216,65 @@ while running:
             event, player, scene_mgr,
             ignore_when=lambda: (player.inventory_open or shop_ui.visible or chat.is_chat_open)
         )
-    screen.fill((75, 75, 75))
 
-    # Load and draw player image
-    try:
-        player_img = pygame.image.load("assets/images/player.png").convert_alpha()
-        player_img = pygame.transform.scale(player_img, (50, 50))
-        screen.blit(player_img, player.position)
-    except FileNotFoundError:
-        # Fallback to red rectangle if image not found
-        pygame.draw.rect(screen, (255, 0, 0), (int(player.position[0]), int(player.position[1]), 50, 50))
+def simulate(dt):
+    player.prev_position = player.position
 
     # SCENE UPDATE: check portals and switch if needed
-    next_scene, next_spawn = scene_mgr.current.update(player)
-    if next_scene:
-        scene_mgr.switch(next_scene, player, next_spawn)
+    with profiler.section("portals"):
+        next_scene, next_spawn = scene_mgr.current.update(player)
+        if next_scene:
+            scene_mgr.switch(next_scene, player, next_spawn)
+
+    with profiler.section("resets"):
+        mine_resets.update(scene_mgr, player)
+
+    with profiler.section("autosave"):
+        autosave.update()
 
     keys = pygame.key.get_pressed()
     if not chat.is_chat_open:
-        player.moveHandler(keys, dt, scene_mgr.cubes())
-
-    # draw scene
-    scene_mgr.current.draw(screen, player)
+        with profiler.section("movement"):
+            player.moveHandler(keys, dt, scene_mgr.cubes())
 
-    if player.inventory_open:
-        player.draw_inventory(screen)
+def render(alpha):
+    assets.poll_changes()
+    screen.fill((75, 75, 75))
 
-    notifier.draw(screen)
-    debug.draw(screen)
-    shop_ui.draw(screen)
-    chat.update(clock.get_time())
-    chat.draw(screen)
+    # Draw player image (cached, hot-reloaded by AssetManager), interpolated between ticks
+    with profiler.section("player"):
+        px, py = player.render_position(alpha)
+        try:
+            player_img = assets.get(PLAYER_IMAGE, (50, 50))
+            screen.blit(player_img, (px, py))
+        except FileNotFoundError:
+            # Fallback to red rectangle if image not found
+            pygame.draw.rect(screen, (255, 0, 0), (int(px), int(py), 50, 50))
 
-    pygame.display.flip()
+    # draw scene
+    with profiler.section("scene"):
+        scene_mgr.current.draw(screen, player)
 
+    if player.inventory_open:
+        with profiler.section("inventory"):
+            player.draw_inventory(screen)
+
+    with profiler.section("notify"):
+        notifier.draw(screen)
+    with profiler.section("debug"):
+        debug.draw(screen)
+    with profiler.section("shop"):
+        shop_ui.draw(screen)
+    with profiler.section("chat"):
+        chat.update(clock.get_time())
+        chat.draw(screen)
+
+    with profiler.section("flip"):
+        pygame.display.flip()
+    profiler.end_frame()
+
+loop.run(process_input, simulate, render)
+
+autosave.close()
+scene_mgr.shutdown()
 pygame.quit()
\ No newline at end of file
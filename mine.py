@@ -1,16 +1,253 @@
 import pygame
+from typing import Dict, Iterator, List, Optional, Tuple
 from classes.items.item import Item
 
-class Block(pygame.sprite.Sprite):
-    def __init__(self, x, y, width, height, item: Item):
-        super().__init__()
+# Flyweight textures: every block of the same material and size shares one Surface
+_block_textures: Dict[Tuple[str, int, int], pygame.Surface] = {}
+
+def block_texture(material, width: int, height: int) -> pygame.Surface:
+    """Shared solid-color surface for (material id, size). Treat it as read-only."""
+    key = (material.id, width, height)
+    surf = _block_textures.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, height))
+        surf.fill(material.color)
+        _block_textures[key] = surf
+    return surf
+
+class Block:
+    __slots__ = ("image", "rect", "item")
 
+    def __init__(self, x, y, width, height, item: Item):
         if (not item.metadata.get("decoration", False)) and (x % 50 != 0 or y % 50 != 0):
             raise ValueError(f"Block position must be aligned to a 50x50 grid. Got ({x}, {y})")
-        self.image = pygame.Surface((width, height))
-        self.image.fill(item.material.color)
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.image = block_texture(item.material, width, height)
+        self.rect = pygame.Rect(x, y, width, height)
         self.item = item
 
     def get_drops(self) -> Item:
         return self.item
+
+class BlockGrid:
+    """
+    Scene block container indexed by grid cell.
+
+    Behaves like the plain list scenes used before (append / remove / iteration / len),
+    but keeps a (cx, cy) -> Block map so rect queries only touch the cells the rect covers.
+    Blocks that don't fill exactly one cell (off-grid decorations, odd sizes, a second
+    block in an occupied cell) go to a small side list that every query checks.
+
+    Every add/remove records the block's rect in `dirty` so a prerendered block layer can
+    repaint just those areas; once too many pile up, `dirty_all` asks for a full repaint.
+
+    A generated mine can be attached as a lazy source (systems.mine_generator.MineLayout):
+    its cells count as occupied, and each Block is only built the first time a lookup,
+    query or iteration reaches it.
+    """
+    MAX_DIRTY_RECTS = 256
+
+    def __init__(self, cell_size: int = 50):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Block] = {}
+        self._loose: List[Block] = []
+        self.dirty: List[pygame.Rect] = []
+        self.dirty_all = True
+        self._layout = None     # lazy block source, see attach()
+
+    def _cell_of(self, block: Block) -> Optional[Tuple[int, int]]:
+        cs = self.cell_size
+        r = block.rect
+        if r.width != cs or r.height != cs or r.x % cs or r.y % cs:
+            return None
+        return (r.x // cs, r.y // cs)
+
+    def _mark_dirty(self, rect: pygame.Rect):
+        if self.dirty_all:
+            return
+        if len(self.dirty) >= self.MAX_DIRTY_RECTS:
+            self.dirty.clear()
+            self.dirty_all = True
+            return
+        self.dirty.append(rect.copy())
+
+    def take_dirty(self) -> Tuple[bool, List[pygame.Rect]]:
+        """Return (repaint_everything, rects) accumulated since the last call and reset them."""
+        dirty_all, rects = self.dirty_all, self.dirty
+        self.dirty_all, self.dirty = False, []
+        return dirty_all, rects
+
+    # ---- lazy layouts ----
+
+    def attach(self, layout):
+        """Use layout (anything with take(cx, cy), take_all() and remaining) for unbuilt cells."""
+        self.materialize()
+        self._layout = layout
+        self.dirty_all = True
+
+    @property
+    def layout(self):
+        """The attached lazy source, or None once it has been fully built."""
+        return self._layout
+
+    def built_cells(self):
+        """((cx, cy), Block) for every built, cell-aligned block."""
+        return self._cells.items()
+
+    def paint(self, surface):
+        """Blit every block onto surface; the layout's unbuilt cells are painted without being built."""
+        if self._layout is not None:
+            self._layout.paint_pending(surface)
+        surface.blits([(b.image, b.rect) for b in self._cells.values()], doreturn=False)
+        surface.blits([(b.image, b.rect) for b in self._loose], doreturn=False)
+
+    def detach(self):
+        """Drop the attached layout along with every block it hasn't built yet."""
+        if self._layout is not None:
+            self._layout = None
+            self.dirty_all = True
+
+    def _take(self, cx: int, cy: int) -> Optional[Block]:
+        layout = self._layout
+        if layout is None:
+            return None
+        block = layout.take(cx, cy)
+        if block is not None:
+            self._cells[(cx, cy)] = block
+            if not layout.remaining:
+                self._layout = None
+        return block
+
+    def materialize(self):
+        """Build every block the attached layout still holds."""
+        layout = self._layout
+        if layout is None:
+            return
+        if layout.remaining:
+            for block in layout.take_all():
+                cell = self._cell_of(block)
+                if cell is None or cell in self._cells:
+                    self._loose.append(block)
+                else:
+                    self._cells[cell] = block
+        self._layout = None
+
+    # ---- list-like API ----
+
+    def append(self, block: Block):
+        cell = self._cell_of(block)
+        if cell is not None and self._layout is not None and cell not in self._cells:
+            self._take(*cell)
+        if cell is None or cell in self._cells:
+            self._loose.append(block)
+        else:
+            self._cells[cell] = block
+        self._mark_dirty(block.rect)
+
+    def extend(self, blocks: List[Block]):
+        """Append many blocks, marking one dirty rect around all of them."""
+        if not blocks:
+            return
+        dirty_all = self.dirty_all
+        self.dirty_all = True          # suppress per-block dirty rects
+        for block in blocks:
+            self.append(block)
+        self.dirty_all = dirty_all
+        self._mark_dirty(blocks[0].rect.unionall([b.rect for b in blocks[1:]]))
+
+    def remove(self, block: Block):
+        """Remove a block; raises ValueError if it isn't in the grid (same as list.remove)."""
+        cell = self._cell_of(block)
+        if cell is not None and self._cells.get(cell) is block:
+            del self._cells[cell]
+        else:
+            self._loose.remove(block)
+        self._mark_dirty(block.rect)
+
+    def clear(self):
+        self._layout = None
+        self._cells.clear()
+        self._loose.clear()
+        self.dirty.clear()
+        self.dirty_all = True
+
+    def copy(self) -> List[Block]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[Block]:
+        self.materialize()
+        yield from self._cells.values()
+        yield from self._loose
+
+    def __len__(self) -> int:
+        pending = self._layout.remaining if self._layout is not None else 0
+        return len(self._cells) + len(self._loose) + pending
+
+    def __contains__(self, block: Block) -> bool:
+        cell = self._cell_of(block)
+        if cell is not None and self._cells.get(cell) is block:
+            return True
+        return block in self._loose
+
+    # ---- spatial queries ----
+
+    def occupied(self, cx: int, cy: int) -> bool:
+        """Whether grid cell (cx, cy) holds a block, without building lazy ones."""
+        if (cx, cy) in self._cells:
+            return True
+        return self._layout is not None and self._layout.is_pending(cx, cy)
+
+    def material_at(self, cx: int, cy: int):
+        """Material in grid cell (cx, cy) or None, without building lazy blocks."""
+        block = self._cells.get((cx, cy))
+        if block is not None:
+            return block.item.material
+        if self._layout is not None:
+            return self._layout.material_at(cx, cy)
+        return None
+
+    def at_cell(self, cx: int, cy: int) -> Optional[Block]:
+        """Block filling grid cell (cx, cy), O(1). Off-grid blocks are not considered."""
+        block = self._cells.get((cx, cy))
+        if block is None and self._layout is not None:
+            block = self._take(cx, cy)
+        return block
+
+    def at(self, x, y) -> Optional[Block]:
+        """Block whose rect contains pixel (x, y) (Rect.collidepoint semantics)."""
+        cs = self.cell_size
+        block = self.at_cell(int(x // cs), int(y // cs))
+        if block is not None:
+            return block
+        for block in self._loose:
+            if block.rect.collidepoint(x, y):
+                return block
+        return None
+
+    def query(self, rect) -> List[Block]:
+        """
+        Blocks overlapping rect (x, y, w, h); float coordinates are fine.
+        Edges that only touch don't count, same as Player.check_collision.
+        """
+        x, y, w, h = rect
+        cs = self.cell_size
+        cx0, cy0 = int(x // cs), int(y // cs)
+        cx1, cy1 = int(-((-(x + w)) // cs)) - 1, int(-((-(y + h)) // cs)) - 1
+
+        hits = []
+        cells = self._cells
+        lazy = self._layout is not None and self._layout.remaining
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                block = cells.get((cx, cy))
+                if block is None and lazy:
+                    block = self._take(cx, cy)
+                if block is not None:
+                    hits.append(block)
+        for block in self._loose:
+            bx, by, bw, bh = block.rect
+            if x < bx + bw and x + w > bx and y < by + bh and y + h > by:
+                hits.append(block)
+        return hits
+
+    def collides(self, rect) -> bool:
+        return bool(self.query(rect))
@@ -1,11 +1,12 @@
-import pygame, random
-from mine import Block
+import pygame
+from mine import Block, BlockGrid
 
 from classes.items.materials import *
 from classes.items.item import Item
 from classes.shop import *
 from ui.shop import ShopUI
 from rooms.scenes import SceneBase
+from systems.mine_generator import MineParams
 
 class HubScene(SceneBase):
     def __init__(self):
@@ -13,19 +14,19 @@ class HubScene(SceneBase):
         super().__init__("c_hub", spawn=(110, 335))
 
     def load(self):
-        self.cubes = []
         # flat grass, some decor
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
-        portal_width = int(self.config.get('game.portals', 'portal_width', fallback=50))
-        portal_height = int(self.config.get('game.portals', 'portal_height', fallback=700))
+        cube_size = self.config.mines.block_size
+        self.cubes = BlockGrid(cube_size)
+        portal_width = self.config.portals.portal_width
+        portal_height = self.config.portals.portal_height
 
         for x in range(0, 1300, 50):
             item = Item(DIRT, 1, {"indestructable": True, "decoration": True})
             self.cubes.append(Block(x, 650, cube_size, cube_size, item))
 
-        screen = pygame.display.get_window_size()
+        screen = self.screen_size
 
-        corridor_left = pygame.display.get_window_size()[0] - portal_width
+        corridor_left = self.screen_size[0] - portal_width
 
         portal_mine_rect = pygame.Rect(corridor_left, 0, portal_width, portal_height)
         portal_shop_rect = pygame.Rect(0, 0, portal_width, portal_height)
@@ -38,10 +39,10 @@ class MineScene(SceneBase):
         super().__init__("c_mines", spawn=(50, 50))
 
     def load(self):
-        self.cubes = []
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
-        portal_width = int(self.config.get('game.portals', 'portal_width', fallback=50))
-        portal_height = int(self.config.get('game.portals', 'portal_height', fallback=700))
+        cube_size = self.config.mines.block_size
+        self.cubes = BlockGrid(cube_size)
+        portal_width = self.config.portals.portal_width
+        portal_height = self.config.portals.portal_height
 
 
         # build a small mine room with walls and floor
@@ -50,16 +51,11 @@ class MineScene(SceneBase):
             self.cubes.append(Block(x, 650, cube_size, cube_size, item))
             self.cubes.append(Block(x, 0, cube_size, cube_size, item))
 
-        # Minable block cubes
-        for x in range(cube_size + cube_size, 1300 - cube_size * 2, cube_size):
-            for y in range(cube_size * 2, 600, cube_size):
-                mat = random.choices(
-                    population=[STONE, RAW_IRON, RAW_GOLD, RAW_DIAMOND],
-                    weights=[10, 0.5, 0.2, 0.1],
-                    k=1
-                )[0]
-                item = Item(mat, 1)
-                self.cubes.append(Block(x, y, cube_size, cube_size, item))
+        # Minable block cubes: one generated ore array, blocks are built on first use
+        xs = range(cube_size + cube_size, 1300 - cube_size * 2, cube_size)
+        ys = range(cube_size * 2, 600, cube_size)
+        params = MineParams(cols=len(xs), rows=len(ys), ores=((STONE, 10), (RAW_IRON, 0.5), (RAW_GOLD, 0.2), (RAW_DIAMOND, 0.1)))
+        self.generate_mine(params, origin=(xs[0], ys[0]))
 
         # portal back to hub at the far left
         back_rect = pygame.Rect(0, 0, portal_width, portal_height)
@@ -77,17 +73,17 @@ class ShopScene(SceneBase):
         self.shop_active: Shop | None = None
 
     def load(self):
-        self.cubes = []
 
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
-        portal_width = int(self.config.get('game.portals', 'portal_width', fallback=50))
-        portal_height = int(self.config.get('game.portals', 'portal_height', fallback=700))
+        cube_size = self.config.mines.block_size
+        self.cubes = BlockGrid(cube_size)
+        portal_width = self.config.portals.portal_width
+        portal_height = self.config.portals.portal_height
 
         for x in range(0, 1300, 50):
             item = Item(BEDROCK, 1, {"indestructable": True})
             self.cubes.append(Block(x, 650, cube_size, cube_size, item))
 
-        corridor_left = pygame.display.get_window_size()[0] - portal_width
+        corridor_left = self.screen_size[0] - portal_width
         corridor_rect = pygame.Rect(corridor_left, 0, portal_width, portal_height)  # "door" to the right
         self.portals = [(corridor_rect, "c_hub", (100, 335))]
 
@@ -106,7 +102,7 @@ class ShopScene(SceneBase):
 
         # If player is near the shop area (left side), open the shop UI
         px, py = player.position
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
+        cube_size = self.config.mines.block_size
         player_rect = pygame.Rect(px, py, cube_size, cube_size)
 
         shop_area = pygame.Rect(0, 0, 200, 700)
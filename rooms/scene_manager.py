@@ -1,28 +1,170 @@
-from rooms.scenes import HubScene, FurnaceScene
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from rooms.scenes import SceneBase, HubScene, FurnaceScene
 from rooms.C.scenes import HubScene as CHubScene, MineScene as CMineScene, ShopScene as CShopScene
+from rooms.B.scenes import HubScene as BHubScene, MineScene as BMineScene, ShopScene as BShopScene
 
-from mine import Block
+from mine import BlockGrid
+from systems.config import Config
 
 class SceneManager:
-    def __init__(self, shop_manager, shop_ui):
-        self.scenes = {
-            "hub": HubScene(),
-            "furnace_room": FurnaceScene(),
-
-            "c_hub": CHubScene(),
-            "c_mine": CMineScene(),
-            "c_shop": CShopScene(shop_manager, shop_ui),
-        }
-        self.current = self.scenes["c_hub"]
-        for s in self.scenes.values():
-            s.load()
+    """
+    Scenes are registered as factories and only built + load()ed the first time they're
+    needed. Loaded scenes live in an LRU; past max_loaded scenes or memory_budget bytes
+    (SceneBase.memory_estimate) the least recently used one is unloaded, keeping its
+    save_state() so mined blocks come back as they were.
 
-    def switch(self, name, player, spawn=None):
-        if name not in self.scenes:
+    With prefetch=True, scenes reachable through the current scene's portals are built on
+    a background thread so the next switch finds them ready.
+    """
+    def __init__(self, shop_manager, shop_ui, *, max_loaded: int = 8, memory_budget: int = 64 * 1024 * 1024,
+                 prefetch: bool = False):
+        self.max_loaded = max(1, max_loaded)
+        self.memory_budget = memory_budget
+
+        self._factories: Dict[str, Callable[[], SceneBase]] = {}
+        self.loaded: "OrderedDict[str, SceneBase]" = OrderedDict()   # least recently used first
+        self._saved: Dict[str, object] = {}                          # save_state() of unloaded scenes
+        self.on_load: List[Callable[[str, SceneBase], None]] = []
+        self.on_unload: List[Callable[[str, SceneBase], None]] = []
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, tuple] = {}                         # name -> (Future, saved state)
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-prefetch") if prefetch else None
+        )
+
+        self.register("hub", HubScene)
+        self.register("furnace_room", FurnaceScene)
+
+        self.register("c_hub", CHubScene)
+        self.register("c_mine", CMineScene)
+        self.register("c_shop", lambda: CShopScene(shop_manager, shop_ui))
+
+        self.register("b_hub", BHubScene)
+        self.register("b_mine", BMineScene)
+        self.register("b_shop", lambda: BShopScene(shop_manager, shop_ui))
+
+        self.current = self.get("c_hub")
+        self._prefetch_neighbours()
+
+    @classmethod
+    def from_config(cls, shop_manager, shop_ui, config: Config, **overrides) -> "SceneManager":
+        """Build with the [game.scenes] section of config.ini (keyword overrides win)."""
+        scenes = config.scenes
+        options = dict(
+            max_loaded=scenes.max_loaded,
+            memory_budget=int(scenes.memory_budget_mb * 1024 * 1024),
+            prefetch=scenes.prefetch,
+        )
+        options.update(overrides)
+        return cls(shop_manager, shop_ui, **options)
+
+    def apply_config(self, config: Config):
+        """Take new [game.scenes] limits (prefetch is fixed at construction)."""
+        self.max_loaded = max(1, config.scenes.max_loaded)
+        self.memory_budget = int(config.scenes.memory_budget_mb * 1024 * 1024)
+        self._evict()
+
+    def register(self, name: str, factory: Callable[[], SceneBase]):
+        """factory() returns a new, not yet loaded scene."""
+        self._factories[name] = factory
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.loaded
+
+    # ---- loading ----
+
+    def _build(self, name: str, state) -> SceneBase:
+        scene = self._factories[name]()
+        scene.load()
+        scene.restore_state(state)
+        return scene
+
+    def get(self, name: str) -> SceneBase:
+        """The scene called name, loading it (or collecting its prefetch) if needed."""
+        scene = self.loaded.get(name)
+        if scene is not None:
+            self.loaded.move_to_end(name)
+            return scene
+        if name not in self._factories:
             raise ValueError(f"Scene '{name}' does not exist.")
-        self.current = self.scenes[name]
+
+        with self._lock:
+            job = self._pending.pop(name, None)
+        if job is not None:
+            scene = job[0].result()
+        else:
+            scene = self._build(name, self._saved.pop(name, None))
+
+        self.loaded[name] = scene
+        for cb in self.on_load:
+            cb(name, scene)
+        self._evict(protect=name)
+        return scene
+
+    def _prefetch_neighbours(self):
+        if self._executor is None:
+            return
+        targets = {t for _, t, _ in self.current.portals if t not in self.loaded and t in self._factories}
+        with self._lock:
+            # prefetches for scenes we walked away from: drop them, their state goes back
+            for name in [n for n in self._pending if n not in targets]:
+                future, state = self._pending.pop(name)
+                future.cancel()
+                if state is not None:
+                    self._saved[name] = state
+            for target in targets:
+                if target not in self._pending:
+                    # the saved state moves into the job; get() collects the finished scene
+                    state = self._saved.pop(target, None)
+                    self._pending[target] = (self._executor.submit(self._build, target, state), state)
+
+    def _evict(self, protect: Optional[str] = None):
+        """
+        Unload least recently used scenes until within budget. Never the current scene nor
+        `protect` (a scene get() just loaded that switch() is about to make current).
+        """
+        while len(self.loaded) > 1:
+            over_count = len(self.loaded) > self.max_loaded
+            over_memory = self.memory_budget and sum(s.memory_estimate() for s in self.loaded.values()) > self.memory_budget
+            if not (over_count or over_memory):
+                return
+            name = next((n for n, s in self.loaded.items() if s is not self.current and n != protect), None)
+            if name is None:
+                return
+            self.unload(name)
+
+    def unload(self, name: str):
+        """Drop a loaded scene, keeping what save_state() returns for the next load."""
+        scene = self.loaded.pop(name, None)
+        if scene is None:
+            return
+        state = scene.save_state()
+        if state is not None:
+            self._saved[name] = state
+        for cb in self.on_unload:
+            cb(name, scene)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # ---- switching ----
+
+    def switch(self, name, player, spawn=None):
+        self.current = self.get(name)
         # place player at the new spawn
         player.position = spawn if spawn else self.current.spawn
+        self._evict()
+        self._prefetch_neighbours()
 
-    def cubes(self) -> list[Block]:
+    def cubes(self) -> BlockGrid:
         return self.current.cubes
@@ -1,6 +1,10 @@
-import pygame, math, random, configparser
-from mine import Block
+import pygame, math, random, zlib
+from mine import Block, BlockGrid
+from systems.mine_generator import MineLayout, MineParams, EMPTY
+from systems.config import Config, config_store
+import numpy as np
 from helper import draw_text_in_rect
+from ui.fonts import get_font, render_text
 
 from classes.items.materials import *
 from classes.items.item import Item
@@ -9,26 +13,155 @@ from classes.player.main import Player
 
 import pygame
 
+# Transparent color of the prerendered block layer. Plain colorkey, no RLEACCEL: an RLE surface is
+# re-encoded in full on the first blit after every dirty-rect repaint, which costs more than it saves
+BLOCK_LAYER_KEY = (255, 0, 254)
+# Rough bytes per built Block (object, Rect, Item, metadata dict) for memory estimates
+BLOCK_BYTES = 400
+
 class SceneBase:
     def __init__(self, name, spawn=(100,100), min_rank_id: str | None = None):
         self.name = name
         self.spawn = spawn
         self.min_rank_id = min_rank_id # if set, player must have this rank or higher to enter
-        self.config = configparser.ConfigParser()
-        self.settings = configparser.ConfigParser()
-        self.cubes: list[Block] = []
+        # snapshot at construction: a config reload applies to scenes built after it
+        self.config: Config = config_store.current
+        self.cubes: BlockGrid = BlockGrid()
         self.portals = []  # list of (rect, target_scene_name, target_spawn)
+        self.seed: int | None = None  # seed of the generated mine, if the scene has one
+        self.mine_params: MineParams | None = None
+        self.mine_origin = None
+
+        # All blocks prerendered into one surface; repainted per dirty rect (see BlockGrid.take_dirty)
+        self._block_layer: pygame.Surface | None = None
+        self._block_layer_grid: BlockGrid | None = None
 
-        self.config.read('config.ini')
-        self.settings.read('settings.ini')
+        # Scenes lay out against the configured window size, not the live display,
+        # so they also load in headless runs (see headless.py)
+        self.screen_size = self.config.display.size
 
     def load(self):
         """(Re)create blocks/portals for this scene."""
         pass
 
+    def mine_seed(self) -> int:
+        """
+        Seed for this scene's mine: [game.mines] seed (mixed with the scene name so mines
+        differ) when configured, otherwise a fresh one from `random`.
+        """
+        seed = self.config.mines.seed
+        if seed is None:
+            return random.getrandbits(32)
+        return (seed + zlib.crc32(self.name.encode())) & 0xFFFFFFFF
+
+    def generate_mine(self, params: MineParams, origin, seed: int | None = None) -> MineLayout:
+        """
+        Attach a generated ore layout to self.cubes with its top-left block at origin (px).
+        The params/origin are kept so the mine can be regenerated (see systems/mine_reset.py).
+        """
+        self.mine_params = params
+        self.mine_origin = origin
+        layout = self.new_mine_layout(seed)
+        self.cubes.attach(layout)
+        return layout
+
+    def new_mine_layout(self, seed: int | None = None) -> MineLayout:
+        """
+        A fresh layout for this scene's mine (not attached). Only reproducible seeds
+        (configured or passed in) go through the on-disk cache.
+        """
+        fixed = seed is not None or self.config.mines.seed is not None
+        cache_dir = self.config.mines.layout_cache
+        self.seed = self.mine_seed() if seed is None else seed
+        return MineLayout.generate(self.seed, self.mine_params, self.mine_origin, self.cubes.cell_size,
+                                   cache_dir if fixed and cache_dir else None)
+
+    def mine_rect(self) -> pygame.Rect | None:
+        """Pixel area of the generated mine, or None if the scene has none."""
+        if self.mine_params is None:
+            return None
+        cs = self.cubes.cell_size
+        return pygame.Rect(self.mine_origin[0], self.mine_origin[1],
+                           self.mine_params.cols * cs, self.mine_params.rows * cs)
+
+    # ---- unloading (see SceneManager) ----
+
+    def save_state(self):
+        """
+        What has to survive an unload: for a generated mine, the seed and its cells as a
+        uint8 array (index into the ore list, EMPTY where mined). Other scenes rebuild
+        fully from load(), so they return None.
+        """
+        if self.mine_params is None:
+            return None
+        return {"seed": self.seed, "mine": self.mine_grid()}
+
+    def mine_grid(self) -> np.ndarray:
+        """
+        The mine's cells as a (rows, cols) uint8 array of ore indexes, EMPTY where mined:
+        the attached layout's unbuilt cells in one array op, then the blocks already built.
+        """
+        params = self.mine_params
+        cs = self.cubes.cell_size
+        ox, oy = self.mine_origin[0] // cs, self.mine_origin[1] // cs
+        rows, cols = params.rows, params.cols
+
+        layout = self.cubes.layout
+        if layout is not None and layout.origin_cell == (ox, oy) and layout.grid.shape == (rows, cols):
+            grid = layout.pending_grid()
+        else:
+            grid = np.full((rows, cols), EMPTY, dtype=np.uint8)
+
+        index = {m.id: i for i, (m, _) in enumerate(params.ores)}
+        built = [(cy - oy, cx - ox, index.get(block.item.material.id, EMPTY))
+                 for (cx, cy), block in self.cubes.built_cells()
+                 if 0 <= cx - ox < cols and 0 <= cy - oy < rows]
+        if built:
+            r, c, v = np.array(built, dtype=np.int64).T
+            grid[r, c] = v
+        return grid
+
+    def restore_state(self, state):
+        """Re-apply save_state() output after load()."""
+        if not state or self.mine_params is None:
+            return
+        self.seed = state["seed"]
+        self.cubes.detach()
+        self.cubes.attach(MineLayout(state["mine"], tuple(m for m, _ in self.mine_params.ores),
+                                     self.mine_origin, self.cubes.cell_size))
+
+    def memory_estimate(self) -> int:
+        """Approximate bytes held by this scene (block layer surface + blocks)."""
+        layer = self._block_layer
+        layer_bytes = layer.get_width() * layer.get_height() * layer.get_bytesize() if layer else 0
+        return layer_bytes + len(self.cubes) * BLOCK_BYTES
+
+    def _update_block_layer(self, size):
+        layer = self._block_layer
+        dirty_all, dirty = self.cubes.take_dirty()
+
+        # load() swaps in a new grid, so a different grid object means a full repaint too
+        if layer is None or layer.get_size() != size or self._block_layer_grid is not self.cubes:
+            layer = self._block_layer = pygame.Surface(size)
+            layer.set_colorkey(BLOCK_LAYER_KEY)
+            self._block_layer_grid = self.cubes
+            dirty_all = True
+
+        if dirty_all:
+            layer.fill(BLOCK_LAYER_KEY)
+            self.cubes.paint(layer)     # leaves a lazy mine's blocks unbuilt
+            return
+
+        for rect in dirty:
+            layer.set_clip(rect)
+            layer.fill(BLOCK_LAYER_KEY, rect)
+            for cube in self.cubes.query(rect):
+                layer.blit(cube.image, cube.rect)
+        layer.set_clip(None)
+
     def draw(self, screen, player: Player):
-        for cube in self.cubes:
-            screen.blit(cube.image, cube.rect)
+        self._update_block_layer(screen.get_size())
+        screen.blit(self._block_layer, (0, 0))
         # Show portals and their titles
         for p in self.portals:
             r = p[0]
@@ -49,19 +182,19 @@ class SceneBase:
             )
 
         # A title at the top
-        font = pygame.font.SysFont("robotomono", 36)
-        text = font.render(self.name.upper().replace('_', ' '), True, (255, 255, 255))
+        font = get_font("robotomono", 36)
+        text = render_text(font, self.name.upper().replace('_', ' '), (255, 255, 255))
         screen.blit(text, (screen.get_width()//2 - text.get_width()//2, 10))
 
         # Balance at the bottom right
-        font = pygame.font.SysFont("robotomono", 24)
-        text = font.render(f"Balance: ${player.money}", True, (255, 255, 0))
+        font = get_font("robotomono", 24)
+        text = render_text(font, f"Balance: ${player.money}", (255, 255, 0))
         screen.blit(text, (screen.get_width() - text.get_width() - 10, screen.get_height() - text.get_height() - 10))
 
     def update(self, player):
         """Return (next_scene_name, next_spawn) if a portal is touched, else (None, None)."""
         px, py = player.position
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
+        cube_size = self.config.mines.block_size
         
         player_rect = pygame.Rect(px, py, cube_size, cube_size)
         for rect, target, target_spawn in self.portals:
@@ -76,17 +209,17 @@ class HubScene(SceneBase):
         super().__init__("hub", spawn=(100, 335), min_rank_id=None)
 
     def load(self):
-        self.cubes = []
         # flat grass, some decor
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
-        portal_width = int(self.config.get('game.portals', 'portal_width', fallback=50))
-        portal_height = int(self.config.get('game.portals', 'portal_height', fallback=700))
+        cube_size = self.config.mines.block_size
+        self.cubes = BlockGrid(cube_size)
+        portal_width = self.config.portals.portal_width
+        portal_height = self.config.portals.portal_height
 
         for x in range(0, 1300, 50):
             item = Item(DIRT, 1, {"indestructable": True, "decoration": True})
             self.cubes.append(Block(x, 650, cube_size, cube_size, item))  # ground
 
-        corridor_left = pygame.display.get_window_size()[0] - portal_width
+        corridor_left = self.screen_size[0] - portal_width
 
         # Create 3 mine portals on the right side, dividing the height by 3
         portal_height_per_mine = portal_height // 3
@@ -106,17 +239,17 @@ class FurnaceScene(SceneBase):
         super().__init__("furnace_room", spawn=(100, 335), min_rank_id=None)
 
     def load(self):
-        self.cubes = []
         # flat stone floor, some decor
-        cube_size = int(self.config.get('game.mines', 'block_size', fallback=50))
+        cube_size = self.config.mines.block_size
+        self.cubes = BlockGrid(cube_size)
 
         for x in range(0, 1300, 50):
             item = Item(STONE, 1, {"indestructable": True, "decoration": True})
             self.cubes.append(Block(x, 650, cube_size, cube_size, item))  # ground
 
-        portal_width = int(self.config.get('game.portals', 'portal_width', fallback=50))
-        portal_height = int(self.config.get('game.portals', 'portal_height', fallback=700))
-        corridor_left = pygame.display.get_window_size()[0] - portal_width
+        portal_width = self.config.portals.portal_width
+        portal_height = self.config.portals.portal_height
+        corridor_left = self.screen_size[0] - portal_width
 
         portal_hub_rect = pygame.Rect(corridor_left, 0, portal_width, portal_height)
         self.portals = [(portal_hub_rect, "hub", (200, 335))]
\ No newline at end of file
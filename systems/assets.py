@@ -0,0 +1,119 @@
+# systems/assets.py
+import os
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+class AssetManager:
+    """
+    Loads images once and hands out cached, display-converted (and optionally scaled) variants.
+
+    Every variant is keyed by (path, size, alpha). Variants are evicted least-recently-used
+    once their combined pixel memory exceeds budget_bytes. Source files are only touched
+    again by poll_changes(), which reloads anything whose mtime moved (hot reload).
+    """
+    def __init__(self, budget_bytes: int = 32 * 1024 * 1024, poll_interval_ms: int = 1000):
+        self.budget_bytes = budget_bytes
+        self.poll_interval_ms = poll_interval_ms
+        self._variants: "OrderedDict[Tuple[str, Optional[Tuple[int,int]], bool], pygame.Surface]" = OrderedDict()
+        self._sources: Dict[str, pygame.Surface] = {}   # path -> decoded source image
+        self._mtimes: Dict[str, float] = {}             # path -> mtime at load time
+        self._missing: Set[str] = set()                  # paths known not to exist
+        self._bytes = 0
+        self._last_poll = 0
+
+    # ---- public API ----
+
+    def preload(self, path: str, *sizes: Tuple[int,int], alpha: bool = True):
+        """Decode `path` and build the requested variants up front (call after display.set_mode)."""
+        if not sizes:
+            self.get(path, alpha=alpha)
+        for size in sizes:
+            self.get(path, size, alpha=alpha)
+
+    def get(self, path: str, size: Optional[Tuple[int,int]] = None, *, alpha: bool = True) -> pygame.Surface:
+        """Return the cached variant of `path`. Raises FileNotFoundError if the file is missing."""
+        key = (path, tuple(size) if size else None, alpha)
+        surf = self._variants.get(key)
+        if surf is not None:
+            self._variants.move_to_end(key)
+            return surf
+
+        src = self._source(path)
+        surf = src.convert_alpha() if alpha else src.convert()
+        if size and surf.get_size() != tuple(size):
+            surf = pygame.transform.scale(surf, size)
+
+        self._variants[key] = surf
+        self._bytes += self._surface_bytes(surf)
+        self._evict()
+        return surf
+
+    def poll_changes(self, force: bool = False) -> int:
+        """
+        Reload sources whose file mtime changed (rate-limited to poll_interval_ms).
+        Call once per frame; returns the number of reloaded files.
+        """
+        now = pygame.time.get_ticks()
+        if not force and now - self._last_poll < self.poll_interval_ms:
+            return 0
+        self._last_poll = now
+
+        # give missing files another chance
+        self._missing.clear()
+
+        reloaded = 0
+        for path, old_mtime in list(self._mtimes.items()):
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if mtime != old_mtime:
+                self.invalidate(path)
+                reloaded += 1
+        return reloaded
+
+    def invalidate(self, path: str):
+        """Drop the source and every variant of `path`; next get() reloads from disk."""
+        self._sources.pop(path, None)
+        self._mtimes.pop(path, None)
+        for key in [k for k in self._variants if k[0] == path]:
+            self._bytes -= self._surface_bytes(self._variants.pop(key))
+
+    def clear(self):
+        self._variants.clear()
+        self._sources.clear()
+        self._mtimes.clear()
+        self._missing.clear()
+        self._bytes = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return self._bytes
+
+    # ---- internals ----
+
+    def _source(self, path: str) -> pygame.Surface:
+        src = self._sources.get(path)
+        if src is not None:
+            return src
+        if path in self._missing:
+            raise FileNotFoundError(path)
+        try:
+            src = pygame.image.load(path)
+        except FileNotFoundError:
+            self._missing.add(path)
+            raise
+        self._sources[path] = src
+        self._mtimes[path] = os.path.getmtime(path)
+        return src
+
+    def _evict(self):
+        # never evict the variant that was just inserted (last item)
+        while self._bytes > self.budget_bytes and len(self._variants) > 1:
+            _, surf = self._variants.popitem(last=False)
+            self._bytes -= self._surface_bytes(surf)
+
+    @staticmethod
+    def _surface_bytes(surf: pygame.Surface) -> int:
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
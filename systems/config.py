@@ -0,0 +1,253 @@
+# systems/config.py
+import configparser
+import dataclasses
+import os
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+# ---- config.ini ----
+
+@dataclass(frozen=True)
+class DisplayConfig:
+    width: int = 1300
+    height: int = 700
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+@dataclass(frozen=True)
+class PlayerConfig:
+    default_rank: str = "c"
+    walk_speed: int = 1
+
+@dataclass(frozen=True)
+class InventoryConfig:
+    slot_columns: int = 9
+    slot_rows: int = 4
+    slot_size: int = 64
+
+@dataclass(frozen=True)
+class MinesConfig:
+    distance_x: int = 50
+    distance_y: int = 50
+    block_size: int = 50
+    click_cooldown_ms: int = 120
+    seed: Optional[int] = None          # empty in the file = a new layout on every load
+    layout_cache: str = ".cache/mines"
+
+@dataclass(frozen=True)
+class MineResetConfig:
+    interval_s: float = 300.0
+    threshold: float = 0.25
+    budget_ms: float = 2.0
+    blocks_per_tick: int = 64
+
+@dataclass(frozen=True)
+class ScenesConfig:
+    max_loaded: int = 8
+    memory_budget_mb: float = 64.0
+    prefetch: bool = False
+
+@dataclass(frozen=True)
+class ChatConfig:
+    history_size: int = 2000
+
+@dataclass(frozen=True)
+class PortalsConfig:
+    portal_width: int = 50
+    portal_height: int = 700
+
+@dataclass(frozen=True)
+class SaveConfig:
+    path: str = "saves/profile.sav"
+    autosave_s: float = 10.0
+
+# ---- settings.ini ----
+
+@dataclass(frozen=True)
+class DisplaySettings:
+    tick_rate: int = 60
+    fps_cap: int = 144
+    idle_fps: int = 10
+
+@dataclass(frozen=True)
+class Settings:
+    display: DisplaySettings = field(default_factory=DisplaySettings)
+
+@dataclass(frozen=True)
+class Config:
+    """
+    Parsed, typed snapshot of config.ini and settings.ini. Immutable: a reload builds a
+    new Config, so anyone holding one keeps a consistent view.
+    """
+    display: DisplayConfig = field(default_factory=DisplayConfig)
+    player: PlayerConfig = field(default_factory=PlayerConfig)
+    inventory: InventoryConfig = field(default_factory=InventoryConfig)
+    mines: MinesConfig = field(default_factory=MinesConfig)
+    mine_reset: MineResetConfig = field(default_factory=MineResetConfig)
+    scenes: ScenesConfig = field(default_factory=ScenesConfig)
+    chat: ChatConfig = field(default_factory=ChatConfig)
+    portals: PortalsConfig = field(default_factory=PortalsConfig)
+    save: SaveConfig = field(default_factory=SaveConfig)
+    settings: Settings = field(default_factory=Settings)
+
+# dataclass field -> ini section
+CONFIG_SECTIONS = {
+    "display": "game.display",
+    "player": "game.player",
+    "inventory": "game.player.inventory",
+    "mines": "game.mines",
+    "mine_reset": "game.mines.reset",
+    "scenes": "game.scenes",
+    "chat": "game.chat",
+    "portals": "game.portals",
+    "save": "game.save",
+}
+SETTINGS_SECTIONS = {
+    "display": "display",
+}
+
+# ---- parsing ----
+
+def _parse_value(parser: configparser.ConfigParser, section: str, name: str, kind):
+    if kind is bool:
+        return parser.getboolean(section, name)
+    if kind is int:
+        return parser.getint(section, name)
+    if kind is float:
+        return parser.getfloat(section, name)
+    if kind == Optional[int]:
+        raw = parser.get(section, name).strip()
+        return int(raw) if raw else None
+    return parser.get(section, name).strip()
+
+def _parse_section(parser: configparser.ConfigParser, section: str, cls):
+    """cls() with every field present in [section] parsed to its annotated type."""
+    values = {}
+    if parser.has_section(section):
+        for f in dataclasses.fields(cls):
+            if not parser.has_option(section, f.name):
+                continue
+            try:
+                values[f.name] = _parse_value(parser, section, f.name, f.type)
+            except ValueError as e:
+                raise ValueError(f"[{section}] {f.name}: {e}") from None
+    return cls(**values)
+
+def _parse_sections(parser: configparser.ConfigParser, cls, sections: dict):
+    return cls(**{
+        f.name: _parse_section(parser, sections[f.name], f.type)
+        for f in dataclasses.fields(cls) if f.name in sections
+    })
+
+def load_config(config_path: str = "config.ini", settings_path: str = "settings.ini") -> Config:
+    """Parse both files into a Config. Missing files/keys fall back to the defaults above."""
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    settings = configparser.ConfigParser()
+    settings.read(settings_path)
+    return dataclasses.replace(
+        _parse_sections(config, Config, CONFIG_SECTIONS),
+        settings=_parse_sections(settings, Settings, SETTINGS_SECTIONS),
+    )
+
+# ---- shared store with hot reload ----
+
+class ConfigStore:
+    """
+    Holds the current Config, parsed once on first use and shared by every subsystem.
+
+    poll_changes() (once per frame, rate-limited like AssetManager.poll_changes) re-parses
+    when either file's mtime moved and, if the values changed, swaps in the new snapshot
+    and calls subscribers with (new, old). A file that fails to parse keeps the old
+    snapshot.
+
+    Subscribers re-apply what can change live (main.on_config_reload): mining, mine
+    resets, scene limits, game loop rates, walk speed, chat history size, save path and
+    interval. Snapshot-only, applied to what is built after the reload or at the next
+    start: the window size ([game.display]), the inventory shape ([game.player.inventory]),
+    the default rank, [game.scenes] prefetch, and everything a loaded scene laid out
+    (block size, portals, mine seed/cache) -- each scene keeps the snapshot it was
+    built with until it is unloaded. Commands see the current snapshot.
+    """
+    def __init__(self, config_path: str = "config.ini", settings_path: str = "settings.ini",
+                 poll_interval_ms: int = 1000, time_source: Callable[[], int] = pygame.time.get_ticks):
+        self.config_path = config_path
+        self.settings_path = settings_path
+        self.poll_interval_ms = poll_interval_ms
+        self.time_source = time_source
+        self.last_error: Optional[str] = None
+        self._current: Optional[Config] = None
+        self._mtimes: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._subscribers: List[Callable[[Config, Config], None]] = []
+        self._last_poll = 0
+
+    @property
+    def current(self) -> Config:
+        if self._current is None:
+            self.load()
+        return self._current
+
+    def load(self, config_path: Optional[str] = None, settings_path: Optional[str] = None) -> Config:
+        """(Re)read the files, optionally from new paths, and return the new snapshot."""
+        if config_path is not None:
+            self.config_path = config_path
+        if settings_path is not None:
+            self.settings_path = settings_path
+        self._mtimes = self._stat()
+        self._swap(load_config(self.config_path, self.settings_path))
+        self.last_error = None
+        return self._current
+
+    def subscribe(self, fn: Callable[[Config, Config], None]) -> Callable[[Config, Config], None]:
+        """fn(new, old) is called after each reload that changed a value. Usable as a decorator."""
+        self._subscribers.append(fn)
+        return fn
+
+    def unsubscribe(self, fn: Callable[[Config, Config], None]):
+        if fn in self._subscribers:
+            self._subscribers.remove(fn)
+
+    def poll_changes(self, force: bool = False) -> bool:
+        """Reload if a file changed on disk; True if a new snapshot was published."""
+        now = self.time_source()
+        if not force and now - self._last_poll < self.poll_interval_ms:
+            return False
+        self._last_poll = now
+
+        mtimes = self._stat()
+        if mtimes == self._mtimes:
+            return False
+        self._mtimes = mtimes
+        try:
+            new = load_config(self.config_path, self.settings_path)
+        except (configparser.Error, ValueError) as e:
+            self.last_error = str(e)
+            return False
+        self.last_error = None
+        return self._swap(new)
+
+    # ---- internals ----
+
+    def _stat(self) -> Tuple[Optional[float], Optional[float]]:
+        def mtime(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return None
+        return (mtime(self.config_path), mtime(self.settings_path))
+
+    def _swap(self, new: Config) -> bool:
+        old = self._current
+        if new == old:
+            return False
+        self._current = new
+        if old is not None:
+            for fn in list(self._subscribers):
+                fn(new, old)
+        return True
+
+config_store = ConfigStore()
@@ -0,0 +1,84 @@
+# systems/game_loop.py
+import pygame
+from typing import Callable
+
+from systems.config import Settings
+
+class GameLoop:
+    """
+    Fixed-timestep game loop.
+
+    Simulation advances in constant steps of 1/tick_rate seconds, independent of how fast
+    frames are drawn. Rendering happens once per frame and receives `alpha` in [0, 1): how
+    far the clock is into the next tick, for interpolating positions between ticks.
+    Frames are capped at fps_cap (0 = uncapped) and drop to idle_fps while the window is
+    unfocused or minimized.
+    """
+    def __init__(self, clock: pygame.time.Clock, tick_rate: int = 60, fps_cap: int = 144,
+                 idle_fps: int = 10, max_ticks_per_frame: int = 5):
+        self.clock = clock
+        self.tick_rate = max(1, tick_rate)
+        self.dt = 1.0 / self.tick_rate
+        self.fps_cap = max(0, fps_cap)
+        self.idle_fps = max(1, idle_fps)
+        self.max_ticks_per_frame = max(1, max_ticks_per_frame)
+
+        self.focused = True
+        self.running = True
+        self.ticks = 0              # simulation ticks run so far
+        self._accumulator = 0.0
+
+    @classmethod
+    def from_settings(cls, clock: pygame.time.Clock, settings: Settings) -> "GameLoop":
+        """Build from the [display] section of settings.ini."""
+        display = settings.display
+        return cls(clock, tick_rate=display.tick_rate, fps_cap=display.fps_cap, idle_fps=display.idle_fps)
+
+    def apply_settings(self, settings: Settings):
+        """Switch to new rates between frames; the tick accumulator carries over."""
+        display = settings.display
+        self.tick_rate = max(1, display.tick_rate)
+        self.dt = 1.0 / self.tick_rate
+        self.fps_cap = max(0, display.fps_cap)
+        self.idle_fps = max(1, display.idle_fps)
+
+    @property
+    def frame_budget_ms(self) -> float:
+        """Target frame time: the fps cap's, or one tick when uncapped."""
+        return 1000.0 / (self.fps_cap or self.tick_rate)
+
+    @property
+    def idle(self) -> bool:
+        return not self.focused
+
+    def handle_event(self, event):
+        """Track window focus; feed every event through here."""
+        if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED):
+            self.focused = False
+        elif event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED):
+            self.focused = True
+
+    def stop(self):
+        self.running = False
+
+    def run(self, process_input: Callable[[], None], update: Callable[[float], None], render: Callable[[float], None]):
+        """
+        process_input() runs once per frame (events), update(dt) once per simulation tick,
+        render(alpha) once per frame. Call stop() from any of them to end the loop.
+        """
+        while self.running:
+            cap = self.idle_fps if self.idle else self.fps_cap
+            frame_time = self.clock.tick(cap) / 1000.0
+            # don't try to catch up on long stalls (window drag, breakpoint): drop the backlog
+            self._accumulator = min(self._accumulator + frame_time, self.dt * self.max_ticks_per_frame)
+
+            process_input()
+            if not self.running:
+                break
+
+            while self._accumulator >= self.dt:
+                update(self.dt)
+                self.ticks += 1
+                self._accumulator -= self.dt
+
+            render(self._accumulator / self.dt)
@@ -0,0 +1,194 @@
+# systems/mine_generator.py
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from classes.items.item import Item
+from classes.items.materials import Material
+from mine import Block, block_texture
+
+EMPTY = 255                        # cell value for "no block" in saved mine states
+GENERATOR_VERSION = 1              # bump when the algorithm changes so cached layouts are ignored
+DEFAULT_CACHE_DIR = ".cache/mines"
+MAX_CACHED_LAYOUTS = 64
+
+@dataclass(frozen=True)
+class MineParams:
+    """
+    Shape and ore mix of a mine. ores[0] is the base rock; the rest are ores, rarest last.
+    depth_bias: how much an ore's weight grows towards the bottom, scaled by its rarity
+                (0 = same odds on every row, 1 = the rarest ore is twice as common at the bottom).
+    veins:      average number of ore veins stamped on top of the per-cell roll.
+    vein_length: random-walk steps per vein.
+    """
+    cols: int
+    rows: int
+    ores: Tuple[Tuple[Material, float], ...]
+    depth_bias: float = 1.0
+    veins: float = 4.0
+    vein_length: int = 5
+
+    def cache_key(self) -> tuple:
+        return (self.cols, self.rows, tuple((m.id, w) for m, w in self.ores),
+                self.depth_bias, self.veins, self.vein_length)
+
+def generate_grid(seed: int, params: MineParams) -> np.ndarray:
+    """(rows, cols) uint8 array of indexes into params.ores. Same seed and params -> same array."""
+    rng = np.random.default_rng(seed)
+    rows, cols = params.rows, params.cols
+    weights = np.array([w for _, w in params.ores], dtype=np.float64)
+    k = len(weights)
+
+    # per-row odds: rarer ores (higher index) gain weight with depth
+    depth = np.linspace(0.0, 1.0, rows)[:, None] if rows > 1 else np.zeros((1, 1))
+    rarity = np.arange(k) / max(1, k - 1)
+    row_weights = weights[None, :] * (1.0 + params.depth_bias * depth * rarity[None, :])
+    cum = np.cumsum(row_weights / row_weights.sum(axis=1, keepdims=True), axis=1)
+
+    # one uniform roll per cell, mapped through that row's cumulative odds
+    roll = rng.random((rows, cols))
+    grid = (roll[:, :, None] >= cum[:, None, :-1]).sum(axis=2).astype(np.uint8)
+
+    # veins: random walks of each ore, count proportional to its weight, starting deeper
+    if k > 1 and params.veins > 0 and params.vein_length > 0:
+        ore_share = weights[1:] / weights[1:].sum()
+        counts = rng.poisson(params.veins * ore_share)
+        ore_ids = np.repeat(np.arange(1, k, dtype=np.uint8), counts)
+        n = len(ore_ids)
+        if n:
+            starts = np.stack([
+                (np.sqrt(rng.random(n)) * rows).astype(np.int64),   # biased towards the bottom
+                rng.integers(0, cols, n),
+            ], axis=1)
+            steps = rng.integers(-1, 2, (n, params.vein_length, 2))
+            paths = starts[:, None, :] + np.cumsum(steps, axis=1)
+            paths = np.concatenate([starts[:, None, :], paths], axis=1)
+            r = np.clip(paths[:, :, 0], 0, rows - 1).ravel()
+            c = np.clip(paths[:, :, 1], 0, cols - 1).ravel()
+            # ore_ids is sorted, so the rarest ores are written last and win where veins cross
+            grid[r, c] = np.repeat(ore_ids, params.vein_length + 1)
+    return grid
+
+def _cache_path(cache_dir: str, seed: int, params: MineParams) -> str:
+    key = repr((GENERATOR_VERSION, seed, params.cache_key())).encode()
+    return os.path.join(cache_dir, hashlib.sha1(key).hexdigest() + ".npy")
+
+def _prune_cache(cache_dir: str, keep: int):
+    try:
+        files = [os.path.join(cache_dir, f) for f in os.listdir(cache_dir) if f.endswith(".npy")]
+    except OSError:
+        return
+    if len(files) <= keep:
+        return
+    files.sort(key=lambda p: os.path.getmtime(p), reverse=True)
+    for path in files[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def load_grid(seed: int, params: MineParams, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> np.ndarray:
+    """generate_grid() through an on-disk cache keyed by (generator version, seed, params)."""
+    if not cache_dir:
+        return generate_grid(seed, params)
+
+    path = _cache_path(cache_dir, seed, params)
+    try:
+        grid = np.load(path, allow_pickle=False)
+        if grid.shape == (params.rows, params.cols) and grid.dtype == np.uint8:
+            return grid
+    except (OSError, ValueError):
+        pass
+
+    grid = generate_grid(seed, params)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, grid, allow_pickle=False)
+        os.replace(tmp, path)
+        _prune_cache(cache_dir, MAX_CACHED_LAYOUTS)
+    except OSError:
+        pass    # a read-only checkout still gets its mine, just uncached
+    return grid
+
+class MineLayout:
+    """
+    A generated ore grid placed in a scene, handing out Blocks lazily.
+
+    BlockGrid.attach() consults it for cells it hasn't materialized yet, so a mine costs
+    one array at load time and each Block is built the first time something looks at it.
+    """
+    def __init__(self, grid: np.ndarray, materials: Tuple[Material, ...], origin: Tuple[int, int], cell_size: int):
+        """grid cells equal to EMPTY hold no block (a saved, partly mined mine)."""
+        self.grid = grid
+        self.materials = materials
+        self.cell_size = cell_size
+        self.origin_cell = (origin[0] // cell_size, origin[1] // cell_size)
+        self._pending = grid != EMPTY
+        self.remaining = int(self._pending.sum())
+
+    @classmethod
+    def generate(cls, seed: int, params: MineParams, origin: Tuple[int, int], cell_size: int,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> "MineLayout":
+        grid = load_grid(seed, params, cache_dir)
+        return cls(grid, tuple(m for m, _ in params.ores), origin, cell_size)
+
+    def _block(self, r: int, c: int) -> Block:
+        cs = self.cell_size
+        x = (self.origin_cell[0] + c) * cs
+        y = (self.origin_cell[1] + r) * cs
+        return Block(x, y, cs, cs, Item(self.materials[self.grid[r, c]], 1))
+
+    def is_pending(self, cx: int, cy: int) -> bool:
+        """True if cell (cx, cy) belongs to the layout and hasn't been handed out yet."""
+        r = cy - self.origin_cell[1]
+        c = cx - self.origin_cell[0]
+        rows, cols = self.grid.shape
+        return 0 <= r < rows and 0 <= c < cols and bool(self._pending[r, c])
+
+    def material_at(self, cx: int, cy: int) -> Optional[Material]:
+        """Material of a not-yet-built cell, without building it."""
+        if not self.is_pending(cx, cy):
+            return None
+        return self.materials[self.grid[cy - self.origin_cell[1], cx - self.origin_cell[0]]]
+
+    def pending_grid(self) -> np.ndarray:
+        """Copy of grid with every cell already handed out set to EMPTY."""
+        return np.where(self._pending, self.grid, EMPTY).astype(np.uint8)
+
+    def paint_pending(self, surface):
+        """Blit every unbuilt cell's texture onto surface straight from the ore array, building no Blocks."""
+        cs = self.cell_size
+        ox, oy = self.origin_cell
+        rs, cols = np.nonzero(self._pending)
+        textures = [block_texture(m, cs, cs) for m in self.materials]
+        values = self.grid[rs, cols].tolist()
+        surface.blits([(textures[v], ((ox + c) * cs, (oy + r) * cs))
+                       for r, c, v in zip(rs.tolist(), cols.tolist(), values)], doreturn=False)
+
+    def take(self, cx: int, cy: int) -> Optional[Block]:
+        """Materialize the block at grid cell (cx, cy) if it hasn't been yet."""
+        r = cy - self.origin_cell[1]
+        c = cx - self.origin_cell[0]
+        rows, cols = self.grid.shape
+        if not (0 <= r < rows and 0 <= c < cols) or not self._pending[r, c]:
+            return None
+        self._pending[r, c] = False
+        self.remaining -= 1
+        return self._block(r, c)
+
+    def take_all(self) -> List[Block]:
+        """Materialize every block not handed out yet."""
+        rs, cs = np.nonzero(self._pending)
+        self._pending[:] = False
+        self.remaining = 0
+        return [self._block(r, c) for r, c in zip(rs.tolist(), cs.tolist())]
+
+    def counts(self) -> dict:
+        """{material_id: cells} over the whole layout (materialized or not)."""
+        values, counts = np.unique(self.grid, return_counts=True)
+        return {self.materials[v].id: int(n) for v, n in zip(values.tolist(), counts.tolist())}
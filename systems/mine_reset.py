@@ -0,0 +1,206 @@
+# systems/mine_reset.py
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pygame
+
+from systems.config import Config
+from systems.mine_generator import EMPTY
+
+class MineState:
+    """Reset bookkeeping for one mine scene."""
+    def __init__(self, scene, interval_ms: int, threshold: float, now: int):
+        self.scene = scene
+        self.interval_ms = interval_ms
+        self.threshold = threshold
+        self.next_reset_at = now + interval_ms
+        self.resets = 0
+
+        # fill tracking: len(BlockGrid) is O(1), so fill = (len - fixed blocks) / mine cells
+        self._cubes = None
+        self._base = 0
+        self.capacity = 0
+
+        # running refill: the new layout and the next cell index to look at
+        self.layout = None
+        self.cursor = 0
+
+    def sync(self):
+        """Re-derive capacity/base when the scene (re)loaded its grid."""
+        cubes = self.scene.cubes
+        if cubes is self._cubes:
+            return
+        params = self.scene.mine_params
+        self._cubes = cubes
+        self.capacity = params.cols * params.rows
+        # blocks outside the mine (walls, decorations); counted once per grid from the
+        # mine's cell array, since a restored mine may already be partly mined
+        in_mine = int(np.count_nonzero(self.scene.mine_grid() != EMPTY))
+        self._base = len(cubes) - in_mine
+        self.layout = None
+        self.cursor = 0
+
+    @property
+    def fill(self) -> float:
+        """Fraction of mine cells holding a block, O(1)."""
+        self.sync()
+        if not self.capacity:
+            return 1.0
+        return max(0.0, min(1.0, (len(self.scene.cubes) - self._base) / self.capacity))
+
+    @property
+    def resetting(self) -> bool:
+        return self.layout is not None
+
+class MineResetScheduler:
+    """
+    Refills mines on a timer or when they are mined down to a threshold.
+
+    A reset generates a new layout for the mine and then fills its empty cells a slice at
+    a time: each update() spends at most budget_ms placing blocks, so even a huge mine
+    refills over several ticks without a hitch. The player is moved to the scene spawn if
+    they stand in the mine when a reset starts, or walk into a cell as it refills.
+
+    In the scene the player is in, a tick also places at most blocks_per_tick blocks:
+    every placed block is redrawn into the block layer that frame, and budget_ms only
+    bounds the placing.
+
+    Config ([game.mines.reset]): interval_s, threshold (fill fraction, 0 = timer only),
+    budget_ms, blocks_per_tick. A reload changes the budget right away and the timer/threshold of mines
+    registered after it.
+    """
+    CHECK_EVERY = 32   # cells between budget checks
+
+    def __init__(self, config: Config, notifier, time_source=pygame.time.get_ticks):
+        self.notifier = notifier
+        self.time_source = time_source
+        self.apply_config(config)
+        self.mines: Dict[str, MineState] = {}
+        self._timers: Dict[str, tuple] = {}   # (next_reset_at, resets) of unloaded mines
+
+    def apply_config(self, config: Config):
+        reset = config.mine_reset
+        self.interval_ms = int(reset.interval_s * 1000)
+        self.threshold = reset.threshold
+        self.budget_ms = reset.budget_ms
+        self.blocks_per_tick = max(1, reset.blocks_per_tick)
+        self.player_size = config.mines.block_size
+
+    def register(self, scene, interval_ms: Optional[int] = None, threshold: Optional[float] = None) -> MineState:
+        state = MineState(
+            scene,
+            self.interval_ms if interval_ms is None else interval_ms,
+            self.threshold if threshold is None else threshold,
+            self.time_source(),
+        )
+        self.mines[scene.name] = state
+        return state
+
+    def register_all(self, scene_mgr) -> List[MineState]:
+        """
+        Register every loaded scene that has a generated mine, and follow the scene
+        manager's loads/unloads from now on (timers survive an unload).
+        """
+        scene_mgr.on_load.append(self._scene_loaded)
+        scene_mgr.on_unload.append(self._scene_unloaded)
+        return [self._scene_loaded(name, s) for name, s in scene_mgr.loaded.items() if s.mine_params is not None]
+
+    def _scene_loaded(self, name, scene) -> Optional[MineState]:
+        if scene.mine_params is None:
+            return None
+        state = self.register(scene)
+        timer = self._timers.pop(scene.name, None)
+        if timer is not None:
+            state.next_reset_at, state.resets = timer
+        return state
+
+    def _scene_unloaded(self, name, scene):
+        state = self.mines.pop(scene.name, None)
+        if state is not None:
+            self._timers[scene.name] = (state.next_reset_at, state.resets)
+
+    def fill(self, scene_name: str) -> Optional[float]:
+        state = self.mines.get(scene_name)
+        return state.fill if state else None
+
+    # ---- resets ----
+
+    def reset(self, scene_name: str, player=None, scene_mgr=None) -> bool:
+        """Start a reset now (no-op if one is already running). Returns True if started."""
+        state = self.mines.get(scene_name)
+        if state is None or state.resetting:
+            return False
+        state.sync()
+        state.layout = state.scene.new_mine_layout()
+        state.cursor = 0
+        state.resets += 1
+        state.next_reset_at = self.time_source() + state.interval_ms
+
+        if player is not None and scene_mgr is not None and scene_mgr.current is state.scene:
+            self.notifier.push("Mine is resetting!", level="info")
+            mine = state.scene.mine_rect()
+            if mine.colliderect(self._player_rect(player)):
+                self._move_to_safety(player, state.scene)
+        return True
+
+    def _player_rect(self, player) -> pygame.Rect:
+        x, y = player.position
+        return pygame.Rect(int(x), int(y), self.player_size, self.player_size)
+
+    def _move_to_safety(self, player, scene):
+        player.position = scene.spawn
+        player.prev_position = scene.spawn     # snap, don't interpolate across the mine
+        self.notifier.push("You were moved out of the mine", level="warning")
+
+    def _refill_step(self, state: MineState, deadline: float, player, in_scene: bool) -> bool:
+        """Place blocks into empty cells until the deadline; True when the mine is full again."""
+        layout = state.layout
+        cubes = state.scene.cubes
+        rows, cols = layout.grid.shape
+        ox, oy = layout.origin_cell
+        total = rows * cols
+        player_rect = self._player_rect(player) if in_scene and player is not None else None
+        limit = self.blocks_per_tick if in_scene else total
+
+        placed = []
+        i = state.cursor
+        while i < total:
+            r, c = divmod(i, cols)
+            cx, cy = ox + c, oy + r
+            if not cubes.occupied(cx, cy):
+                block = layout.take(cx, cy)
+                if block is not None:
+                    if player_rect is not None and block.rect.colliderect(player_rect):
+                        self._move_to_safety(player, state.scene)
+                        player_rect = self._player_rect(player)
+                    placed.append(block)
+            i += 1
+            if len(placed) >= limit:
+                break
+            if i % self.CHECK_EVERY == 0 and time.perf_counter() >= deadline:
+                break
+        cubes.extend(placed)
+        state.cursor = i
+        if i >= total:
+            state.layout = None
+            return True
+        return False
+
+    def update(self, scene_mgr, player=None):
+        """Call once per simulation tick: starts due resets and advances running refills."""
+        now = self.time_source()
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        for name, state in self.mines.items():
+            if not state.resetting:
+                due = now >= state.next_reset_at
+                drained = state.threshold > 0 and state.fill <= state.threshold
+                if not (due or drained):
+                    continue
+                self.reset(name, player, scene_mgr)
+
+            in_scene = scene_mgr.current is state.scene
+            if time.perf_counter() >= deadline:
+                break    # budget spent; continue next tick
+            if self._refill_step(state, deadline, player, in_scene) and in_scene:
+                self.notifier.push("Mine has been reset", level="success")
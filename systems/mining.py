@@ -5,14 +5,22 @@ from typing import Optional
 from classes.player.main import Player
 from rooms.scene_manager import SceneManager
 from mine import Block
+from systems.profiler import profiler
+from systems.config import Config
 
 class MiningSystem:
-    def __init__(self, config, notifier):
-        self.config = config
+    def __init__(self, config: Config, notifier, time_source=pygame.time.get_ticks):
+        """time_source() returns milliseconds; headless runs pass a simulated clock."""
         self.notifier = notifier
+        self.time_source = time_source
         self._is_mouse_down = False
         self._last_mine_time = 0
-        self._cooldown_ms = self.config.getint('game.mines', 'click_cooldown_ms', fallback=120)
+        self.apply_config(config)
+
+    def apply_config(self, config: Config):
+        """Take cooldown/reach/grid values from a (reloaded) config snapshot."""
+        self.config = config
+        self._cooldown_ms = config.mines.click_cooldown_ms
 
     # Optional: call this every frame if you prefer polling-style
     def update(self, player, scene_mgr):
@@ -25,78 +33,77 @@ class MiningSystem:
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             self._is_mouse_down = True
-            return self._try_mine_now(player, scene_mgr)
+            return self._try_mine_now(player, scene_mgr, event.pos)
 
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             self._is_mouse_down = False
 
         return False
 
+    def mine_at(self, player: Player, scene_mgr: SceneManager, pos) -> bool:
+        """Mine the block under screen position pos, as a left click there would."""
+        if not scene_mgr.current:
+            return False
+        return self._try_mine_now(player, scene_mgr, pos)
+
     # ---- internals ----
 
-    def _try_mine_now(self, player: Player, scene_mgr: SceneManager) -> bool:
+    @profiler.timed("mining")
+    def _try_mine_now(self, player: Player, scene_mgr: SceneManager, pos=None) -> bool:
         # cooldown
-        now = pygame.time.get_ticks()
+        now = self.time_source()
         if now - self._last_mine_time < self._cooldown_ms:
             return False
         self._last_mine_time = now
 
         # snap mouse to grid
-        block_size = self.config.getint('game.mines', 'block_size', fallback=50)
-        mx, my = pygame.mouse.get_pos()
+        mines = self.config.mines
+        block_size = mines.block_size
+        mx, my = pos if pos is not None else pygame.mouse.get_pos()
         gx = (mx // block_size) * block_size
         gy = (my // block_size) * block_size
 
         # reach check
-        reach_x = self.config.getint('game.mines', 'distance_x', fallback=50)
-        reach_y = self.config.getint('game.mines', 'distance_y', fallback=50)
-
-        # search target block
-        cubes = scene_mgr.cubes().copy()
-        for cube in cubes:
-            if cube.rect.collidepoint(gx, gy):
-                px, py = player.position
-                in_reach = (
-                    int(px) in range(cube.rect.left - reach_x, cube.rect.right + reach_x + 1) and
-                    int(py) in range(cube.rect.top  - reach_y, cube.rect.bottom + reach_y + 1)
-                )
-                print(f"Mining attempt at ({gx}, {gy}), player at ({px}, {py}), in_reach={in_reach}")
-                if not in_reach:
-                    self.notifier.push("Too far away to mine!", "warning")
-                    return True
-
-                # indestructible?
-                if getattr(cube.item, "metadata", {}).get("indestructable", False):
-                    self.notifier.push("Block is indestructable", "warning")
-                    return True
-
-                # collect drops
-                drops = cube.get_drops()
-                ok, leftover = player.inventory.add_item(drops)
-
-                # remove block from scene
-                try:
-                    scene_mgr.current.cubes.remove(cube)
-                except ValueError:
-                    pass
-
-                # feedback
-                try:
-                    # handle either Item or list[Item]
-                    if isinstance(drops, list):
-                        name = drops[0].material.name
-                        qty  = sum(d.quantity for d in drops)
-                    else:
-                        name = drops.material.name
-                        qty  = drops.quantity
-                    self.notifier.push(f"Picked up {name} x{qty}", "success")
-                    player.stats.blocks_mined += qty
-                except Exception:
-                    pass
-
-                if not ok:
-                    self.notifier.push("Inventory full (some items not added)", "warning")
-
-                return True
+        reach_x, reach_y = mines.distance_x, mines.distance_y
 
-        return False
+        # look up target block by grid cell
+        cube = scene_mgr.cubes().at(gx, gy)
+        if cube is None:
+            return False
+
+        px, py = player.position
+        in_reach = (
+            int(px) in range(cube.rect.left - reach_x, cube.rect.right + reach_x + 1) and
+            int(py) in range(cube.rect.top  - reach_y, cube.rect.bottom + reach_y + 1)
+        )
+        if not in_reach:
+            self.notifier.push("Too far away to mine!", "warning")
+            return True
+
+        # indestructible?
+        if getattr(cube.item, "metadata", {}).get("indestructable", False):
+            self.notifier.push("Block is indestructable", "warning")
+            return True
+
+        # collect drops (Item or list[Item]) atomically: if they don't all fit, the block stays
+        drops = cube.get_drops()
+        drops = drops if isinstance(drops, list) else [drops]
+        ok, _ = player.inventory.apply([(d.material, d.quantity) for d in drops])
+        if not ok:
+            self.notifier.push("Inventory full", "warning")
+            return True
+
+        # remove block from scene (O(1) for grid-aligned blocks)
+        try:
+            scene_mgr.current.cubes.remove(cube)
+        except ValueError:
+            pass
+
+        # feedback
+        if drops:
+            name = drops[0].material.name
+            qty  = sum(d.quantity for d in drops)
+            self.notifier.push(f"Picked up {name} x{qty}", "success")
+            player.stats.blocks_mined += qty
+
+        return True
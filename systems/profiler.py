@@ -0,0 +1,174 @@
+# systems/profiler.py
+import json
+import os
+import time
+from collections import deque
+from functools import wraps
+from typing import Deque, Dict, Optional, Tuple
+
+class _NullSection:
+    """Shared do-nothing context manager handed out while profiling is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._add(self.name, time.perf_counter() - self.start)
+        return False
+
+class Profiler:
+    """
+    Per-frame section timer with rolling percentiles.
+
+        with profiler.section("draw.chat"):
+            chat.draw(screen)
+
+        @profiler.timed("mining")
+        def handle_event(...): ...
+
+    Time spent in a section is summed per frame (a section hit by several sim ticks counts
+    once), then kept over the last `window` frames. begin_frame()/end_frame() bracket the
+    work of one frame. While `enabled` is False every call is a flag check and a shared
+    no-op context manager, so the instrumentation can stay in place.
+    """
+    def __init__(self, window: int = 300, stats_every: int = 15):
+        self.enabled = False
+        self.window = window
+        self.stats_every = stats_every   # frames between percentile refreshes
+
+        self.frame_times: Deque[float] = deque(maxlen=window)   # ms per frame
+        self._samples: Dict[str, Deque[float]] = {}             # section -> ms per frame
+        self._current: Dict[str, float] = {}                    # seconds, this frame
+        self._frame_start: Optional[float] = None
+        self._frames = 0
+        self._stats: Dict[str, Tuple[float, float, float]] = {}
+        self._stats_frame = -1
+
+    # ---- switching ----
+
+    def set_enabled(self, enabled: bool):
+        """Turning it off drops the history so stale numbers aren't shown when it comes back."""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if not enabled:
+            self.reset()
+
+    def reset(self):
+        self.frame_times.clear()
+        self._samples.clear()
+        self._current.clear()
+        self._frame_start = None
+        self._stats = {}
+        self._stats_frame = -1
+
+    # ---- instrumentation ----
+
+    def section(self, name: str):
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def timed(self, name: str):
+        """Decorator form of section()."""
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._add(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def _add(self, name: str, seconds: float):
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            self._current.clear()
+            return
+        self.frame_times.append((time.perf_counter() - self._frame_start) * 1000.0)
+        self._frame_start = None
+
+        # sections not hit this frame record 0 so all windows stay frame-aligned
+        for name in self._samples.keys() - self._current.keys():
+            self._samples[name].append(0.0)
+        for name, seconds in self._current.items():
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(seconds * 1000.0)
+        self._current.clear()
+        self._frames += 1
+
+    # ---- results ----
+
+    @staticmethod
+    def percentiles(samples, qs=(50, 95, 99)) -> Tuple[float, ...]:
+        """Nearest-rank percentiles of samples (0.0 each when empty)."""
+        if not samples:
+            return tuple(0.0 for _ in qs)
+        ordered = sorted(samples)
+        n = len(ordered)
+        return tuple(ordered[min(n - 1, max(0, -(-q * n // 100) - 1))] for q in qs)
+
+    def stats(self) -> Dict[str, Tuple[float, float, float]]:
+        """{section: (p50, p95, p99) ms}, with "frame" first. Refreshed every stats_every frames."""
+        if self._stats_frame < 0 or self._frames - self._stats_frame >= self.stats_every:
+            stats = {"frame": self.percentiles(self.frame_times)}
+            for name in sorted(self._samples):
+                stats[name] = self.percentiles(self._samples[name])
+            self._stats = stats
+            self._stats_frame = self._frames
+        return self._stats
+
+    def dump(self, path: str) -> str:
+        """Write stats and the raw per-frame samples as JSON; returns the path."""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._stats_frame = -1
+        data = {
+            "frames": len(self.frame_times),
+            "window": self.window,
+            "percentiles_ms": {name: dict(zip(("p50", "p95", "p99"), (round(p, 3) for p in ps)))
+                               for name, ps in self.stats().items()},
+            "frame_ms": [round(ms, 3) for ms in self.frame_times],
+            "sections_ms": {name: [round(ms, 3) for ms in samples] for name, samples in self._samples.items()},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+    @property
+    def frame_count(self) -> int:
+        """Frames recorded since start (keeps counting across reset())."""
+        return self._frames
+
+# Shared instance: subsystems time themselves against this one
+profiler = Profiler()
@@ -0,0 +1,337 @@
+# systems/save.py
+import os
+import struct
+import sys
+import zlib
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import pygame
+
+from classes.items.materials import get_material
+from systems.config import Config
+
+MAGIC = b"PXSV"
+FORMAT_VERSION = 1
+
+# v1 layout, little-endian:
+#   header   4s magic, u16 version
+#   player   q money, q gems, q blocks_mined, q money_earned, q blocks_walked, u16 slot_count, u16 slot_size
+#   rank     u8 length + utf-8 id
+#   ids      u16 count, then count x (u8 length + utf-8 material id)   -- interned material ids
+#   slots    u16 count, then u16[count] slot index, u16[count] id index, u32[count] quantity
+#   trailer  u32 crc32 of everything above
+_HEADER = struct.Struct("<4sH")
+_PLAYER = struct.Struct("<qqqqqHH")
+_COUNT = struct.Struct("<H")
+_CRC = struct.Struct("<I")
+
+class SaveError(Exception):
+    """A save file that can't be read: wrong magic/version, truncated or corrupt."""
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """
+    Everything a save holds, copied out of the Player as plain values, so it can be
+    serialized on another thread while the game keeps mutating the player.
+    slots: ((slot_index, material_id, quantity), ...) for the occupied slots.
+    """
+    money: int
+    gems: int
+    rank_id: str
+    stats: Tuple[int, int, int]   # blocks_mined, money_earned, blocks_walked
+    slot_count: int
+    slot_size: int
+    slots: Tuple[Tuple[int, str, int], ...]
+    inventory_version: int = field(default=-1, compare=False)
+
+    @classmethod
+    def capture(cls, player, previous: Optional["ProfileSnapshot"] = None) -> "ProfileSnapshot":
+        """
+        Snapshot player. The slot tuple of `previous` is reused when the inventory version
+        hasn't moved, so a capture between inventory changes is a handful of attribute reads.
+        """
+        inv = player.inventory
+        if previous is not None and previous.inventory_version == inv.version:
+            slots = previous.slots
+        else:
+            slots = tuple((s.index, s.item.material.id, s.item.quantity) for s in inv.slots if s.item is not None)
+        stats = player.stats
+        return cls(
+            money=int(player.money),
+            gems=int(player.gems),
+            rank_id=player.rank.id if player.rank else "",
+            stats=(int(stats.blocks_mined), int(stats.money_earned), int(stats.blocks_walked)),
+            slot_count=len(inv.slots),
+            slot_size=inv.slots[0].slot_size if inv.slots else 0,
+            slots=slots,
+            inventory_version=inv.version,
+        )
+
+    def apply(self, player) -> List:
+        """Load into player; returns items that no longer fit (smaller inventory, unknown material ids are dropped)."""
+        player.money = self.money
+        player.gems = self.gems
+        rank = player.rank_manager.get(self.rank_id)
+        if rank is not None:
+            player.rank = rank
+        player.stats.blocks_mined, player.stats.money_earned, player.stats.blocks_walked = self.stats
+        contents = []
+        for idx, material_id, qty in self.slots:
+            material = get_material(material_id)
+            if material is not None:
+                contents.append((idx, material, qty))
+        return player.inventory.restore(contents)
+
+# ---- encoding ----
+
+def _le(arr: array) -> bytes:
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+def _from_le(typecode: str, data: bytes) -> array:
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+def _pack_str(s: str) -> bytes:
+    raw = s.encode("utf-8")
+    if len(raw) > 255:
+        raise ValueError(f"id too long to save: {s!r}")
+    return bytes((len(raw),)) + raw
+
+def encode(snap: ProfileSnapshot) -> bytes:
+    ids: List[str] = []
+    index = {}
+    id_refs = array("H")
+    for _, material_id, _ in snap.slots:
+        ref = index.get(material_id)
+        if ref is None:
+            ref = index[material_id] = len(ids)
+            ids.append(material_id)
+        id_refs.append(ref)
+
+    parts = [
+        _HEADER.pack(MAGIC, FORMAT_VERSION),
+        _PLAYER.pack(snap.money, snap.gems, *snap.stats, snap.slot_count, snap.slot_size),
+        _pack_str(snap.rank_id),
+        _COUNT.pack(len(ids)),
+        *(_pack_str(i) for i in ids),
+        _COUNT.pack(len(snap.slots)),
+        _le(array("H", (s[0] for s in snap.slots))),
+        _le(id_refs),
+        _le(array("I", (s[2] for s in snap.slots))),
+    ]
+    body = b"".join(parts)
+    return body + _CRC.pack(zlib.crc32(body))
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def take(self, n: int) -> bytes:
+        if self.pos + n > len(self.data):
+            raise SaveError("save file is truncated")
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return chunk
+
+    def unpack(self, st: struct.Struct) -> tuple:
+        return st.unpack(self.take(st.size))
+
+    def string(self) -> str:
+        try:
+            return self.take(self.take(1)[0]).decode("utf-8")
+        except UnicodeDecodeError:
+            raise SaveError("save file is corrupt (bad id)") from None
+
+    def array(self, typecode: str, count: int) -> array:
+        return _from_le(typecode, self.take(count * array(typecode).itemsize))
+
+def decode(data: bytes) -> ProfileSnapshot:
+    if len(data) < _HEADER.size + _CRC.size:
+        raise SaveError("save file is truncated")
+    body, (crc,) = data[:-_CRC.size], _CRC.unpack(data[-_CRC.size:])
+    magic, version = _HEADER.unpack_from(body)
+    if magic != MAGIC:
+        raise SaveError("not a save file")
+    if version != FORMAT_VERSION:
+        raise SaveError(f"unsupported save version {version}")
+    if zlib.crc32(body) != crc:
+        raise SaveError("save file is corrupt (checksum mismatch)")
+
+    r = _Reader(body)
+    r.pos = _HEADER.size
+    money, gems, mined, earned, walked, slot_count, slot_size = r.unpack(_PLAYER)
+    rank_id = r.string()
+    (n_ids,) = r.unpack(_COUNT)
+    ids = [r.string() for _ in range(n_ids)]
+    (n_slots,) = r.unpack(_COUNT)
+    slot_idx = r.array("H", n_slots)
+    id_refs = r.array("H", n_slots)
+    qtys = r.array("I", n_slots)
+    try:
+        slots = tuple((i, ids[ref], q) for i, ref, q in zip(slot_idx, id_refs, qtys))
+    except IndexError:
+        raise SaveError("save file is corrupt (bad material index)") from None
+    return ProfileSnapshot(money, gems, rank_id, (mined, earned, walked), slot_count, slot_size, slots)
+
+# ---- files ----
+
+def write_atomic(path: str, data: bytes):
+    """Write to a temp file, fsync, then rename over path: a crash leaves the old or the new save, never half of one."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:
+        # make the rename itself durable (POSIX; not possible on Windows)
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def save_profile(path: str, snap: ProfileSnapshot):
+    write_atomic(path, encode(snap))
+
+def load_profile(path: str) -> Optional[ProfileSnapshot]:
+    """The saved snapshot, or None if there is no save yet. Raises SaveError for unreadable files."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return decode(data)
+
+# ---- autosave ----
+
+class AutoSaver:
+    """
+    Saves the player every interval on a background thread.
+
+    update() runs on the main thread once per tick: when a save is due it captures a
+    ProfileSnapshot (microseconds; see ProfileSnapshot.capture) and hands it to a single
+    worker that encodes, writes and fsyncs. An unchanged snapshot isn't written again,
+    and a save still in flight is never queued behind, so slow disks skip saves instead
+    of piling them up. Errors are reported through the notifier on the main thread.
+
+    A save that exists but can't be read is never overwritten: load() moves it aside to
+    path + ".corrupt" (another build's version included), and if even that fails saving
+    stays off for the session, so the file is left for the player to recover.
+
+    Config ([game.save]): path, autosave_s (0 = only on close()).
+    """
+    def __init__(self, config: Config, player, notifier, time_source=pygame.time.get_ticks):
+        self.player = player
+        self.notifier = notifier
+        self.time_source = time_source
+        self.apply_config(config)
+        self.saves = 0
+        self.enabled = True
+        self.last_error: Optional[str] = None
+        self._last: Optional[ProfileSnapshot] = None        # last captured
+        self._written: Optional[ProfileSnapshot] = None     # last handed to the writer
+        self._future: Optional[Future] = None
+        self._next_at = self.time_source() + self.interval_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self._executor.submit(int)   # start the worker thread now, not in the middle of the first save
+
+    def apply_config(self, config: Config):
+        self.path = config.save.path
+        self.interval_ms = int(config.save.autosave_s * 1000)
+
+    def load(self) -> bool:
+        """Apply the save at path to the player, if there is one. True if loaded."""
+        try:
+            snap = load_profile(self.path)
+        except SaveError as e:
+            self._set_aside(e)
+            return False
+        except OSError as e:
+            self.enabled = False
+            self.notifier.push(f"Could not read save ({e}); saving is off until restart", level="error")
+            return False
+        if snap is None:
+            return False
+        for item in snap.apply(self.player):
+            self.notifier.push(f"No room for {item} from your save", level="warning")
+        self._written = self._last = ProfileSnapshot.capture(self.player)
+        return True
+
+    def _set_aside(self, error: SaveError):
+        aside = self.path + ".corrupt"
+        try:
+            os.replace(self.path, aside)
+        except OSError:
+            self.enabled = False
+            self.notifier.push(f"Could not load save: {error}; saving is off so it isn't overwritten", level="error")
+            return
+        self.notifier.push(f"Could not load save: {error}; it was moved to {aside}", level="error")
+
+    def _collect(self):
+        future = self._future
+        if future is None or not future.done():
+            return
+        self._future = None
+        error = future.exception()
+        if error is None:
+            self.saves += 1
+            self.last_error = None
+        else:
+            self._written = None      # write it again next time
+            if str(error) != self.last_error:
+                self.notifier.push(f"Autosave failed: {error}", level="error")
+            self.last_error = str(error)
+
+    def update(self):
+        self._collect()
+        if not self.enabled or self.interval_ms <= 0 or self._future is not None:
+            return
+        now = self.time_source()
+        if now < self._next_at:
+            return
+        self._next_at = now + self.interval_ms
+        self.save()
+
+    def save(self) -> bool:
+        """Capture now and write in the background; False if unchanged or a write is running."""
+        self._collect()
+        if not self.enabled or self._future is not None:
+            return False
+        snap = self._last = ProfileSnapshot.capture(self.player, self._last)
+        if snap == self._written:
+            return False
+        self._written = snap
+        self._future = self._executor.submit(save_profile, self.path, snap)
+        return True
+
+    def close(self):
+        """Final synchronous save (after any running one finishes); call before exiting."""
+        if self._future is not None:
+            self._future.exception()   # wait
+            self._collect()
+        self._executor.shutdown(wait=True)
+        if not self.enabled:
+            return
+        snap = ProfileSnapshot.capture(self.player, self._last)
+        if snap != self._written:
+            try:
+                save_profile(self.path, snap)
+                self.saves += 1
+            except (OSError, ValueError, struct.error) as e:
+                # same failures the worker reports through _collect(); never crash shutdown
+                self.last_error = str(e)
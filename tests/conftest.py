@@ -0,0 +1,10 @@
+# tests/conftest.py
+import os
+import sys
+
+# run against the repository root: scenes and the config store read config.ini from the cwd
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
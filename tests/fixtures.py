@@ -0,0 +1,21 @@
+# tests/fixtures.py
+"""Game objects the tests build; the benchmarks reuse them through benchmarks/fixtures.py."""
+from classes.chat.commands.command_handler import CommandRegistry
+from classes.player.main import Player
+from classes.player.ranks import RankManager
+from classes.shop import ShopManager
+from init import GameInit
+from systems.config import config_store
+
+def make_player(res=(1300, 700), config=None) -> Player:
+    """A fresh player on the default rank, with the ranks GameInit registers."""
+    config = config or config_store.current
+    ranks = RankManager()
+    GameInit(ShopManager(), ranks, CommandRegistry())
+    return Player(res, config, config.settings, ranks)
+
+def make_shop_manager() -> ShopManager:
+    """Every shop GameInit registers."""
+    shops = ShopManager()
+    GameInit(shops, RankManager(), CommandRegistry())
+    return shops
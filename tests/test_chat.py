@@ -0,0 +1,74 @@
+# tests/test_chat.py
+import pygame
+
+from ui.chat import ChatUI, MessageHistory
+
+def _history(capacity, n):
+    history = MessageHistory(capacity)
+    for i in range(n):
+        history.append(i)
+    return history
+
+def test_history_keeps_newest():
+    history = _history(3, 5)
+    assert list(history) == [2, 3, 4]
+    assert history[0] == 2 and history[-1] == 4
+
+def test_resize_shrink_drops_oldest():
+    history = _history(5, 7)           # wrapped: holds 2..6
+    dropped = history.resize(3)
+    assert dropped == [2, 3]
+    assert list(history) == [4, 5, 6]
+    assert history.append(7) == 4
+    assert list(history) == [5, 6, 7]
+
+def test_resize_grow_keeps_everything():
+    history = _history(3, 4)
+    assert history.resize(6) == []
+    for i in range(4, 8):
+        history.append(i)
+    assert list(history) == [2, 3, 4, 5, 6, 7]
+
+def test_set_max_messages_drops_rendered():
+    pygame.init()
+    chat = ChatUI(10, 400, 400, 290, max_messages=10)
+    for i in range(10):
+        chat.add_message("Server", f"message {i}")
+    chat.open_chat()
+    chat.draw(pygame.Surface((1300, 700)))
+    assert chat._rendered
+    chat.set_max_messages(4)
+    assert [m['message'] for m in chat.messages] == [f"message {i}" for i in range(6, 10)]
+    live = {m['seq'] for m in chat.messages}
+    assert set(chat._rendered) <= live
+
+def _drawn(chat):
+    """seqs of the messages the last draw() rendered."""
+    chat._rendered.clear()
+    chat.draw(pygame.Surface((1300, 700)))
+    return set(chat._rendered)
+
+def test_scroll_offset_zero_shows_newest():
+    pygame.init()
+    chat = ChatUI(10, 400, 400, 290)
+    for i in range(100):
+        chat.add_message("Server", f"message {i}")
+    chat.open_chat()
+    drawn = _drawn(chat)
+    assert 99 in drawn and 0 not in drawn
+
+    chat.scroll_offset = 10 ** 6          # clamped to the oldest page
+    drawn = _drawn(chat)
+    assert 0 in drawn and 99 not in drawn
+    assert chat.scroll_offset == chat._total_lines() - chat._visible_line_count()
+
+def test_new_message_keeps_scrolled_view():
+    pygame.init()
+    chat = ChatUI(10, 400, 400, 290)
+    for i in range(100):
+        chat.add_message("Server", f"message {i}")
+    chat.open_chat()
+    chat.scroll_offset = 50
+    before = _drawn(chat)
+    chat.add_message("Server", "new")
+    assert _drawn(chat) == before
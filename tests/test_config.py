@@ -0,0 +1,108 @@
+# tests/test_config.py
+import os
+
+import pytest
+
+from systems.config import Config, ConfigStore, load_config
+
+CONFIG = """\
+[game.display]
+width=800
+height=600
+
+[game.mines]
+seed=
+block_size=50
+
+[game.scenes]
+prefetch=yes
+memory_budget_mb=12.5
+"""
+
+SETTINGS = """\
+[display]
+fps_cap=90
+"""
+
+@pytest.fixture
+def files(tmp_path):
+    config, settings = tmp_path / "config.ini", tmp_path / "settings.ini"
+    config.write_text(CONFIG)
+    settings.write_text(SETTINGS)
+    return config, settings
+
+def _store(files):
+    return ConfigStore(str(files[0]), str(files[1]), time_source=lambda: 0)
+
+def test_values_are_parsed_to_their_types(files):
+    config = load_config(*map(str, files))
+    assert config.display.size == (800, 600)
+    assert config.mines.seed is None
+    assert config.scenes.prefetch is True
+    assert config.scenes.memory_budget_mb == 12.5
+    assert config.settings.display.fps_cap == 90
+    # keys and sections missing from the files keep their defaults
+    assert config.chat == Config().chat
+    assert config.settings.display.tick_rate == 60
+
+def test_missing_files_give_the_defaults(tmp_path):
+    assert load_config(str(tmp_path / "nope.ini"), str(tmp_path / "nope2.ini")) == Config()
+
+def test_bad_value_names_its_section(files):
+    files[0].write_text(CONFIG.replace("width=800", "width=wide"))
+    with pytest.raises(ValueError, match=r"\[game.display\] width"):
+        load_config(*map(str, files))
+
+def _touch(path, text):
+    """Write text and move the mtime on, even on filesystems with coarse timestamps."""
+    before = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 2_000_000_000, before + 2_000_000_000))
+
+def test_poll_changes_publishes_and_notifies(files):
+    store = _store(files)
+    old = store.current
+    calls = []
+    store.subscribe(lambda new, prev: calls.append((new, prev)))
+
+    assert not store.poll_changes(force=True)          # nothing changed on disk
+    _touch(files[0], CONFIG.replace("seed=", "seed=42"))
+    assert store.poll_changes(force=True)
+    assert store.current.mines.seed == 42
+    assert calls == [(store.current, old)]
+
+    _touch(files[0], CONFIG.replace("seed=", "seed=42") + "\n; comment only\n")
+    assert not store.poll_changes(force=True)          # same values: no new snapshot
+    assert len(calls) == 1
+
+def test_poll_changes_is_rate_limited(files):
+    now = [5000]
+    store = ConfigStore(str(files[0]), str(files[1]), poll_interval_ms=1000, time_source=lambda: now[0])
+    store.current
+    assert not store.poll_changes()                    # polls, finds nothing new
+    _touch(files[0], CONFIG.replace("width=800", "width=900"))
+    now[0] += 10
+    assert not store.poll_changes()
+    now[0] += 1000
+    assert store.poll_changes()
+    assert store.current.display.width == 900
+
+def test_unparsable_file_keeps_the_old_snapshot(files):
+    store = _store(files)
+    old = store.current
+    calls = []
+    store.subscribe(lambda new, prev: calls.append(new))
+
+    _touch(files[0], CONFIG.replace("height=600", "height=tall"))
+    assert not store.poll_changes(force=True)
+    assert store.current is old
+    assert "height" in store.last_error
+    assert calls == []
+
+    _touch(files[0], CONFIG.replace("[game.display]", "[game.display"))   # broken syntax
+    assert not store.poll_changes(force=True)
+    assert store.current is old and store.last_error
+
+    _touch(files[0], CONFIG.replace("height=600", "height=650"))
+    assert store.poll_changes(force=True)
+    assert store.last_error is None and store.current.display.height == 650
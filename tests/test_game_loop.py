@@ -0,0 +1,26 @@
+# tests/test_game_loop.py
+import dataclasses
+
+import pygame
+
+from systems.config import DisplaySettings, Settings
+from systems.game_loop import GameLoop
+from ui.debug import DebugOverlay
+
+def _settings(**display):
+    return Settings(display=dataclasses.replace(DisplaySettings(), **display))
+
+def test_frame_budget_follows_the_fps_cap():
+    loop = GameLoop.from_settings(pygame.time.Clock(), _settings(fps_cap=144, tick_rate=60))
+    assert loop.frame_budget_ms == 1000.0 / 144
+    loop.apply_settings(_settings(fps_cap=0, tick_rate=30))       # uncapped: one tick
+    assert loop.frame_budget_ms == 1000.0 / 30
+
+def test_debug_graph_uses_the_loop_budget():
+    pygame.init()
+    loop = GameLoop.from_settings(pygame.time.Clock(), _settings(fps_cap=144))
+    debug = DebugOverlay(frame_budget_ms=loop.frame_budget_ms)
+    assert debug.frame_budget_ms == 1000.0 / 144
+    loop.apply_settings(_settings(fps_cap=30))
+    debug.set_frame_budget(loop.frame_budget_ms)
+    assert debug.frame_budget_ms == 1000.0 / 30
@@ -0,0 +1,37 @@
+# tests/test_headless.py
+from headless import HeadlessGame, bot_session
+
+def test_rankup_command_changes_rank():
+    game = HeadlessGame()
+    game.player.money = 1000
+    game.tick(commands=["/rankup"])
+    assert game.player.rank.id == "b"
+    assert game.player.money == 1000 - game.player.rank.price
+    assert game.rankups == 1
+    assert game.rankup_failures == 0
+    assert game.log.errors == []
+
+def test_rankup_without_money_keeps_rank():
+    game = HeadlessGame()
+    game.tick(commands=["/rankup"])
+    assert game.player.rank.id == "c"
+    assert game.rankups == 0
+    assert game.rankup_failures == 0
+    assert game.log.errors == []
+
+def test_broken_rankup_is_reported_not_raised(monkeypatch):
+    game = HeadlessGame()
+    game.player.money = 1000
+    monkeypatch.setattr(game.rank_manager, "can_rank_up", lambda player: (False, "broken", None))
+    game.tick(commands=["/rankup"])
+    game.tick(commands=["/rankup"])
+    assert game.player.rank.id == "c"
+    assert game.summary()["rankup_failures"] == 2
+    assert len(game.log.errors) >= 2
+
+def test_bot_session_is_reproducible():
+    a = bot_session(3, 1200)
+    b = bot_session(3, 1200)
+    assert a == b
+    assert a["errors"] == 0
+    assert a["rankup_failures"] == 0
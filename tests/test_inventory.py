@@ -0,0 +1,90 @@
+# tests/test_inventory.py
+import random
+
+import pytest
+
+from classes.items.item import Item
+from classes.items.materials import DIRT, RAW_DIAMOND, RAW_IRON, STONE
+from classes.player.inventory import PlayerInventory
+
+MATERIALS = (STONE, DIRT, RAW_IRON, RAW_DIAMOND)
+
+def _contents(inv):
+    return [(s.index, s.item.material.id, s.item.quantity) for s in inv.slots if s.item]
+
+def assert_indexes(inv):
+    """_totals/_holding/_room/_free must match what a scan of the slots gives."""
+    totals, holding, room = {}, {}, {}
+    for slot in inv.slots:
+        if slot.item is None:
+            assert slot.index in inv._free, f"empty slot {slot.index} missing from _free"
+            continue
+        mid = slot.item.material.id
+        assert 0 < slot.item.quantity <= slot.slot_size
+        totals[mid] = totals.get(mid, 0) + slot.item.quantity
+        holding.setdefault(mid, set()).add(slot.index)
+        room.setdefault(mid, set())
+        if not slot.is_full():
+            room[mid].add(slot.index)
+    assert inv._totals == totals
+    assert inv._holding == holding
+    assert inv._room == room
+    assert inv.free_slots() == sum(1 for s in inv.slots if s.is_empty())
+    assert len(inv._free) == len(set(inv._free)) <= len(inv.slots)
+
+def test_indexes_survive_random_operations():
+    rng = random.Random(1234)
+    inv = PlayerInventory(slot_count=12, slot_size=16)
+    for step in range(3000):
+        material = rng.choice(MATERIALS)
+        op = rng.random()
+        if op < 0.4:
+            inv.add_item(Item(material, rng.randint(1, 40)))
+        elif op < 0.65:
+            inv.remove_item(Item(material, rng.randint(1, 30)))
+        elif op < 0.9:
+            changes = [(rng.choice(MATERIALS), rng.randint(-30, 30)) for _ in range(rng.randint(1, 4))]
+            inv.apply(changes)
+        elif op < 0.95:
+            inv.remove_all([material.id] if rng.random() < 0.7 else None)
+        else:
+            inv.restore([(rng.randrange(14), rng.choice(MATERIALS), rng.randint(1, 20)) for _ in range(rng.randint(0, 8))])
+        assert_indexes(inv)
+
+def test_free_heap_stays_bounded():
+    inv = PlayerInventory(slot_count=36, slot_size=64)
+    for _ in range(500):
+        assert inv.apply([(STONE, 1)])[0]
+        assert inv.apply([(STONE, -1)])[0]
+    for _ in range(200):
+        assert inv.apply([(STONE, 64 * 36)])[0]
+        inv.remove_all()
+    assert len(inv._free) <= len(inv.slots)
+    assert inv.free_slots() == 36
+    assert_indexes(inv)
+
+@pytest.mark.parametrize("changes", [
+    [(STONE, 10), (RAW_IRON, -1)],                  # missing material
+    [(STONE, -5), (DIRT, 16 * 4)],                  # frees one slot, still doesn't fit
+    [(RAW_DIAMOND, 16 * 3), (STONE, -21)],          # removal larger than held
+])
+def test_failed_apply_changes_nothing(changes):
+    inv = PlayerInventory(slot_count=4, slot_size=16)
+    inv.add_item(Item(STONE, 20))
+    inv.add_item(Item(DIRT, 3))
+    before, version = _contents(inv), inv.version
+    ok, _ = inv.apply(changes)
+    assert not ok
+    assert _contents(inv) == before
+    assert inv.version == version
+    assert_indexes(inv)
+
+def test_apply_nets_changes_per_material():
+    inv = PlayerInventory(slot_count=2, slot_size=16)
+    inv.add_item(Item(STONE, 16))
+    inv.add_item(Item(DIRT, 16))
+    # selling all the stone frees the slot the raw iron goes into
+    ok, _ = inv.apply([(RAW_IRON, 10), (STONE, -16), (DIRT, -6), (DIRT, 2)])
+    assert ok
+    assert (inv.count("stone"), inv.count("dirt"), inv.count("raw_iron")) == (0, 12, 10)
+    assert_indexes(inv)
@@ -0,0 +1,64 @@
+# tests/test_mine.py
+import numpy as np
+import pygame
+
+from classes.items.item import Item
+from classes.items.materials import RAW_DIAMOND, RAW_IRON, STONE
+from mine import Block, BlockGrid
+from systems.mine_generator import MineLayout, MineParams, generate_grid
+
+PARAMS = MineParams(cols=30, rows=20, ores=((STONE, 80.0), (RAW_IRON, 15.0), (RAW_DIAMOND, 5.0)))
+
+def _block(cx, cy, material=STONE, size=50):
+    return Block(cx * 50, cy * 50, size, size, Item(material, 1))
+
+def test_generate_grid_is_deterministic_per_seed():
+    a = generate_grid(7, PARAMS)
+    assert a.shape == (PARAMS.rows, PARAMS.cols) and a.dtype == np.uint8
+    assert np.array_equal(a, generate_grid(7, PARAMS))
+    assert not np.array_equal(a, generate_grid(8, PARAMS))
+    assert a.max() < len(PARAMS.ores)
+
+def test_at_and_query():
+    grid = BlockGrid(50)
+    blocks = [_block(cx, cy) for cx in range(3) for cy in range(3)]
+    for block in blocks:
+        grid.append(block)
+    assert grid.at(75, 125) is blocks[1 * 3 + 2]
+    assert grid.at(200, 0) is None
+    # a rect covering the middle of cells (0..1, 0..1); touching edges don't count
+    assert set(map(id, grid.query((10, 10, 60, 60)))) == {id(blocks[i]) for i in (0, 1, 3, 4)}
+    assert grid.query((50, 50, 50, 50)) == [blocks[4]]
+    grid.remove(blocks[4])
+    assert grid.at(75, 75) is None and len(grid) == 8
+
+def test_off_grid_blocks_are_found():
+    grid = BlockGrid(50)
+    big = Block(0, 0, 100, 100, Item(STONE, 1))
+    grid.append(big)
+    assert grid.at(90, 90) is big
+    assert grid.query((60, 60, 10, 10)) == [big]
+
+def test_dirty_tracking():
+    grid = BlockGrid(50)
+    assert grid.take_dirty() == (True, [])
+    block = _block(2, 3)
+    grid.append(block)
+    grid.remove(block)
+    dirty_all, rects = grid.take_dirty()
+    assert not dirty_all and rects == [pygame.Rect(100, 150, 50, 50)] * 2
+    for i in range(BlockGrid.MAX_DIRTY_RECTS + 1):
+        grid.append(_block(i, 0))
+    assert grid.take_dirty() == (True, [])
+
+def test_lazy_layout_builds_on_demand():
+    layout = MineLayout(generate_grid(3, PARAMS), tuple(m for m, _ in PARAMS.ores), (100, 50), 50)
+    grid = BlockGrid(50)
+    grid.attach(layout)
+    total = PARAMS.rows * PARAMS.cols
+    assert len(grid) == total and layout.remaining == total
+    assert grid.occupied(2, 1) and not grid.occupied(1, 1)
+    block = grid.at(125, 75)
+    assert block.rect.topleft == (100, 50) and layout.remaining == total - 1
+    assert block.item.material is layout.materials[layout.grid[0, 0]]
+    assert len(list(grid)) == total and grid.layout is None
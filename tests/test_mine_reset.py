@@ -0,0 +1,52 @@
+# tests/test_mine_reset.py
+import dataclasses
+
+from tests.fixtures import make_player, make_shop_manager
+from headless import EventLog, HeadlessShopUI
+from rooms.scene_manager import SceneManager
+from systems.config import config_store
+from systems.mine_reset import MineResetScheduler
+
+def _setup(blocks_per_tick=16):
+    reset = dataclasses.replace(config_store.current.mine_reset, blocks_per_tick=blocks_per_tick,
+                                threshold=0, interval_s=3600)
+    config = dataclasses.replace(config_store.current, mine_reset=reset)
+    mgr = SceneManager(make_shop_manager(), HeadlessShopUI())
+    player = make_player()
+    mgr.switch("c_mine", player)
+    player.position = (0, 0)
+    sched = MineResetScheduler(config, EventLog(), time_source=lambda: 0)
+    sched.register_all(mgr)
+    return mgr, player, sched
+
+def _mine_blocks(scene):
+    return [b for b in scene.cubes if not b.item.metadata.get("indestructable")]
+
+def test_fill_counts_a_partly_mined_mine():
+    mgr, _, sched = _setup()
+    scene = mgr.current
+    blocks = _mine_blocks(scene)
+    for b in blocks[: len(blocks) // 2]:
+        scene.cubes.remove(b)
+    state = sched.mines[scene.name]
+    state._cubes = None          # re-derive from the current grid, as after a reload
+    assert abs(state.fill - (len(blocks) - len(blocks) // 2) / state.capacity) < 1e-9
+
+def test_refill_in_view_places_at_most_blocks_per_tick():
+    mgr, player, sched = _setup(blocks_per_tick=16)
+    scene = mgr.current
+    for b in _mine_blocks(scene):
+        scene.cubes.remove(b)
+    scene.cubes.take_dirty()
+    assert sched.reset(scene.name, player, mgr)
+    state = sched.mines[scene.name]
+    before = len(scene.cubes)
+    ticks = 0
+    while state.resetting:
+        sched.update(mgr, player)
+        placed = len(scene.cubes) - before
+        before = len(scene.cubes)
+        assert placed <= 16
+        ticks += 1
+    assert ticks >= state.capacity // 16
+    assert state.fill == 1.0
@@ -0,0 +1,132 @@
+# tests/test_save.py
+import dataclasses
+import struct
+
+import pytest
+
+from tests.fixtures import make_player
+from classes.items.item import Item
+from classes.items.materials import STONE, RAW_IRON, RAW_DIAMOND
+from systems.config import config_store
+from systems.save import (AutoSaver, FORMAT_VERSION, MAGIC, ProfileSnapshot, SaveError,
+                          decode, encode, load_profile, save_profile)
+
+class _Notifier:
+    def __init__(self):
+        self.messages = []
+
+    def push(self, text, level="info", duration=None):
+        self.messages.append((level, text))
+
+def _player():
+    player = make_player()
+    player.money = 123456
+    player.gems = 7
+    player.stats.blocks_mined = 42
+    player.stats.money_earned = 999
+    player.rank = player.rank_manager.get("b")
+    player.inventory.add_item(Item(STONE, 100))
+    player.inventory.add_item(Item(RAW_IRON, 30))
+    player.inventory.add_item(Item(RAW_DIAMOND, 2))
+    return player
+
+def _saver(tmp_path, player, clock):
+    save = dataclasses.replace(config_store.current.save, path=str(tmp_path / "profile.sav"), autosave_s=1)
+    config = dataclasses.replace(config_store.current, save=save)
+    return AutoSaver(config, player, _Notifier(), time_source=lambda: clock["ms"])
+
+# ---- format ----
+
+def test_encode_decode_round_trip():
+    snap = ProfileSnapshot.capture(_player())
+    assert decode(encode(snap)) == snap
+
+def test_material_ids_are_interned():
+    data = encode(ProfileSnapshot.capture(_player()))
+    # stone fills two slots but its id is stored once
+    assert data.count(b"stone") == 1
+
+def test_apply_restores_player():
+    snap = ProfileSnapshot.capture(_player())
+    other = make_player()
+    assert decode(encode(snap)).apply(other) == []
+    assert ProfileSnapshot.capture(other) == snap
+    assert other.rank.id == "b"
+    assert other.inventory.count("raw_iron") == 30
+
+def test_unknown_materials_are_dropped():
+    snap = dataclasses.replace(ProfileSnapshot.capture(_player()), slots=((0, "no_such_ore", 5), (1, "stone", 3)))
+    player = make_player()
+    snap.apply(player)
+    assert [(i.material.id, i.quantity) for i in player.inventory.get_items()] == [("stone", 3)]
+
+@pytest.mark.parametrize("corrupt", [
+    lambda d: d[:-1],                                      # truncated trailer
+    lambda d: d[:8],                                       # truncated header
+    lambda d: d[:20] + bytes([d[20] ^ 0x01]) + d[21:],     # one flipped bit
+    lambda d: b"XXXX" + d[4:],                             # not a save
+    lambda d: struct.pack("<4sH", MAGIC, FORMAT_VERSION + 1) + d[6:],   # newer build
+])
+def test_corrupt_data_is_rejected(corrupt):
+    data = encode(ProfileSnapshot.capture(_player()))
+    with pytest.raises(SaveError):
+        decode(corrupt(data))
+
+def test_save_and_load_file(tmp_path):
+    path = str(tmp_path / "sub" / "profile.sav")
+    snap = ProfileSnapshot.capture(_player())
+    save_profile(path, snap)
+    assert load_profile(path) == snap
+    assert load_profile(str(tmp_path / "missing.sav")) is None
+    assert [p.name for p in (tmp_path / "sub").iterdir()] == ["profile.sav"]   # no temp file left
+
+# ---- autosave ----
+
+def test_autosave_writes_changes_only(tmp_path):
+    clock = {"ms": 0}
+    player = _player()
+    saver = _saver(tmp_path, player, clock)
+    clock["ms"] = 1000
+    saver.update()
+    saver._future.result()
+    saver.update()
+    assert saver.saves == 1
+    clock["ms"] = 2000
+    saver.update()
+    assert saver._future is None        # unchanged: nothing written
+    player.money += 1
+    saver.close()
+    assert load_profile(saver.path).money == player.money
+
+def test_unreadable_save_is_moved_aside_not_overwritten(tmp_path):
+    path = tmp_path / "profile.sav"
+    path.write_bytes(b"garbage that is not a save")
+    clock = {"ms": 0}
+    saver = _saver(tmp_path, make_player(), clock)
+    assert not saver.load()
+    assert (tmp_path / "profile.sav.corrupt").read_bytes() == b"garbage that is not a save"
+    assert saver.notifier.messages[-1][0] == "error"
+    clock["ms"] = 1000
+    saver.update()
+    saver.close()
+    assert decode(path.read_bytes()).money == 0
+
+def test_close_survives_unsaveable_values(tmp_path):
+    clock = {"ms": 0}
+    player = make_player()
+    player.money = 2 ** 63
+    saver = _saver(tmp_path, player, clock)
+    saver.close()
+    assert saver.last_error
+    assert not (tmp_path / "profile.sav").exists()
+
+def test_save_that_cannot_be_read_turns_saving_off(tmp_path):
+    (tmp_path / "profile.sav").mkdir()      # exists, but reading it fails with an OSError
+    clock = {"ms": 0}
+    saver = _saver(tmp_path, make_player(), clock)
+    assert not saver.load()
+    assert not saver.enabled
+    clock["ms"] = 1000
+    saver.update()
+    saver.close()
+    assert (tmp_path / "profile.sav").is_dir()
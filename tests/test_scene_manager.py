@@ -0,0 +1,76 @@
+# tests/test_scene_manager.py
+import numpy as np
+import pygame
+
+from tests.fixtures import make_shop_manager
+from headless import HeadlessShopUI
+from rooms.scene_manager import SceneManager
+from rooms.scenes import BLOCK_LAYER_KEY
+from systems.mine_generator import EMPTY
+
+class _Player:
+    position = (0, 0)
+
+def _manager(**kwargs):
+    return SceneManager(make_shop_manager(), HeadlessShopUI(), **kwargs)
+
+def _mine_cell(scene, r, c):
+    cs = scene.cubes.cell_size
+    return scene.mine_origin[0] // cs + c, scene.mine_origin[1] // cs + r
+
+def test_switch_never_evicts_the_target_scene():
+    mgr = _manager(max_loaded=1)
+    unloaded = []
+    mgr.on_unload.append(lambda name, scene: unloaded.append(name))
+    mgr.switch("c_mine", _Player())
+    assert list(mgr.loaded) == ["c_mine"]
+    assert mgr.loaded["c_mine"] is mgr.current
+    assert unloaded == ["c_hub"]
+    scene = mgr.current
+    mgr.switch("c_mine", _Player())
+    assert mgr.current is scene
+
+def test_unload_keeps_mined_cells():
+    mgr = _manager(max_loaded=2)
+    mgr.switch("c_mine", _Player())
+    scene = mgr.current
+    cx, cy = _mine_cell(scene, 2, 3)
+    scene.cubes.remove(scene.cubes.at_cell(cx, cy))
+    before = scene.mine_grid()
+    assert before[2, 3] == EMPTY
+
+    mgr.switch("c_hub", _Player())
+    mgr.switch("c_shop", _Player())
+    assert not mgr.is_loaded("c_mine")
+    mgr.switch("c_mine", _Player())
+    assert mgr.current is not scene
+    assert not mgr.current.cubes.occupied(cx, cy)
+    assert np.array_equal(mgr.current.mine_grid(), before)
+
+def test_mine_grid_matches_after_building_blocks():
+    mgr = _manager()
+    scene = mgr.get("c_mine")
+    lazy = scene.mine_grid()
+    scene.cubes.materialize()
+    assert scene.cubes.layout is None
+    assert np.array_equal(scene.mine_grid(), lazy)
+    assert (lazy != EMPTY).all()
+
+def test_first_draw_keeps_the_mine_lazy():
+    mgr = _manager(max_loaded=2)
+    mgr.switch("c_mine", _Player())
+    scene = mgr.current
+    cx, cy = _mine_cell(scene, 0, 0)
+    scene.cubes.remove(scene.cubes.at_cell(cx, cy))     # one built (and mined) cell
+    pending = scene.cubes.layout.remaining
+    screen = pygame.Surface((1300, 700))
+    scene._update_block_layer(screen.get_size())
+    assert scene.cubes.layout is not None and scene.cubes.layout.remaining == pending
+    painted = pygame.image.tobytes(scene._block_layer, "RGB")
+
+    # same pixels as blitting every block after building them all
+    expected = pygame.Surface(screen.get_size())
+    expected.fill(BLOCK_LAYER_KEY)
+    for cube in scene.cubes:
+        expected.blit(cube.image, cube.rect)
+    assert pygame.image.tobytes(expected, "RGB") == painted
@@ -0,0 +1,53 @@
+# tests/test_shop.py
+import pytest
+
+from tests.fixtures import make_player
+from classes.items.item import Item
+from classes.items.materials import DIAMOND, RAW_IRON, STONE
+from classes.shop import Shop, ShopItem
+from helper import process_shop_basket
+
+class _Notifier:
+    def __init__(self):
+        self.messages = []
+
+    def push(self, text, level="info", duration=None):
+        self.messages.append((level, text))
+
+def _shop():
+    return Shop("test", "Test", [
+        ShopItem(STONE, buy_price=5, sell_price=1),
+        ShopItem(RAW_IRON, buy_price=0, sell_price=10),    # sell only
+        ShopItem(DIAMOND, buy_price=100, sell_price=0),    # buy only
+    ])
+
+def _player():
+    player = make_player()
+    player.money = 1000
+    player.inventory.add_item(Item(STONE, 10))
+    player.inventory.add_item(Item(RAW_IRON, 10))
+    player.inventory.add_item(Item(DIAMOND, 1))
+    return player
+
+def _state(player):
+    return player.money, [(s.index, s.item.material.id, s.item.quantity) for s in player.inventory.slots if s.item]
+
+@pytest.mark.parametrize("basket", [
+    [("buy", "raw_iron", 5)],
+    [("sell", "diamond", 1)],
+    [("sell", "stone", 2), ("buy", "raw_iron", 1)],
+])
+def test_basket_rejects_unpriced_lines(basket):
+    player, shop, notifier = _player(), _shop(), _Notifier()
+    before = _state(player)
+    assert not process_shop_basket(player, shop, basket, notifier)
+    assert _state(player) == before
+    assert notifier.messages[-1][0] == "warning"
+
+def test_basket_settles_priced_lines():
+    player, shop, notifier = _player(), _shop(), _Notifier()
+    basket = [("sell", "raw_iron", 10), ("buy", "diamond", 1), ("sell", "stone", 10)]
+    assert process_shop_basket(player, shop, basket, notifier)
+    assert player.money == 1000 + 100 - 100 + 10
+    assert player.inventory.count("raw_iron") == 0
+    assert player.inventory.count("diamond") == 2
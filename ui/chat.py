@@ -1,18 +1,72 @@
 import pygame
+from bisect import bisect_right
+from collections import OrderedDict
 
 import pygame.font
+from ui.fonts import get_font, render_text
+
+class MessageHistory:
+    """Fixed-capacity ring buffer: O(1) append (evicting the oldest entry) and O(1) indexing."""
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._buf = [None] * self.capacity
+        self._head = 0   # index of the oldest entry
+        self._len = 0
+
+    def append(self, item):
+        """Append item; returns the evicted oldest entry when full, else None."""
+        evicted = None
+        if self._len < self.capacity:
+            self._buf[(self._head + self._len) % self.capacity] = item
+            self._len += 1
+        else:
+            evicted = self._buf[self._head]
+            self._buf[self._head] = item
+            self._head = (self._head + 1) % self.capacity
+        return evicted
+
+    def resize(self, capacity: int) -> list:
+        """Change the capacity, keeping the newest entries; returns the dropped ones (oldest first)."""
+        items = list(self)
+        capacity = max(1, capacity)
+        dropped = items[:max(0, len(items) - capacity)]
+        kept = items[len(dropped):]
+        self.capacity = capacity
+        self._buf = kept + [None] * (capacity - len(kept))
+        self._head = 0
+        self._len = len(kept)
+        return dropped
+
+    def clear(self):
+        self._buf = [None] * self.capacity
+        self._head = 0
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("message index out of range")
+        return self._buf[(self._head + i) % self.capacity]
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self._buf[(self._head + i) % self.capacity]
 
 class ChatUI:
-    def __init__(self, x, y, width, height):
+    def __init__(self, x, y, width, height, max_messages=2000):
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(None, 24)
+        self.small_font = get_font(None, 18)
 
         self.is_chat_open = False
         
         # Chat history
-        self.messages = []
-        self.max_messages = 50
+        self.max_messages = max_messages
+        self.messages = MessageHistory(max_messages)
         self.scroll_offset = 0
         
         # Input box
@@ -34,6 +88,19 @@ class ChatUI:
         self.input_height = 30
         self.message_height = 20
 
+        # Layout cache: each message dict also holds its wrapped lines and 'line_start', the
+        # absolute index of its first line (a running prefix sum that survives eviction).
+        # Line surfaces are only rendered for messages on screen, kept in a small LRU.
+        self._layout_width = None
+        self._lines_end = 0
+        self._next_seq = 0
+        self._rendered = OrderedDict()   # message seq -> (username_surface, [line_surface])
+        self.max_rendered = 128
+
+        # Reused every frame instead of allocating a new chat surface
+        self._background = None
+        self._chat_surface = None
+
     def _message_area_rect(self):
         return pygame.Rect(
             self.rect.x + self.padding,
@@ -78,17 +145,104 @@ class ChatUI:
         self.cursor_pos = 0
         self.scroll_offset = 0  # <— reset
         
+    def set_max_messages(self, max_messages: int):
+        """Resize the history (config reload); the oldest messages go if it shrinks."""
+        self.max_messages = max_messages
+        for msg in self.messages.resize(max_messages):
+            self._rendered.pop(msg['seq'], None)
+
     def add_message(self, username, message, color=(255, 255, 255)):
         """Add a message to the chat"""
-        self.messages.append({
+        msg = {
             'username': username,
             'message': message,
-            'color': color
-        })
-        
-        # Keep only recent messages
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
+            'color': color,
+            'seq': self._next_seq,
+        }
+        self._next_seq += 1
+
+        # Keep only recent messages (the ring buffer evicts the oldest in O(1))
+        evicted = self.messages.append(msg)
+        if evicted is not None:
+            self._rendered.pop(evicted['seq'], None)
+
+        if self._layout_width == self._available_width():
+            self._layout_message(msg)
+            msg['line_start'] = self._lines_end
+            self._lines_end += len(msg['lines'])
+            if self.scroll_offset:
+                # scrolled up into history: keep the same lines on screen
+                self.scroll_offset += len(msg['lines'])
+
+    # ---- layout cache ----
+
+    def _available_width(self):
+        return self.rect.width - 2 * self.padding
+
+    def _layout_message(self, msg):
+        """Wrap a message to the current width (rendering happens lazily in _message_surfaces)."""
+        # Calculate username width
+        username_text = f"{msg['username']}: "
+        username_width = self.small_font.size(username_text)[0]
+        message_width = self._available_width() - username_width
+
+        # Wrap message text
+        words = msg['message'].split(' ')
+        lines = []
+        current_line = ""
+
+        for word in words:
+            test_line = current_line + (" " if current_line else "") + word
+            if self.small_font.size(test_line)[0] <= message_width:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line)
+                    current_line = word
+                else:
+                    # Word is too long, break it
+                    lines.append(word)
+
+        if current_line:
+            lines.append(current_line)
+
+        msg['username_width'] = username_width
+        msg['lines'] = lines
+
+    def _message_surfaces(self, msg):
+        surfaces = self._rendered.get(msg['seq'])
+        if surfaces is not None:
+            self._rendered.move_to_end(msg['seq'])
+            return surfaces
+        surfaces = (
+            self.small_font.render(f"{msg['username']}: ", True, msg['color']),
+            [self.small_font.render(line, True, self.text_color) for line in msg['lines']],
+        )
+        self._rendered[msg['seq']] = surfaces
+        if len(self._rendered) > self.max_rendered:
+            self._rendered.popitem(last=False)
+        return surfaces
+
+    def _reindex_lines(self):
+        """Re-wrap every message for the current width and rebuild the line prefix sums."""
+        self._layout_width = self._available_width()
+        self._rendered.clear()
+
+        total = self.messages[0].get('line_start', 0) if len(self.messages) else self._lines_end
+        for msg in self.messages:
+            self._layout_message(msg)
+            msg['line_start'] = total
+            total += len(msg['lines'])
+        self._lines_end = total
+
+    def _total_lines(self):
+        if not len(self.messages):
+            return 0
+        return self._lines_end - self.messages[0]['line_start']
+
+    def _visible_line_count(self):
+        message_area_height = self.rect.height - self.input_height - 3 * self.padding
+        return max(1, int(message_area_height // self.message_height))
     
     def handle_event(self, event):
         """Handle pygame events"""
@@ -141,13 +295,13 @@ class ChatUI:
         elif event.type == pygame.MOUSEWHEEL and self.is_chat_open:
             # Only scroll if mouse is over the chat's message area
             if self._message_area_rect().collidepoint(pygame.mouse.get_pos()):
-                # Compute how many messages fit
-                message_area_height = self.rect.height - self.input_height - 5 * self.padding
-                visible = max(1, int(message_area_height // self.message_height))
-                max_offset = max(0, len(self.messages) - visible)
+                # Compute how many wrapped lines fit
+                if self._layout_width != self._available_width():
+                    self._reindex_lines()
+                max_offset = max(0, self._total_lines() - self._visible_line_count())
 
                 # Pygame: event.y > 0 means scroll up → older messages → increase offset
-                self.scroll_offset = max(0, min(max_offset, self.scroll_offset - event.y))
+                self.scroll_offset = max(0, min(max_offset, self.scroll_offset + event.y))
 
                                 
         elif event.type == pygame.MOUSEBUTTONDOWN and self.is_chat_open and event.button == 1:
@@ -172,86 +326,55 @@ class ChatUI:
         """Draw the chat UI"""
         if not self.is_chat_open:
             return
-            
-        # Create surface with alpha for transparency
-        chat_surface = pygame.Surface((self.rect.width, self.rect.height))
-        chat_surface.set_alpha(180)
-        chat_surface.fill((0, 0, 0))
-        
-        # Draw border
-        pygame.draw.rect(chat_surface, self.border_color, chat_surface.get_rect(), 2)
-        
-        # Draw messages
-        message_area_height = self.rect.height - self.input_height - 3 * self.padding
-        available_width = self.rect.width - 2 * self.padding
-        
-        # Calculate how many lines all messages will take
-        total_lines = 0
-        message_lines = []
-        
-        for msg in self.messages:
-            # Calculate username width
-            username_text = f"{msg['username']}: "
-            username_width = self.small_font.size(username_text)[0]
-            message_width = available_width - username_width
-            
-            # Wrap message text
-            words = msg['message'].split(' ')
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                if self.small_font.size(test_line)[0] <= message_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Word is too long, break it
-                        lines.append(word)
-            
-            if current_line:
-                lines.append(current_line)
-            
-            message_lines.append({
-                'username': msg['username'],
-                'lines': lines,
-                'color': msg['color'],
-                'username_width': username_width
-            })
-            total_lines += len(lines)
-
-        # Calculate visible lines and scrolling
-        visible_lines = max(1, int(message_area_height // self.message_height))
-        max_offset = max(0, total_lines - visible_lines)
+
+        size = (self.rect.width, self.rect.height)
+        if self._background is None or self._background.get_size() != size:
+            # Background with border, built once
+            self._background = pygame.Surface(size)
+            self._background.fill((0, 0, 0))
+            pygame.draw.rect(self._background, self.border_color, self._background.get_rect(), 2)
+            self._chat_surface = pygame.Surface(size)
+            self._chat_surface.set_alpha(180)
+
+        chat_surface = self._chat_surface
+        chat_surface.blit(self._background, (0, 0))
+
+        if self._layout_width != self._available_width():
+            self._reindex_lines()
+
+        # Calculate visible lines and scrolling; scroll_offset counts lines up from the
+        # newest, so 0 shows the latest messages
+        visible_lines = self._visible_line_count()
+        max_offset = max(0, self._total_lines() - visible_lines)
         self.scroll_offset = max(0, min(self.scroll_offset, max_offset))
 
-        # Draw messages
-        current_line = 0
-        start_y = self.padding
-        
-        for msg_data in message_lines:
-            for i, line in enumerate(msg_data['lines']):
-                # Check if this line should be visible
-                if current_line >= self.scroll_offset and current_line < self.scroll_offset + visible_lines:
-                    y_pos = start_y + (current_line - self.scroll_offset) * self.message_height
-                    
+        # Virtualized: find the first visible message by bisecting on line_start and only
+        # touch messages inside the visible line window
+        if len(self.messages):
+            start_y = self.padding
+            base = self.messages[0]['line_start']
+            top = base + max_offset - self.scroll_offset
+            bottom = top + visible_lines
+            first = max(0, bisect_right(self.messages, top, key=lambda m: m['line_start']) - 1)
+
+            for msg_index in range(first, len(self.messages)):
+                msg = self.messages[msg_index]
+                line_start = msg['line_start']
+                if line_start >= bottom:
+                    break
+                username_surface, line_surfaces = self._message_surfaces(msg)
+                x = self.padding + msg['username_width']
+                for i, message_surface in enumerate(line_surfaces):
+                    current_line = line_start + i
+                    if current_line < top or current_line >= bottom:
+                        continue
+                    y_pos = start_y + (current_line - top) * self.message_height
+
                     if i == 0:  # First line shows username
-                        # Draw username
-                        username_surface = self.small_font.render(f"{msg_data['username']}: ", True, msg_data['color'])
                         chat_surface.blit(username_surface, (self.padding, y_pos))
-                        
-                        # Draw message line
-                        message_surface = self.small_font.render(line, True, self.text_color)
-                        chat_surface.blit(message_surface, (self.padding + msg_data['username_width'], y_pos))
-                    else:  # Continuation lines are indented
-                        message_surface = self.small_font.render(line, True, self.text_color)
-                        chat_surface.blit(message_surface, (self.padding + msg_data['username_width'], y_pos))
-                
-                current_line += 1
-        
+                    # Continuation lines are indented
+                    chat_surface.blit(message_surface, (x, y_pos))
+
         # Draw input box
         input_rect = pygame.Rect(
             self.padding,
@@ -282,7 +405,7 @@ class ChatUI:
                                (cursor_x, input_rect.bottom - 3), 1)
         else:
             # Draw placeholder text
-            placeholder = self.font.render("Type a message...", True, (128, 128, 128))
+            placeholder = render_text(self.font, "Type a message...", (128, 128, 128))
             chat_surface.blit(placeholder, (input_rect.x + 5, input_rect.y + 5))
         
         # Blit to main screen
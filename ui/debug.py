@@ -1,16 +1,39 @@
 # ui/debug.py
+import math
 import pygame
 from typing import Dict, Callable, List, Tuple, Optional
+from ui.fonts import get_font
+
+class _Provider:
+    __slots__ = ("fn", "interval_ms", "last_poll", "lines")
+
+    def __init__(self, fn: Callable[[], Dict[str, object]], interval_ms: int):
+        self.fn = fn
+        self.interval_ms = interval_ms
+        self.last_poll = None
+        self.lines: List[str] = []
 
 class DebugOverlay:
+    GRAPH_BG = (255, 255, 255, 40)
+
     def __init__(self,
                  anchor: str = "top-left",
                  padding: int = 8,
                  bg=(0, 0, 0, 170),
                  text=(255, 255, 255),
-                 font: Optional[pygame.font.Font] = None):
+                 font: Optional[pygame.font.Font] = None,
+                 profiler=None,
+                 graph_size: Tuple[int, int] = (300, 64),
+                 frame_budget_ms: float = 1000.0 / 60,
+                 time_source: Callable[[], int] = pygame.time.get_ticks):
         """
         anchor: top-left | top-right | bottom-left | bottom-right | top-center | bottom-center
+        profiler: optional systems.profiler.Profiler; it is switched on only while the
+        overlay is visible and its section percentiles + a frame-time graph are shown.
+        frame_budget_ms: frame time the graph treats as on budget (GameLoop.frame_budget_ms).
+
+        Providers are polled at their own interval, each line is rendered only when its text
+        changes, and the panel surface is reused and only repainted when a line changed.
         """
         pygame.font.init()
         self.visible = False
@@ -18,20 +41,48 @@ class DebugOverlay:
         self.padding = padding
         self.bg = bg
         self.text = text
-        self.font = font or pygame.font.Font(None, 20)
-        self._providers: List[Callable[[], Dict[str, str]]] = []
+        self.font = font or get_font(None, 20)
+        self.time_source = time_source
+        self._providers: List[_Provider] = []
         self._static_lines: List[str] = []
+        self.profiler = profiler
+        self.graph_size = graph_size
+        self.frame_budget_ms = frame_budget_ms
+
+        # render cache
+        self._line_cache: List[Tuple[str, pygame.Surface]] = []   # per line slot: (text, surface)
+        self._panel: Optional[pygame.Surface] = None
+        self._panel_dirty = True
+        self._graph: Optional[pygame.Surface] = None
+        self._graph_top = 0.0          # ms at the top of the graph
+        self._graph_frame = 0          # profiler.frame_count when the graph was last drawn
 
     def toggle(self):
         self.visible = not self.visible
+        if self.profiler is not None:
+            self.profiler.set_enabled(self.visible)
+        self._graph = None
+        # providers are stale after being hidden; poll them all on the next draw
+        for p in self._providers:
+            p.last_poll = None
+
+    def set_frame_budget(self, ms: float):
+        """New frame budget (settings reload); the graph is redrawn at the new scale."""
+        if ms != self.frame_budget_ms:
+            self.frame_budget_ms = ms
+            self._graph = None
 
-    def add_provider(self, fn: Callable[[], Dict[str, object]]):
-        """Register a function returning a dict of debug key->value."""
-        self._providers.append(fn)
+    def add_provider(self, fn: Callable[[], Dict[str, object]], interval_ms: int = 0):
+        """
+        Register a function returning a dict of debug key->value.
+        It is called at most once per interval_ms (0 = every frame) while the overlay is visible.
+        """
+        self._providers.append(_Provider(fn, interval_ms))
 
     def add_static(self, line: str):
         """Optional: add a constant line (e.g., build/version)."""
         self._static_lines.append(line)
+        self._panel_dirty = True
 
     def _anchor_rect(self, surf: pygame.Surface, screen: pygame.Surface) -> pygame.Rect:
         sw, sh = screen.get_size()
@@ -53,42 +104,138 @@ class DebugOverlay:
             r.topleft = (self.padding, self.padding)
         return r
 
-    def draw(self, screen: pygame.Surface):
-        if not self.visible:
+    # ---- lines ----
+
+    def _poll(self, provider: _Provider, now: int):
+        if provider.last_poll is not None and now - provider.last_poll < provider.interval_ms:
             return
+        provider.last_poll = now
+        try:
+            d = provider.fn() or {}
+            provider.lines = [f"{k}: {v}" for k, v in d.items()]
+        except Exception as e:
+            provider.lines = [f"[provider error] {e}"]
 
-        # Gather lines
-        lines: List[str] = []
-        lines.extend(self._static_lines)
+    def _gather_lines(self) -> List[str]:
+        now = self.time_source()
+        lines: List[str] = list(self._static_lines)
         for prov in self._providers:
-            try:
-                d = prov() or {}
-                for k, v in d.items():
-                    lines.append(f"{k}: {v}")
-            except Exception as e:
-                lines.append(f"[provider error] {e}")
-
-        # Render text to compute box size
+            self._poll(prov, now)
+            lines.extend(prov.lines)
+
+        if self._show_profile():
+            lines.append("ms          p50    p95    p99")
+            for name, (p50, p95, p99) in self.profiler.stats().items():
+                lines.append(f"{name:<10.10} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        return lines
+
+    def _update_line_cache(self, lines: List[str]):
+        """Re-render only the slots whose text changed; marks the panel dirty if any did."""
+        cache = self._line_cache
+        if len(cache) != len(lines):
+            del cache[len(lines):]
+            self._panel_dirty = True
+        for i, ln in enumerate(lines):
+            if i < len(cache):
+                if cache[i][0] == ln:
+                    continue
+                cache[i] = (ln, self.font.render(ln, True, self.text))
+            else:
+                cache.append((ln, self.font.render(ln, True, self.text)))
+            self._panel_dirty = True
+
+    def _show_profile(self) -> bool:
+        return self.profiler is not None and self.profiler.enabled
+
+    # ---- panel ----
+
+    def _repaint_panel(self):
         pad = self.padding
         lh = self.font.get_height()
-        maxw = 0
-        for ln in lines:
-            w, _ = self.font.size(ln)
-            maxw = max(maxw, w)
+        n = len(self._line_cache)
+        maxw = max((s.get_width() for _, s in self._line_cache), default=0)
         w = maxw + pad * 2
-        h = lh * len(lines) + pad * 2 + max(0, len(lines) - 1) * 2
+        h = lh * n + pad * 2 + max(0, n - 1) * 2
+        if self._show_profile():
+            w = max(w, self.graph_size[0] + pad * 2)
+            h += self.graph_size[1] + pad
+        # round the width up so a changing FPS digit doesn't reallocate the panel every time
+        w = int(math.ceil(w / 16.0)) * 16
 
-        # Panel
-        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        if self._panel is None or self._panel.get_size() != (w, h):
+            self._panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel = self._panel
+        panel.fill((0, 0, 0, 0))
         pygame.draw.rect(panel, self.bg, panel.get_rect(), border_radius=8)
 
-        # Text
         y = pad
-        for ln in lines:
-            s = self.font.render(ln, True, self.text)
+        for _, s in self._line_cache:
             panel.blit(s, (pad, y))
             y += lh + 2
+        self._graph_pos = (pad, y - 2 + pad)
+        self._panel_dirty = False
+
+    # ---- frame-time graph ----
+
+    def _graph_bar(self, surf: pygame.Surface, x: int, ms: float):
+        h = surf.get_height()
+        bar = min(h, max(1, int(ms * h / self._graph_top)))
+        color = (90, 220, 90) if ms <= self.frame_budget_ms else (240, 80, 60)
+        pygame.draw.line(surf, color, (x, h - 1), (x, h - bar))
+
+    def _graph_budget_line(self, surf: pygame.Surface, x0: int, x1: int):
+        h = surf.get_height()
+        y = h - int(self.frame_budget_ms * h / self._graph_top)
+        pygame.draw.line(surf, (255, 255, 0), (x0, y), (x1, y))
+
+    def _update_graph(self, width: int):
+        """
+        Frame-time bars, newest on the right; the line marks frame_budget_ms.
+        Normally scrolls left by the number of new frames and draws just those bars; a full
+        redraw happens only when the scale (rounded to whole budgets) changes.
+        """
+        frames = self.profiler.frame_times
+        count = self.profiler.frame_count
+        size = (width, self.graph_size[1])
+        peak = max(frames, default=0.0)
+        budgets = max(2, int(math.ceil(peak / self.frame_budget_ms)))
+        top = budgets * self.frame_budget_ms
+        new = count - self._graph_frame
+
+        full = (self._graph is None or self._graph.get_size() != size or top != self._graph_top
+                or new < 0 or new >= width)
+        if not full and new == 0:
+            return
+        if full:
+            self._graph = pygame.Surface(size, pygame.SRCALPHA)
+            self._graph_top = top
+            self._graph.fill(self.GRAPH_BG)
+            recent = list(frames)[-width:]
+            x0 = width - len(recent)
+        else:
+            self._graph.scroll(-new, 0)
+            self._graph.fill(self.GRAPH_BG, (width - new, 0, new, size[1]))
+            recent = list(frames)[-new:] if new <= len(frames) else list(frames)
+            x0 = width - len(recent)
+
+        for i, ms in enumerate(recent):
+            self._graph_bar(self._graph, x0 + i, ms)
+        self._graph_budget_line(self._graph, 0 if full else x0, width - 1)
+        self._graph_frame = count
+
+    def draw(self, screen: pygame.Surface):
+        if not self.visible:
+            return
+
+        self._update_line_cache(self._gather_lines())
+        show_profile = self._show_profile()
+        if self._panel_dirty or self._panel is None:
+            self._repaint_panel()
+
+        rect = self._anchor_rect(self._panel, screen)
+        screen.blit(self._panel, rect)
 
-        # Blit
-        rect = self._anchor_rect(panel, screen)
-        screen.blit(panel, rect)
+        if show_profile:
+            self._update_graph(self._panel.get_width() - self.padding * 2)
+            gx, gy = self._graph_pos
+            screen.blit(self._graph, (rect.x + gx, rect.y + gy))
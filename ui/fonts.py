@@ -0,0 +1,52 @@
+# ui/fonts.py
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+class FontCache:
+    """
+    Shared (family, size) -> Font registry plus a bounded cache of rendered text surfaces.
+
+    family=None means pygame's default font (pygame.font.Font(None, size)); anything else
+    goes through SysFont, which scans system fonts and is slow, so it must only happen once.
+    Rendered surfaces are shared between callers: blit them, never draw on them or set_alpha.
+    """
+    def __init__(self, max_surfaces: int = 512):
+        self.max_surfaces = max_surfaces
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def get(self, family: Optional[str], size: int) -> pygame.font.Font:
+        key = (family, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size) if family is None else pygame.font.SysFont(family, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            return surf
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._fonts.clear()
+        self._surfaces.clear()
+
+# Process-wide registry used by scenes, UI widgets and helper.draw_text_in_rect
+fonts = FontCache()
+
+def get_font(family: Optional[str], size: int) -> pygame.font.Font:
+    return fonts.get(family, size)
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    return fonts.render(font, text, color, antialias)
@@ -1,7 +1,8 @@
 # ui/notifications.py
 import pygame
 from dataclasses import dataclass
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+from ui.fonts import get_font
 
 @dataclass
 class Notification:
@@ -12,16 +13,20 @@ class Notification:
     fade_time: float = 0.5        # seconds to fade out
     created_at: float = 0.0       # set by manager
     alpha: int = 255              # updated by manager
+    level: str = "info"
+    count: int = 1                # identical pushes coalesced into this bubble
+    surface: Optional[pygame.Surface] = None  # bubble rendered once by the manager
 
 class NotificationManager:
-    def __init__(self, font=None, max_width=380, margin=12, spacing=8, corner=12, anchor="top-right"):
+    def __init__(self, font=None, max_width=380, margin=12, spacing=8, corner=12, anchor="top-right", max_items=8):
         pygame.font.init()
-        self.font = font or pygame.font.Font(None, 28)
+        self.font = font or get_font(None, 28)
         self.max_width = max_width
         self.margin = margin
         self.spacing = spacing
         self.corner = corner
         self.anchor = anchor
+        self.max_items = max_items
         self._items: List[Notification] = []
 
         # theme per level
@@ -33,15 +38,34 @@ class NotificationManager:
         }
 
     def push(self, text: str, level: str = "info", duration: float = None):
+        now = pygame.time.get_ticks() / 1000.0
+
+        # coalesce spam (e.g. "Picked up Stone x1") into the live bubble with a counter
+        for n in self._items:
+            if n.text == text and n.level == level and now - n.created_at <= n.duration + n.fade_time:
+                self._items.remove(n)
+                n.count += 1
+                n.created_at = now
+                n.alpha = 255
+                if duration is not None:
+                    n.duration = duration
+                n.surface = self._render_bubble(n)
+                self._items.append(n)   # newest on top
+                return
+
         fg, bg = self.levels.get(level, self.levels["info"])
         n = Notification(
             text=text,
             color=bg,       # text color
             bg=fg,          # bubble color
             duration=duration if duration is not None else 2.5,
+            level=level,
         )
-        n.created_at = pygame.time.get_ticks() / 1000.0
+        n.created_at = now
+        n.surface = self._render_bubble(n)
         self._items.append(n)
+        if len(self._items) > self.max_items:
+            self._items.pop(0)
 
     def _wrap(self, text: str):
         words = text.split()
@@ -74,33 +98,39 @@ class NotificationManager:
                 keep.append(n)
         self._items = keep
 
+    def _render_bubble(self, n: Notification) -> pygame.Surface:
+        """Render the bubble at full opacity; fading only changes the surface alpha."""
+        text = n.text if n.count == 1 else f"{n.text} (x{n.count})"
+        lines = self._wrap(text)
+        pad = 10
+        # width based on text strings
+        w = min(self.max_width, max((self.font.size(line)[0] for line in lines), default=0)) + pad*2
+        # height based on rendered line heights
+        line_height = self.font.get_height()
+        h = line_height * len(lines) + pad*2 + (len(lines)-1)*2
+
+        bubble = pygame.Surface((w, h), pygame.SRCALPHA)
+        # rounded rectangle background
+        pygame.draw.rect(bubble, (*n.bg, 255), bubble.get_rect(), border_radius=self.corner)
+
+        # render and blit lines
+        y = pad
+        for line in lines:
+            ln_surf = self.font.render(line, True, n.color)
+            bubble.blit(ln_surf, (pad, y))
+            y += line_height + 2
+        return bubble
+
     def draw(self, screen: pygame.Surface):
         self.update()
 
-        # pre-compute bubble surfaces for each notification
+        # bubbles were rendered at push time; just apply the current fade
         bubbles = []
         for n in self._items:
-            lines = self._wrap(n.text)
-            pad = 10
-            # width based on text strings
-            w = min(self.max_width, max((self.font.size(line)[0] for line in lines), default=0)) + pad*2
-            # height based on rendered line heights
-            line_height = self.font.get_height()
-            h = line_height * len(lines) + pad*2 + (len(lines)-1)*2
-
-            bubble = pygame.Surface((w, h), pygame.SRCALPHA)
-            # rounded rectangle background
-            pygame.draw.rect(bubble, (*n.bg, n.alpha), bubble.get_rect(), border_radius=self.corner)
-
-            # render and blit lines
-            y = pad
-            for line in lines:
-                ln_surf = self.font.render(line, True, n.color)
-                ln_surf.set_alpha(n.alpha)
-                bubble.blit(ln_surf, (pad, y))
-                y += line_height + 2
-
-            bubbles.append(bubble)
+            if n.surface is None:
+                n.surface = self._render_bubble(n)
+            n.surface.set_alpha(n.alpha)
+            bubbles.append(n.surface)
 
         # stack bubbles near anchor
         screen_w, screen_h = screen.get_size()
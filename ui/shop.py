@@ -2,36 +2,51 @@
 import pygame
 from typing import Tuple, Optional, List
 from classes.shop import Shop
+from ui.fonts import get_font, render_text
 
 class ShopUI:
     def __init__(self, font=None, width=520, height=360, margin=16):
         pygame.font.init()
-        self.font = font or pygame.font.Font(None, 22)
+        self.font = font or get_font(None, 22)
         self.width, self.height = width, height
         self.margin = margin
         self.surface = pygame.Surface((width, height))
         self.visible = False
         self.shop: Optional[Shop] = None
         self.item_rows: List[Tuple[pygame.Rect, pygame.Rect, pygame.Rect, str]] = []
-        # each row: (buy_rect, sell_rect, row_rect, item_id)
+        # each row: (buy_rect, sell_rect, row_rect, item_id) — only rows inside the viewport
         
         # Scrolling properties
         self.scroll_offset = 0
         self.row_height = 40
         self.row_spacing = 8
+        self.title_height = 30
         self.content_height = 0
         self.viewable_height = 0
 
+        # Render cache: the dialog is only redrawn when this key changes
+        self._built_key = None
+        self._rows_version = None
+        self._rows = []                     # shop items that get a row
+        self._overlay: Optional[pygame.Surface] = None
+        self._screen_rects = []             # (buy_screen_or_None, sell_screen_or_None, item_id)
+        self._screen_origin = None
+        self._sell_all_rect: Optional[pygame.Rect] = None          # dialog-local
+        self._sell_all_screen: Optional[pygame.Rect] = None
+
     def open(self, shop: Shop):
         self.shop = shop
         self.visible = True
         self.scroll_offset = 0
+        self._built_key = None
         self._rebuild()
 
     def close(self):
         self.visible = False
         self.shop = None
         self.item_rows.clear()
+        self._screen_rects = []
+        self._built_key = None
         self.scroll_offset = 0
 
     def toggle(self, shop: Shop):
@@ -52,85 +67,94 @@ class ShopUI:
         max_scroll = max(0, self.content_height - self.viewable_height)
         self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
 
+    def _needs_rebuild(self) -> bool:
+        return self._built_key != (id(self.shop), self.shop.version, self.scroll_offset)
+
     def _rebuild(self):
         assert self.shop
+        self._built_key = (id(self.shop), self.shop.version, self.scroll_offset)
+
         self.surface.fill((30,30,30))
-        title = self.font.render(f"{self.shop.display_name}", True, (255,255,255))
+        title = render_text(self.font, f"{self.shop.display_name}", (255,255,255))
         self.surface.blit(title, (self.margin, self.margin))
+
+        # "Sell all" button in the title bar (sells every stack this shop buys)
+        self._sell_all_rect = None
+        if any(it.sell_price > 0 for it in self.shop.items):
+            self._sell_all_rect = pygame.Rect(self.width - self.margin - 90, self.margin - 4, 90, self.title_height - 6)
+            pygame.draw.rect(self.surface, (120,60,0), self._sell_all_rect)
+            label = render_text(self.font, "Sell all", (255,255,255))
+            self.surface.blit(label, label.get_rect(center=self._sell_all_rect.center))
         
         # Calculate viewable area
-        title_height = 30
+        title_height = self.title_height
         self.viewable_height = self.height - self.margin * 2 - title_height
-        
-        # Count visible items and calculate content height
-        visible_items = [it for it in self.shop.items if it.buy_price > 0 or it.sell_price > 0]
-        self.content_height = len(visible_items) * (self.row_height + self.row_spacing)
-        
-        # Create a surface for scrollable content
-        content_surface = pygame.Surface((self.width - self.margin * 2, max(self.content_height, self.viewable_height)))
-        content_surface.fill((30,30,30))
-        
-        y = 0
+
+        # Rows to show only change with the shop itself
+        if self._rows_version != (id(self.shop), self.shop.version):
+            self._rows = [it for it in self.shop.items if it.buy_price > 0 or it.sell_price > 0]
+            self._rows_version = (id(self.shop), self.shop.version)
+
+        stride = self.row_height + self.row_spacing
+        self.content_height = len(self._rows) * stride
+        self.scroll_offset = max(0, min(self.scroll_offset, max(0, self.content_height - self.viewable_height)))
+
+        # Virtualized: draw only rows intersecting the viewport, straight onto the dialog
+        viewport = pygame.Rect(self.margin, self.margin + title_height, self.width - self.margin*2, self.viewable_height)
+        first = self.scroll_offset // stride
+        last = min(len(self._rows), (self.scroll_offset + self.viewable_height) // stride + 1)
+
         self.item_rows = []
-        
-        for it in self.shop.items:
-            if it.buy_price <= 0 and it.sell_price <= 0:
-                continue
-                
+        self.surface.set_clip(viewport)
+        for index in range(first, last):
+            it = self._rows[index]
+            y = index * stride - self.scroll_offset + viewport.top
+
             # row background
-            row_rect = pygame.Rect(0, y, self.width - self.margin*2, self.row_height)
-            pygame.draw.rect(content_surface, (45,45,45), row_rect)
+            row_rect = pygame.Rect(self.margin, y, viewport.width, self.row_height)
+            pygame.draw.rect(self.surface, (45,45,45), row_rect)
 
             # item text
-            name_s = self.font.render(f"{it.material.name}", True, (230,230,230))
-            content_surface.blit(name_s, (6, y + 8))
+            name_s = render_text(self.font, f"{it.material.name}", (230,230,230))
+            self.surface.blit(name_s, (row_rect.x + 6, y + 8))
 
             buy_rect = None
             sell_rect = None
 
             buy_w = 80
-            buy_rect_candidate = pygame.Rect(self.width - self.margin*2 - buy_w, y + 6, buy_w, self.row_height - 12)
+            buy_rect_candidate = pygame.Rect(row_rect.right - buy_w, y + 6, buy_w, self.row_height - 12)
 
             sell_w = 80
             sell_rect_candidate = pygame.Rect(buy_rect_candidate.x - 10 - sell_w, y + 6, sell_w, self.row_height - 12)
 
             if it.buy_price > 0:
                 buy_rect = buy_rect_candidate
-                pygame.draw.rect(content_surface, (0,120,0), buy_rect)
-                buy_label = self.font.render(f"Buy {it.buy_price}", True, (255,255,255))
-                content_surface.blit(buy_label, (buy_rect.x + 6, buy_rect.y + 8))
+                pygame.draw.rect(self.surface, (0,120,0), buy_rect)
+                buy_label = render_text(self.font, f"Buy {it.buy_price}", (255,255,255))
+                self.surface.blit(buy_label, (buy_rect.x + 6, buy_rect.y + 8))
 
             if it.sell_price > 0:
                 sell_rect = sell_rect_candidate
-                pygame.draw.rect(content_surface, (120,60,0), sell_rect)
-                sell_label = self.font.render(f"Sell {it.sell_price}", True, (255,255,255))
-                content_surface.blit(sell_label, (sell_rect.x + 6, sell_rect.y + 8))
-
-            # Adjust rects for scrolling
-            if buy_rect:
-                buy_rect = buy_rect.move(self.margin, self.margin + title_height - self.scroll_offset)
-            if sell_rect:
-                sell_rect = sell_rect.move(self.margin, self.margin + title_height - self.scroll_offset)
-            
-            row_rect = row_rect.move(self.margin, self.margin + title_height - self.scroll_offset)
-            
+                pygame.draw.rect(self.surface, (120,60,0), sell_rect)
+                sell_label = render_text(self.font, f"Sell {it.sell_price}", (255,255,255))
+                self.surface.blit(sell_label, (sell_rect.x + 6, sell_rect.y + 8))
+
             # store rects (may be None) and item id
             self.item_rows.append((buy_rect, sell_rect, row_rect, it.material.id))
-            y += self.row_height + self.row_spacing
+        self.surface.set_clip(None)
 
-        # Blit the scrollable content to main surface
-        content_rect = pygame.Rect(0, self.scroll_offset, self.width - self.margin*2, self.viewable_height)
-        self.surface.blit(content_surface, (self.margin, self.margin + title_height), content_rect)
-        
         # Draw scrollbar if needed
         if self.content_height > self.viewable_height:
             self._draw_scrollbar()
 
+        # hit-test rects must be re-projected to screen space
+        self._screen_origin = None
+
     def _draw_scrollbar(self):
         """Draw a scrollbar on the right side"""
         scrollbar_width = 8
         scrollbar_x = self.width - self.margin - scrollbar_width
-        scrollbar_y = self.margin + 30
+        scrollbar_y = self.margin + self.title_height
         scrollbar_height = self.viewable_height
         
         # Background
@@ -148,35 +172,43 @@ class ShopUI:
     def draw(self, screen: pygame.Surface):
         if not self.visible or not self.shop:
             return
-        # re-draw to reflect price/stock changes in case
-        self._rebuild()
+        # re-render only when the shop (items/prices/stock) or scroll position changed
+        if self._needs_rebuild():
+            self._rebuild()
         sw, sh = screen.get_size()
         rect = self.surface.get_rect(center=(sw//2, sh//2))
-        # dark background behind dialog
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0,0,0,120))
-        screen.blit(overlay, (0,0))
+        # dark background behind dialog (built once per screen size)
+        if self._overlay is None or self._overlay.get_size() != (sw, sh):
+            self._overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            self._overlay.fill((0,0,0,120))
+        screen.blit(self._overlay, (0,0))
         screen.blit(self.surface, rect.topleft)
 
         # map only non-None rects into screen coords for event handling
-        self._screen_rects = []  # list of tuples (buy_screen_or_None, sell_screen_or_None, item_id)
-        for buy_rect, sell_rect, row_rect, item_id in self.item_rows:
-            # Only include rects that are visible in the viewport
-            viewport_top = self.margin + 30
-            viewport_bottom = viewport_top + self.viewable_height
-            
-            if row_rect and row_rect.bottom >= viewport_top and row_rect.top <= viewport_bottom:
-                buy_screen = buy_rect.move(rect.left, rect.top) if buy_rect else None
-                sell_screen = sell_rect.move(rect.left, rect.top) if sell_rect else None
+        if self._screen_origin != rect.topleft:
+            self._screen_origin = rect.topleft
+            self._screen_rects = []
+            self._sell_all_screen = self._sell_all_rect.move(rect.left, rect.top) if self._sell_all_rect else None
+            # rows at the viewport edge are only clickable on their visible part
+            viewport = pygame.Rect(rect.left, rect.top + self.margin + self.title_height, rect.width, self.viewable_height)
+            for buy_rect, sell_rect, row_rect, item_id in self.item_rows:
+                buy_screen = buy_rect.move(rect.left, rect.top).clip(viewport) if buy_rect else None
+                sell_screen = sell_rect.move(rect.left, rect.top).clip(viewport) if sell_rect else None
                 self._screen_rects.append((buy_screen, sell_screen, item_id))
 
     def handle_click(self, pos: Tuple[int,int]) -> Optional[Tuple[str,str,int]]:
-        """Return (action, item_id, qty) where action in ('buy','sell'), qty default 1."""
+        """
+        Return (action, item_id, qty) where action in ('buy','sell','sell_all'), qty default 1.
+        Shift-click buys 10 / sells the whole stack; the title-bar button sells everything.
+        """
         if not self.visible or not self.shop:
             return None
+        if self._sell_all_screen and self._sell_all_screen.collidepoint(pos):
+            return ("sell_all", None, 0)
+        bulk = bool(pygame.key.get_mods() & pygame.KMOD_SHIFT)
         for buy_r, sell_r, item_id in self._screen_rects:
             if buy_r and buy_r.collidepoint(pos):
-                return ("buy", item_id, 1)
+                return ("buy", item_id, 10 if bulk else 1)
             if sell_r and sell_r.collidepoint(pos):
-                return ("sell", item_id, 1)
+                return ("sell_all", item_id, 0) if bulk else ("sell", item_id, 1)
         return None